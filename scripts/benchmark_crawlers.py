@@ -0,0 +1,213 @@
+"""
+크롤러 오프라인 벤치마크: 코퍼스 대역 서버(replay_server)로 사이트별 섹션 수집 경로 전체(목록 -> 본문 다운로드 -> 파싱)를
+네트워크 없이 실행하고, 섹션별 처리량(pages/sec), 종단 간 소요 시간, 크롤러별 기사 파싱 시간(ms/page)을 출력합니다.
+
+코퍼스를 지정하지 않으면 각 사이트 HTML 구조(크롤러 선택자)를 따르는 합성 코퍼스를 임시 디렉터리에 만들어 사용합니다.
+실제 페이지 코퍼스는 네트워크가 되는 환경에서 기록합니다: python3 src/services/replay_server.py record <코퍼스 디렉터리> [기준 일자]
+
+사용법: python3 scripts/benchmark_crawlers.py [--corpus DIR] [--articles N] [--latency 초] [--jitter 초]
+                                              [--error-rate 0~1] [--host-rate 초당 요청 수] [--parse-workers N]
+"""
+import os
+import sys
+import site
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import datetime as dt
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import fetch_engine
+from src.services import news_crawl
+from src.services import news_sites
+from src.services import rate_limiter
+from src.services import replay_server
+from src.services import news_crawler_zdnet
+from src.services import news_crawler_etnews
+from src.services import news_crawler_thelec
+
+# 크롤러별 기사 본문 파싱 함수 (파싱 파이프라인에 전달하는 함수와 같음)
+ARTICLE_PARSERS = {
+    'news_crawler_zdnet': news_crawler_zdnet.parse_article_content,
+    'news_crawler_etnews': news_crawler_etnews.parse_article_content,
+    'news_crawler_thelec': news_crawler_thelec.parse_article_html,
+}
+
+# 목록 페이지당 기사 수
+LIST_PAGE_SIZE = 20
+
+
+def _noise(blocks: int) -> str:
+    """메뉴, 스크립트, 광고, 푸터 등 크롤러가 사용하지 않는 영역"""
+    menu = ''.join(f'<li class="menu-item"><a href="/menu/{i}">메뉴 {i}</a></li>' for i in range(40))
+    ads = ''.join(f'<div class="ad_area"><iframe src="/ad/{i}"></iframe><span>광고 {i}</span></div>' for i in range(10))
+    script = '<script>' + 'var tracking = {"id": 1, "tags": ["a", "b"]};' * 50 + '</script>'
+    return (f'<header><nav><ul>{menu}</ul></nav></header>{script}' + ads * blocks +
+            '<footer>' + '<p>Copyright. All rights reserved.</p>' * 30 + '</footer>')
+
+
+def _page(body: str, head: str = '', blocks: int = 5) -> str:
+    return f'<html><head><title>news</title>{head}</head><body>{_noise(blocks)}{body}{_noise(blocks)}</body></html>'
+
+
+def _paragraphs(count: int) -> str:
+    return ''.join(f'<p>반도체 업계 동향 기사 본문 문단 {i}. 메모리 가격과 파운드리 수율에 대한 내용입니다.</p>' for i in range(count))
+
+
+def _zdnet_pages(section: news_sites.Section, items: list) -> tuple:
+    posts = []
+    articles = {}
+    for title, published, seq in items:
+        href = f'/view/?no={published:%Y%m%d%H%M}{seq % 60:02d}'
+        posts.append(f'<div class="newsPost"><a href="{href}"></a><div class="assetText"><h3>{title}</h3></div>'
+                     f'<p class="byline"><span>{published:%Y.%m.%d %p %I:%M}</span></p></div>')
+        articles['https://zdnet.co.kr' + href] = _page(
+            f'<div class="sub_view_cont"><div id="articleBody">{_paragraphs(30)}</div></div>')
+    return {section.url: _page(''.join(posts))}, articles
+
+
+def _etnews_pages(section: news_sites.Section, items: list) -> tuple:
+    lists = {}
+    articles = {}
+    for page_start in range(0, len(items), LIST_PAGE_SIZE):
+        entries = []
+        for title, published, seq in items[page_start:page_start + LIST_PAGE_SIZE]:
+            href = f'/{published:%Y%m%d}{seq:06d}'
+            entries.append(f'<li><a href="{href}"><img src="/thumb/{seq}.jpg"></a><div class="text">'
+                           f'<strong><a href="{href}">{title}</a></strong>'
+                           f'<span class="date">{published:%Y-%m-%d %H:%M}</span></div></li>')
+            articles['https://etnews.com' + href] = _page(f'<div class="article_body">{_paragraphs(30)}</div>')
+        lists[section.url + f'&page={page_start // LIST_PAGE_SIZE + 1}'] = _page(
+            '<ul class="news_list">' + ''.join(entries) + '</ul>')
+    return lists, articles
+
+
+def _thelec_pages(section: news_sites.Section, items: list) -> tuple:
+    lists = {}
+    articles = {}
+    for page_start in range(0, len(items), LIST_PAGE_SIZE):
+        rows = []
+        for title, published, seq in items[page_start:page_start + LIST_PAGE_SIZE]:
+            href = f'/news/articleView.html?idxno={seq}'
+            rows.append(f'<div class="table-row"><a href="{href}">{title}</a>'
+                        f'<small class="list-section">{section.name}</small>'
+                        f'<span class="by-time">{published:%Y-%m-%d %H:%M}</span></div>')
+            articles['https://www.thelec.kr' + href] = _page(
+                f'<div class="article-view-info"><span>{published:%Y.%m.%d %H:%M}</span></div>'
+                f'<div class="article-content">{_paragraphs(30)}</div>',
+                head=f'<meta property="article:section" content="{section.name}">')
+        lists[section.url + f'&page={page_start // LIST_PAGE_SIZE + 1}'] = _page(''.join(rows))
+    return lists, articles
+
+
+SYNTHETIC_PAGES = {
+    'news_crawler_zdnet': _zdnet_pages,
+    'news_crawler_etnews': _etnews_pages,
+    'news_crawler_thelec': _thelec_pages,
+}
+
+
+def build_synthetic_corpus(corpus_dir: str, base_ymd: str, articles_per_section: int) -> replay_server.ReplayCorpus:
+    """
+    배치 대상 섹션마다 수집 기간 안의 기사 articles_per_section 건과 기간 밖 기사 몇 건을
+    각 사이트 목록/기사 페이지 구조로 만들어 코퍼스로 저장합니다.
+    """
+    corpus = replay_server.ReplayCorpus(corpus_dir)
+    seq = 0
+    for adapter, section in news_sites.batch_targets():
+        start_date, end_date = news_crawl.target_date_range(adapter, base_ymd)
+        start_date, end_date = start_date.replace(tzinfo=None), end_date.replace(tzinfo=None)
+        step = (end_date - start_date) / (articles_per_section + 1)
+        items = []
+        # 최신순 목록: 기간 안 기사 다음에 기간 밖 기사를 두어 크롤러가 다음 페이지 요청을 멈추도록 합니다.
+        for i in range(articles_per_section + 3):
+            seq += 1
+            published = end_date - step * (i + 1) if i < articles_per_section else start_date - dt.timedelta(hours=i)
+            items.append((f'{adapter.name} {section.name_en} 기사 제목 {seq}', published.replace(second=0, microsecond=0), seq))
+
+        list_pages, article_pages = SYNTHETIC_PAGES[adapter.crawler](section, items)
+        for url, html in {**list_pages, **article_pages}.items():
+            corpus.add(url, html.encode('utf-8'))
+    corpus.save(base_ymd=base_ymd, synthetic=True)
+    return corpus
+
+
+def measure_parse_ms(crawler: str, corpus: replay_server.ReplayCorpus, article_urls: list) -> float:
+    """코퍼스의 기사 페이지를 현재 프로세스에서 순서대로 파싱하여 페이지당 평균 파싱 시간(ms)을 반환합니다."""
+    parse_func = ARTICLE_PARSERS[crawler]
+    pages = [(url, corpus.get(url)) for url in article_urls]
+    pages = [(url, page[2].decode('utf-8', errors='replace')) for url, page in pages if page is not None]
+    if not pages:
+        return 0.0
+    started = time.perf_counter()
+    for url, html in pages:
+        parse_func(html, url)
+    return (time.perf_counter() - started) / len(pages) * 1000
+
+
+def main(args):
+    # 크롤러 요청별 로그는 벤치마크 출력과 섞이지 않도록 줄입니다.
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if isinstance(logger, logging.Logger) and 'src' in name:
+            logger.setLevel(logging.WARNING)
+
+    temp_dir = None
+    if args.corpus:
+        corpus = replay_server.ReplayCorpus(args.corpus)
+    else:
+        temp_dir = tempfile.mkdtemp(prefix='replay_corpus_')
+        base_ymd = args.base_ymd or dt.datetime.now().strftime("%Y%m%d")
+        corpus = build_synthetic_corpus(temp_dir, base_ymd, args.articles)
+    base_ymd = corpus.meta.get('base_ymd') or args.base_ymd
+
+    print(f"corpus: {args.corpus or 'synthetic'} ({len(corpus)} pages), base_ymd: {base_ymd}, "
+          f"latency: {args.latency}s + jitter {args.jitter}s, error_rate: {args.error_rate}, host_rate: {args.host_rate}/s")
+    print(f"{'section':<24}{'articles':>9}{'pages':>7}{'pages/s':>9}{'list(s)':>9}{'content(s)':>12}{'total(s)':>10}")
+
+    article_urls = {}
+    try:
+        with replay_server.ReplayServer(corpus, latency=args.latency, jitter=args.jitter,
+                                        error_rate=args.error_rate, seed=args.seed) as server:
+            engine = fetch_engine.FetchEngine(session_pool=replay_server.ReplaySessionPool(server.url),
+                                              host_rate=args.host_rate)
+            with replay_server.installed_engine(engine, parse_workers=args.parse_workers) as pipeline:
+                for adapter, section in news_sites.batch_targets():
+                    requests_before = server.stats()['requests']
+                    result = replay_server.run_section(adapter, section, base_ymd)
+                    pages = server.stats()['requests'] - requests_before
+                    total = result['list_seconds'] + result['content_seconds']
+                    article_urls.setdefault(adapter.crawler, []).extend(result['article_urls'])
+                    print(f"{adapter.source(section):<24}{result['contents']:>4}/{result['articles']:<4}{pages:>7}"
+                          f"{pages / total if total else 0.0:>9.1f}{result['list_seconds']:>9.2f}"
+                          f"{result['content_seconds']:>12.2f}{total:>10.2f}")
+                pipeline_stats = pipeline.stats()
+            print(f"server: {server.stats()}")
+            print(f"pipeline: {pipeline_stats}")
+
+        print(f"{'crawler':<24}{'pages':>7}{'parse(ms/page)':>16}")
+        for crawler, urls in article_urls.items():
+            print(f"{crawler:<24}{len(urls):>7}{measure_parse_ms(crawler, corpus, urls):>16.2f}")
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크 (코퍼스 대역 서버 사용)")
+    parser.add_argument('--corpus', type=str, default=None, help="기록된 코퍼스 디렉터리, 미입력 시 합성 코퍼스 사용")
+    parser.add_argument('--base-ymd', type=str, default=None, help="합성 코퍼스 기준 일자 (yyyymmdd)")
+    parser.add_argument('--articles', type=int, default=20, help="합성 코퍼스 섹션별 수집 기간 내 기사 수")
+    parser.add_argument('--latency', type=float, default=0.05, help="대역 서버 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="대역 서버 추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="대역 서버 오류 응답 주입 확률 (0~1)")
+    parser.add_argument('--host-rate', type=float, default=rate_limiter.DEFAULT_HOST_RATE,
+                        help="호스트별 초기 초당 요청 수 (기본값은 운영 설정)")
+    parser.add_argument('--parse-workers', type=int, default=2, help="파서 프로세스 수 (0 이면 현재 프로세스에서 파싱)")
+    parser.add_argument('--seed', type=int, default=0, help="지연/오류 주입 난수 시드")
+    main(parser.parse_args())
@@ -0,0 +1,110 @@
+"""
+날짜 추출 마이크로 벤치마크: 기존 디일렉 날짜 추출(요소/하위 요소마다 re.search 반복 후 strptime)과
+date_extractor 의 미리 컴파일된 형식 표 방식의 요소당 처리 시간(datetime 변환 포함)을 비교합니다.
+
+사용법: python3 scripts/benchmark_date_extractor.py [반복 횟수]
+"""
+import os
+import re
+import sys
+import site
+import timeit
+import datetime as dt
+
+from bs4 import BeautifulSoup
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import date_extractor
+
+
+def legacy_parse_date(datetime_str: str) -> dt.datetime:
+    """기존 ThelecNewsCrawler._parse_date 구현 (추출한 날짜 문자열 변환)"""
+    if ':' in datetime_str:
+        return dt.datetime.strptime(datetime_str.strip(), "%Y-%m-%d %H:%M")
+    return dt.datetime.strptime(datetime_str.strip(), "%Y-%m-%d")
+
+
+def legacy_extract_date_from_element(element) -> str | None:
+    """기존 ThelecNewsCrawler._extract_date_from_element 구현"""
+    text = element.get_text(strip=True)
+    date_match = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', text)
+    if date_match:
+        return f"{date_match.group(1)} {date_match.group(2)}"
+
+    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', text)
+    if date_match:
+        return date_match.group(1)
+
+    possible_date_tags = element.find_all(['span', 'div', 'p', 'em', 'td'])
+    for tag in possible_date_tags:
+        tag_text = tag.get_text(strip=True)
+        date_match = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', tag_text)
+        if date_match:
+            return f"{date_match.group(1)} {date_match.group(2)}"
+        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', tag_text)
+        if date_match:
+            return date_match.group(1)
+
+    return None
+
+
+def legacy_article_page_date(text: str) -> str | None:
+    """기존 ThelecNewsCrawler._get_published_date_from_article_page 의 컨테이너별 정규식 검사"""
+    date_match = re.search(r'(?:승인\s*)?(\d{4}\.\d{2}\.\d{2})\s+(\d{2}:\d{2})', text)
+    if date_match:
+        return f"{date_match.group(1).replace('.', '-')} {date_match.group(2)}"
+    date_match_alt = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', text)
+    if date_match_alt:
+        return f"{date_match_alt.group(1)} {date_match_alt.group(2)}"
+    date_only_match = re.search(r'(?:승인\s*)?(\d{4}\.\d{2}\.\d{2})', text)
+    if date_only_match:
+        return date_only_match.group(1).replace('.', '-')
+    date_only_match_alt = re.search(r'(\d{4}-\d{2}-\d{2})', text)
+    if date_only_match_alt:
+        return date_only_match_alt.group(1)
+    return None
+
+
+# 날짜가 있는 목록 요소 / 날짜가 없는 목록 요소 (하위 요소 검사까지 진행되는 경우)
+ELEMENTS = {
+    'list_with_date': BeautifulSoup(
+        '<div class="list-block"><div class="list-titles"><a href="/news/articleView.html?idxno=1">기사 제목</a></div>'
+        '<div class="list-summary"><p>' + '본문 요약 ' * 20 + '</p></div>'
+        '<div class="list-dated"><small class="list-section">반도체</small><em>홍길동 기자</em>'
+        '<span>2025-06-28 10:00</span></div></div>', 'html.parser').div,
+    'list_without_date': BeautifulSoup(
+        '<div class="list-block"><div class="list-titles"><a href="/news/articleView.html?idxno=1">기사 제목</a></div>'
+        '<div class="list-summary"><p>' + '본문 요약 ' * 20 + '</p></div>'
+        '<div class="list-dated">' + '<span><em>반도체</em></span><p>홍길동 기자</p>' * 5 + '</div></div>',
+        'html.parser').div,
+}
+ARTICLE_INFO_TEXT = "기자명홍길동 기자입력 2025.06.27 09:00승인 2025.06.28 10:30댓글 0"
+
+
+def _legacy_element_datetime(element) -> dt.datetime | None:
+    date_text = legacy_extract_date_from_element(element)
+    return legacy_parse_date(date_text) if date_text else None
+
+
+def main(repeat: int = 10000):
+    print(f"repeat: {repeat}")
+    print(f"{'case':<20}{'before(us)':>12}{'after(us)':>12}{'speedup':>10}")
+    for name, element in ELEMENTS.items():
+        before = timeit.timeit(lambda: _legacy_element_datetime(element), number=repeat) / repeat * 1e6
+        after = timeit.timeit(lambda: date_extractor.THELEC_LIST_DATES.extract(element.get_text(strip=True)),
+                              number=repeat) / repeat * 1e6
+        print(f"{name:<20}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+    before = timeit.timeit(lambda: legacy_parse_date(legacy_article_page_date(ARTICLE_INFO_TEXT)),
+                           number=repeat) / repeat * 1e6
+    after = timeit.timeit(lambda: date_extractor.THELEC_ARTICLE_DATES.extract(ARTICLE_INFO_TEXT),
+                          number=repeat) / repeat * 1e6
+    print(f"{'article_info':<20}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,67 @@
+"""
+HTML 파싱 벤치마크: 기존 방식(html.parser 전체 트리)과 html_parser.parse_html(파서 백엔드 + 사이트별 파싱 범위)의
+페이지당 파싱 시간을 비교합니다. 실제 페이지와 비슷한 크기의 합성 HTML (메뉴/스크립트/광고 등 잡음 포함)을 사용합니다.
+
+사용법: python3 scripts/benchmark_html_parser.py [반복 횟수]
+"""
+import os
+import sys
+import site
+import timeit
+
+from bs4 import BeautifulSoup
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import html_parser
+
+
+def _noise(blocks: int) -> str:
+    """메뉴, 스크립트, 광고, 푸터 등 크롤러가 사용하지 않는 영역"""
+    menu = ''.join(f'<li class="menu-item"><a href="/menu/{i}">메뉴 {i}</a></li>' for i in range(40))
+    ads = ''.join(f'<div class="ad_area"><iframe src="/ad/{i}"></iframe><span>광고 {i}</span></div>' for i in range(10))
+    script = '<script>' + 'var tracking = {"id": 1, "tags": ["a", "b"]};' * 50 + '</script>'
+    return (f'<header><nav><ul>{menu}</ul></nav></header>{script}' + ads * blocks +
+            '<footer>' + '<p>Copyright 전자신문. All rights reserved.</p>' * 30 + '</footer>')
+
+
+def _page(body: str, blocks: int = 20) -> str:
+    return f'<html><head><title>news</title>{_noise(1)}</head><body>{_noise(blocks)}{body}{_noise(blocks)}</body></html>'
+
+
+def _paragraphs(count: int) -> str:
+    return ''.join(f'<p>반도체 업계 동향 기사 본문 문단 {i}. 메모리 가격과 파운드리 수율에 대한 내용입니다.</p>' for i in range(count))
+
+
+PAGES = {
+    'zdnet_list': (_page(''.join(
+        f'<div class="newsPost"><a href="/view/?no={i}"></a><div class="assetText"><h3>기사 {i}</h3></div>'
+        f'<p class="byline"><span>2025.06.28 AM 10:00</span></p></div>' for i in range(20))),
+        html_parser.ZDNET_LIST),
+    'zdnet_article': (_page(f'<div class="sub_view_cont"><div id="articleBody">{_paragraphs(30)}</div></div>'),
+                      html_parser.ZDNET_ARTICLE),
+    'etnews_list': (_page('<ul class="news_list">' + ''.join(
+        f'<li><strong><a href="/2025{i}">기사 {i}</a></strong><span class="date">2025-06-28 10:00</span></li>'
+        for i in range(20)) + '</ul>'), html_parser.ETNEWS_LIST),
+    'etnews_article': (_page(f'<div class="article_body">{_paragraphs(30)}</div>'), html_parser.ETNEWS_ARTICLE),
+    'thelec_list': (_page(''.join(
+        f'<div class="table-row"><a href="/news/articleView.html?idxno={i}">기사 제목 {i}</a>'
+        f'<small class="list-section">반도체</small><span class="by-time">2025-06-28 10:00</span></div>'
+        for i in range(20))), html_parser.THELEC_LIST),
+}
+
+
+def main(repeat: int = 20):
+    print(f"parser backend: {html_parser.DEFAULT_PARSER}, repeat: {repeat}")
+    print(f"{'page':<16}{'size(KB)':>10}{'baseline(ms)':>14}{'scoped(ms)':>12}{'speedup':>10}")
+    for name, (html, strainer) in PAGES.items():
+        baseline = timeit.timeit(lambda: BeautifulSoup(html, 'html.parser'), number=repeat) / repeat * 1000
+        scoped = timeit.timeit(lambda: html_parser.parse_html(html, parse_only=strainer), number=repeat) / repeat * 1000
+        print(f"{name:<16}{len(html.encode('utf-8')) / 1024:>10.1f}{baseline:>14.2f}{scoped:>12.2f}{baseline / scoped:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
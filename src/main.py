@@ -24,10 +24,10 @@ site.addsitedir(pjt_home_path)
 
 from src.services import gcs_upload_json
 from src.services import gcs_download_json
+from src.services import fetch_engine
+from src.services import parse_pipeline
 
-from src.services import news_crawler_thelec
-from src.services import news_crawler_zdnet
-from src.services import news_crawler_etnews
+from src.services import news_batch
 
 from src.services import news_summarizer
 from src.services import send_mail
@@ -167,7 +167,10 @@ async def execute_batch(backgroundtasks: BackgroundTasks, payload: BatchParams):
     
     try:
         if batch_type == 'news':
-            backgroundtasks.add_task(run_news_batch)
+            base_ymd = params.get('base_ymd', None)
+            # force: 기준 일자 체크포인트를 지우고 처음부터 다시 실행 (메일 재발송 등)
+            force = bool(params.get('force', False))
+            backgroundtasks.add_task(run_news_batch, base_ymd, force)
         elif batch_type == 'tweet':
             backgroundtasks.add_task(run_tweet_batch)
         elif batch_type == 'tweet_2nd':
@@ -193,30 +196,42 @@ async def execute_batch(backgroundtasks: BackgroundTasks, payload: BatchParams):
         raise HTTPException(status_code=503, detail=f"Batch job failed: {e}")
         
 
-def run_news_batch():
-    base_ymd = dt.datetime.now(kst_timezone).strftime("%Y%m%d")
-    
-    news_crawler_zdnet.main('반도체', base_ymd)
-    news_crawler_zdnet.main('자동차', base_ymd)
-    news_crawler_zdnet.main('배터리', base_ymd)
-    news_crawler_zdnet.main('컴퓨팅', base_ymd)
+def run_news_batch(base_ymd: str = None, force: bool = False):
+    """
+    뉴스 수집 -> 업로드 -> 요약 -> 메일 발송 배치
+    같은 기준 일자로 다시 실행하면 완료된 단계/섹션은 건너뛰고 남은 작업만 수행합니다.
+    :param bool force: 기준 일자 체크포인트를 지우고 처음부터 다시 실행 (메일 재발송 등)
+    """
+    if not base_ymd:
+        base_ymd = dt.datetime.now(kst_timezone).strftime("%Y%m%d")
     
-    news_crawler_thelec.main('반도체', base_ymd)
-    news_crawler_thelec.main('자동차', base_ymd)
-    news_crawler_thelec.main('배터리', base_ymd)
+    def crawl(journal):
+        # 등록된 모든 사이트 x 섹션을 공유 수집 엔진으로 동시에 수집합니다.
+        completed = news_batch.crawl_stage(base_ymd, journal)
+        
+        logger.info(f"http session pool stats => {fetch_engine.get_session_pool().stats()}")
+        logger.info(f"parse pipeline stats => {parse_pipeline.get_parse_pipeline().stats()}")
+        logger.info(f"host rate limit state => {fetch_engine.get_engine().rate_limit_state()}")
+        logger.info(f"host circuit state => {fetch_engine.get_engine().circuit_state()}")
+        http_response_cache = fetch_engine.get_engine().cache
+        logger.info(f"http response cache stats => {http_response_cache.stats()}")
+        http_response_cache.evict_expired()
+        return completed
     
-    news_crawler_etnews.main('전자', base_ymd)
-    news_crawler_etnews.main('SW', base_ymd)
-    news_crawler_etnews.main('IT', base_ymd)
+    def upload(journal):
+        gcs_upload_json.main('zdnet', base_ymd)
+        gcs_upload_json.main('thelec', base_ymd)
+        gcs_upload_json.main('etnews', base_ymd)
     
-    gcs_upload_json.main('zdnet', base_ymd)
-    gcs_upload_json.main('thelec', base_ymd)
-    gcs_upload_json.main('etnews', base_ymd)
+    def summarize(journal):
+        news_summarizer.main(base_ymd)
     
-    news_summarizer.main(base_ymd)
+    def mail(journal):
+        pwd = os.environ.get('NVR_MAIL_PWD')
+        send_mail.main(pwd)
     
-    pwd = os.environ.get('NVR_MAIL_PWD')
-    send_mail.main(pwd)
+    news_batch.run_news_batch(base_ymd, {'crawl': crawl, 'upload': upload, 'summarize': summarize, 'mail': mail},
+                              force=force)
     
 def run_tweet_batch():
     base_ymd = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d")  # 기본값은 현재 날짜 (UTC 기준)
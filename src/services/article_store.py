@@ -0,0 +1,135 @@
+import os
+import sys
+import json
+import glob
+import logging
+
+from typing import Iterator, Set
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 이 건수만큼 기록할 때마다 디스크에 동기화(fsync)
+DEFAULT_FSYNC_EVERY = 16
+
+PART_SUFFIX = '.part'
+
+
+def iter_jsonl(path: str) -> Iterator[dict]:
+    """JSON Lines 파일의 레코드를 순서대로 읽습니다. 기록 중 중단되어 잘린 마지막 줄은 건너뜁니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping truncated record in {path}")
+
+
+def _fsync_dir(path: str):
+    """rename 결과가 디스크에 남도록 디렉터리를 동기화합니다. (지원하지 않는 OS 는 무시)"""
+    try:
+        fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JsonlWriter:
+    """
+    기사를 한 건씩 JSON Lines 임시 파일(.part)에 이어 쓰는 저장기.
+    - 기록은 append 만 하며, fsync_every 건마다 디스크에 동기화합니다.
+    - commit() 시 임시 파일을 최종 경로로 원자적으로 교체(os.replace)하므로, 중간에 실패해도 이전 결과 파일이 깨지지 않습니다.
+    - 같은 run_key 로 다시 열면 임시 파일에 이미 기록된 레코드를 이어서 사용합니다. (중단된 실행 재개)
+      다른 run_key 의 임시 파일은 삭제합니다.
+    """
+
+    def __init__(self, path: str, run_key: str = '', key_field: str = 'url', fsync_every: int = DEFAULT_FSYNC_EVERY):
+        self.path = path
+        self.run_key = run_key
+        self.key_field = key_field
+        self.fsync_every = fsync_every
+        self.part_path = f'{path}.{run_key}{PART_SUFFIX}' if run_key else f'{path}{PART_SUFFIX}'
+
+        self.written = 0
+        self._file = None
+        self._unsynced = 0
+
+    def open(self) -> Set[str]:
+        """
+        임시 파일을 열고, 이전 실행에서 이미 기록된 레코드의 key_field 값 집합을 반환합니다.
+        잘린 마지막 줄은 잘라내고 이어서 기록합니다.
+        """
+        for stale_path in glob.glob(f'{glob.escape(self.path)}.*{PART_SUFFIX}') + glob.glob(f'{glob.escape(self.path)}{PART_SUFFIX}'):
+            if stale_path != self.part_path:
+                logger.info(f"Removing stale partial file {stale_path}")
+                os.remove(stale_path)
+
+        written_keys = set()
+        valid_size = 0
+        if os.path.exists(self.part_path):
+            with open(self.part_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    written_keys.add(record.get(self.key_field))
+                    valid_size += len(line)
+            os.truncate(self.part_path, valid_size)
+            logger.info(f"Resuming {self.part_path} with {len(written_keys)} records")
+
+        self._file = open(self.part_path, 'a', encoding='utf-8')
+        self.written = len(written_keys)
+        return written_keys
+
+    def write(self, record: dict):
+        """레코드 1건을 기록합니다."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.written += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """버퍼를 비우고 디스크에 동기화합니다."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def commit(self):
+        """기록을 마치고 임시 파일을 최종 경로로 원자적으로 교체합니다."""
+        self.sync()
+        self._file.close()
+        self._file = None
+        os.replace(self.part_path, self.path)
+        _fsync_dir(self.path)
+
+    def close(self):
+        """임시 파일을 닫습니다. (commit 하지 않은 기록은 다음 실행에서 재개)"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'JsonlWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None and self._file is not None:
+            self.commit()
+        else:
+            self.close()
@@ -0,0 +1,81 @@
+import time
+
+import requests
+
+# 연속 실패 허용 횟수 / 차단 후 재시도까지 대기 시간(초)
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+
+# 차단기 상태
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """호스트 차단기가 열려 있어 요청을 보내지 않았음을 나타내는 예외"""
+
+
+class CircuitBreaker:
+    """
+    호스트 하나에 대한 차단기. (이벤트 루프 스레드에서만 사용)
+    - 연속 실패가 failure_threshold 에 도달하면 열림(open) 상태가 되어 reset_timeout 동안 요청을 보내지 않습니다.
+    - reset_timeout 이 지나면 반열림(half_open) 상태에서 요청 1건을 시험적으로 보내고,
+      성공하면 닫힘(closed), 실패하면 다시 열림 상태가 됩니다.
+    """
+
+    def __init__(self,
+                 host: str,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 여부를 반환합니다."""
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = STATE_HALF_OPEN
+        if self.state == STATE_HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def check(self):
+        """요청을 보낼 수 없으면 CircuitOpenError 를 발생시킵니다."""
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self.host} (consecutive failures: {self.consecutive_failures})")
+
+    def release_trial(self):
+        """
+        시험 요청이 성공/실패 결과 없이 끝난 경우(취소, 타임아웃 등) 시험 요청 표시를 해제합니다.
+        반열림 상태는 유지하여 다음 요청이 다시 시험 요청이 됩니다.
+        """
+        self._trial_in_flight = False
+
+    def record_success(self):
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.opened += 1
+            self.state = STATE_OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        """차단기 상태, 연속 실패 수, 열린 횟수를 반환합니다."""
+        return {'state': self.state, 'consecutive_failures': self.consecutive_failures, 'opened': self.opened}
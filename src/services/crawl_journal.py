@@ -0,0 +1,102 @@
+import os
+import sys
+import site
+import json
+import glob
+import time
+import logging
+import threading
+import datetime as dt
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import article_store
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 체크포인트 파일 기본 디렉터리 / 보관 일수
+DEFAULT_JOURNAL_DIR = os.path.join(pjt_home_path, 'data')
+DEFAULT_RETENTION_DAYS = 7
+
+# 체크포인트 단위
+UNIT_LIST = 'list'          # 섹션 목록 수집 완료 (목록 기사 포함)
+UNIT_SECTION = 'section'    # 섹션 본문 수집/저장 완료
+UNIT_STAGE = 'stage'        # 배치 단계 완료 (crawl, upload, summarize, mail)
+
+
+class CrawlJournal:
+    """
+    기준 일자(base_ymd)별 뉴스 배치 체크포인트 기록.
+    완료한 단위를 append-only JSON Lines 파일에 즉시 기록(fsync)하고, 같은 기준 일자로 다시 실행하면
+    완료된 단위를 건너뛰어 남은 작업만 수행합니다.
+    - list: 섹션 목록 수집 결과 (재실행 시 목록 페이지를 다시 요청하지 않음)
+    - section: 섹션 본문 수집/저장 완료 (기사 단위 재개는 article_store 임시 파일이 담당)
+    - stage: 배치 단계 완료
+    목록 페이지 단위는 기록하지 않습니다. 섹션 목록(최대 수 페이지)은 다시 받아도 짧게 끝나므로 섹션 단위(list)로 기록하고,
+    오래 걸리는 기사 본문 수집은 article_store 임시 파일(.part)로 기사 단위까지 재개합니다.
+    체크포인트 파일은 data 디렉터리에 있으며 이미지에 포함되지 않습니다. (.dockerignore)
+    """
+
+    def __init__(self, base_ymd: str, journal_dir: str = DEFAULT_JOURNAL_DIR,
+                 retention_days: int = DEFAULT_RETENTION_DAYS):
+        self.base_ymd = base_ymd
+        self.path = os.path.join(journal_dir, f'crawl_journal_{base_ymd}.jsonl')
+        self._records = {}
+        self._lock = threading.Lock()
+
+        self._remove_expired(journal_dir, retention_days)
+        if os.path.exists(self.path):
+            for record in article_store.iter_jsonl(self.path):
+                self._records[(record['unit'], record['key'])] = record
+            logger.info(f"Resuming news batch {base_ymd} from checkpoint journal: {self.stats()}")
+
+    def _remove_expired(self, journal_dir: str, retention_days: int):
+        """보관 기간이 지난 기준 일자의 체크포인트 파일을 삭제합니다."""
+        cutoff = (dt.datetime.strptime(self.base_ymd, "%Y%m%d") - dt.timedelta(days=retention_days)).strftime("%Y%m%d")
+        for path in glob.glob(os.path.join(journal_dir, 'crawl_journal_*.jsonl')):
+            journal_ymd = os.path.basename(path)[len('crawl_journal_'):-len('.jsonl')]
+            if journal_ymd < cutoff:
+                os.remove(path)
+
+    def get(self, unit: str, key: str) -> dict | None:
+        """완료된 단위의 기록을 반환합니다. 완료되지 않았으면 None."""
+        with self._lock:
+            return self._records.get((unit, key))
+
+    def is_done(self, unit: str, key: str) -> bool:
+        return self.get(unit, key) is not None
+
+    def mark(self, unit: str, key: str, **data):
+        """단위 완료를 기록합니다. 기록은 즉시 디스크에 동기화됩니다."""
+        record = {'unit': unit, 'key': key, 'at': time.time(), **data}
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._records[(unit, key)] = record
+
+    def reset(self):
+        """기준 일자의 체크포인트를 모두 지웁니다. (처음부터 다시 실행)"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._records.clear()
+        logger.info(f"Checkpoint journal reset for news batch {self.base_ymd}")
+
+    def stats(self) -> dict:
+        """단위별 완료 건수를 반환합니다."""
+        with self._lock:
+            counts = {}
+            for unit, _ in self._records:
+                counts[unit] = counts.get(unit, 0) + 1
+            return counts
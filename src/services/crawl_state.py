@@ -0,0 +1,273 @@
+import os
+import re
+import sys
+import logging
+import sqlite3
+import threading
+import hashlib
+import time
+import unicodedata
+import datetime as dt
+
+from typing import List, Dict, Set
+from dataclasses import dataclass
+
+import pytz
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+kst_timezone = pytz.timezone('Asia/Seoul')
+
+# 수집 상태 파일 기본 경로 / 보관 일수
+DEFAULT_STATE_PATH = os.path.join(pjt_home_path, 'data', 'crawl_state.sqlite3')
+DEFAULT_RETENTION_DAYS = 14
+# compact() 는 빈 페이지가 DB 파일의 이 비율 이상일 때만 VACUUM 합니다. (VACUUM 은 파일 전체를 다시 쓰므로 매 실행 수행하지 않음)
+VACUUM_FREE_RATIO = 0.25
+
+# 이미 수집한 기사 본문을 다시 받아 변경 여부를 확인하는 주기 (기사 페이지 응답 캐시 유효 시간과 같음)
+DEFAULT_RECHECK_SECONDS = 12 * 60 * 60
+
+# 본문 해시 방식 버전 (PRAGMA user_version). 방식이 바뀌면 저장된 본문으로 해시를 다시 계산합니다.
+CONTENT_HASH_VERSION = 1
+
+# 요약 상태
+SUMMARY_PENDING = 'pending'
+SUMMARY_DONE = 'done'
+SUMMARY_FAILED = 'failed'
+
+# SQLite IN 절 변수 개수 제한을 고려한 조회 단위
+_LOOKUP_CHUNK_SIZE = 500
+
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_content(content: str) -> str:
+    """본문 비교용 정규화: 유니코드 호환 정규화(NFKC) 후 연속 공백/줄바꿈을 공백 하나로 합칩니다."""
+    return _WHITESPACE_PATTERN.sub(' ', unicodedata.normalize('NFKC', content or '')).strip()
+
+
+def content_hash(content: str) -> str:
+    """
+    기사 본문의 해시값(sha1)을 반환합니다.
+    정규화한 본문으로 계산하므로 공백/줄바꿈이나 유니코드 표기만 다른 본문은 같은 해시가 됩니다.
+    """
+    return hashlib.sha1(normalize_content(content).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class SeenArticle:
+    """이전 실행에서 수집된 기사 정보"""
+    url: str
+    source: str
+    title: str
+    published_date: str
+    content: str
+    content_hash: str
+    first_seen_date: str
+    summary_status: str
+    summary: str | None
+    checked_at: float | None = None
+
+
+class SeenUrlIndex:
+    """
+    실행 간에 유지되는 수집 기사 URL 인덱스 (URL -> 최초 수집일, 본문 해시, 요약 상태).
+    - 크롤러는 이미 수집한 기사의 본문을 다시 요청하지 않고 인덱스에 저장된 본문을 사용합니다.
+      다만 본문을 확인한 지 확인 주기가 지난 기사는 다시 받아 정규화한 본문 해시로 변경 여부를 확인합니다.
+    - 요약기는 본문이 바뀌지 않은 기사의 요약을 다시 생성하지 않고 저장된 요약을 사용합니다.
+      본문이 바뀐 기사는 요약 상태가 pending 으로 돌아가 다시 요약됩니다.
+    - 마지막으로 확인된 지 보관 일수가 지난 항목은 compact() 로 정리합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_STATE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """(최초 사용 시) 상태 DB 를 열고 테이블을 생성합니다. self._lock 안에서 호출합니다."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    url TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    title TEXT,
+                    published_date TEXT,
+                    content TEXT,
+                    content_hash TEXT,
+                    first_seen_date TEXT NOT NULL,
+                    last_seen_at REAL NOT NULL,
+                    summary_status TEXT NOT NULL,
+                    summary TEXT,
+                    checked_at REAL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_urls_last_seen_at ON seen_urls (last_seen_at)")
+            self._migrate(self._conn)
+            self._conn.commit()
+        return self._conn
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """이전 버전으로 만든 상태 DB 에 본문 확인 시각 컬럼을 추가하고, 본문 해시를 현재 방식으로 다시 계산합니다."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(seen_urls)")}
+        if 'checked_at' not in columns:
+            conn.execute("ALTER TABLE seen_urls ADD COLUMN checked_at REAL")
+            conn.execute("UPDATE seen_urls SET checked_at = last_seen_at")
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] < CONTENT_HASH_VERSION:
+            rows = conn.execute("SELECT url, content FROM seen_urls").fetchall()
+            conn.executemany("UPDATE seen_urls SET content_hash = ? WHERE url = ?",
+                             [(content_hash(content), url) for url, content in rows])
+            conn.execute(f"PRAGMA user_version = {CONTENT_HASH_VERSION}")
+            if rows:
+                logger.info(f"crawl state migrated: {len(rows)} content hashes recomputed")
+
+    def lookup(self, url: str) -> SeenArticle | None:
+        """URL 에 해당하는 수집 기사 정보를 반환합니다."""
+        return self.lookup_many([url]).get(url)
+
+    def lookup_many(self, urls: List[str]) -> Dict[str, SeenArticle]:
+        """여러 URL 의 수집 기사 정보를 한 번에 조회합니다. 인덱스에 없는 URL 은 결과에서 제외됩니다."""
+        found = {}
+        urls = list(dict.fromkeys(urls))
+        with self._lock:
+            conn = self._connect()
+            for i in range(0, len(urls), _LOOKUP_CHUNK_SIZE):
+                chunk = urls[i:i + _LOOKUP_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, source, title, published_date, content, content_hash, first_seen_date, "
+                    f"summary_status, summary, checked_at FROM seen_urls WHERE url IN ({placeholders})", chunk).fetchall()
+                for row in rows:
+                    found[row[0]] = SeenArticle(*row)
+        return found
+
+    def fill_known_articles(self, articles: List[Dict[str, str]]) -> int:
+        """
+        이미 수집된 기사의 본문을 인덱스에서 채웁니다. 본문이 채워진 기사는 본문 요청을 생략할 수 있습니다.
+        :param list articles: 크롤러 fetch_articles 결과 (title, url, published_date, content)
+        :return: 인덱스에서 본문을 채운 기사 수
+        """
+        known = self.lookup_many([article['url'] for article in articles])
+        filled = 0
+        for article in articles:
+            seen = known.get(article['url'])
+            if seen is not None and seen.content:
+                article['content'] = seen.content
+                filled += 1
+        logger.info(f"{filled}/{len(articles)} articles already collected in previous runs")
+        return filled
+
+    def due_for_recheck(self, urls: List[str], recheck_seconds: float = DEFAULT_RECHECK_SECONDS) -> Set[str]:
+        """인덱스에 있는 URL 중 본문을 확인한 지 recheck_seconds 가 지나 다시 받아야 하는 URL 집합을 반환합니다."""
+        checked_before = time.time() - recheck_seconds
+        return {url for url, seen in self.lookup_many(urls).items()
+                if seen.checked_at is None or seen.checked_at < checked_before}
+
+    def record_articles(self, source: str, articles: List[Dict[str, str]], checked_urls: Set[str] = None) -> Dict[str, int]:
+        """
+        수집한 기사를 인덱스에 기록합니다. 이미 있는 기사는 마지막 확인 시각만 갱신하고,
+        본문(정규화한 본문 해시)이 바뀐 경우에는 본문/해시를 갱신하고 요약 상태를 pending 으로 되돌립니다.
+        :param set checked_urls: 이번 실행에서 본문을 다시 받은 URL (본문 확인 시각 갱신 대상), 미입력 시 모든 기사
+        :return: {'new': 새 기사 수, 'changed': 본문이 바뀐 기사 수, 'unchanged': 본문이 같은 기사 수}
+        """
+        now = time.time()
+        today = dt.datetime.now(kst_timezone).strftime('%Y-%m-%d')
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        with self._lock:
+            conn = self._connect()
+            for article in articles:
+                content = article.get('content', '')
+                new_hash = content_hash(content)
+                checked = checked_urls is None or article['url'] in checked_urls
+                row = conn.execute("SELECT content_hash FROM seen_urls WHERE url = ?", (article['url'],)).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO seen_urls (url, source, title, published_date, content, content_hash, "
+                        "first_seen_date, last_seen_at, summary_status, summary, checked_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)",
+                        (article['url'], source, article.get('title'), article.get('published_date'),
+                         content, new_hash, today, now, SUMMARY_PENDING, now))
+                    counts['new'] += 1
+                elif row[0] != new_hash:
+                    conn.execute(
+                        "UPDATE seen_urls SET title = ?, content = ?, content_hash = ?, last_seen_at = ?, "
+                        "summary_status = ?, summary = NULL, checked_at = ? WHERE url = ?",
+                        (article.get('title'), content, new_hash, now, SUMMARY_PENDING, now, article['url']))
+                    counts['changed'] += 1
+                    logger.info(f"Article content changed, summary will be refreshed: {article['url']}")
+                elif checked:
+                    conn.execute("UPDATE seen_urls SET last_seen_at = ?, checked_at = ? WHERE url = ?",
+                                 (now, now, article['url']))
+                    counts['unchanged'] += 1
+                else:
+                    conn.execute("UPDATE seen_urls SET last_seen_at = ? WHERE url = ?", (now, article['url']))
+                    counts['unchanged'] += 1
+            conn.commit()
+        return counts
+
+    def record_summary(self, url: str, summary: str, status: str = SUMMARY_DONE):
+        """기사의 요약 결과와 상태를 기록합니다."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE seen_urls SET summary = ?, summary_status = ? WHERE url = ?",
+                         (summary, status, url))
+            conn.commit()
+
+    def compact(self, retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
+        """
+        마지막으로 확인된 지 retention_days 가 지난 항목을 삭제하고 삭제된 항목 수를 반환합니다.
+        삭제한 항목이 있고 빈 페이지 비율이 VACUUM_FREE_RATIO 이상일 때만 VACUUM 으로 파일 크기를 줄입니다.
+        (빈 페이지는 이후 저장에 재사용되므로 대부분의 실행에서는 VACUUM 하지 않습니다)
+        """
+        expire_before = time.time() - retention_days * 24 * 60 * 60
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute("DELETE FROM seen_urls WHERE last_seen_at < ?", (expire_before,))
+            conn.commit()
+            vacuumed = cursor.rowcount > 0 and self._vacuum_if_fragmented(conn)
+        logger.info(f"crawl state compacted: {cursor.rowcount} entries older than {retention_days} days removed"
+                    f"{' (vacuumed)' if vacuumed else ''}")
+        return cursor.rowcount
+
+    def _vacuum_if_fragmented(self, conn: sqlite3.Connection) -> bool:
+        """빈 페이지 비율이 VACUUM_FREE_RATIO 이상이면 VACUUM 하고 True 를 반환합니다. self._lock 안에서 호출합니다."""
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if not page_count or freelist_count / page_count < VACUUM_FREE_RATIO:
+            return False
+        conn.execute("VACUUM")
+        return True
+
+    def close(self):
+        """상태 DB 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_seen_url_index = None
+_seen_url_index_lock = threading.Lock()
+
+
+def get_seen_url_index() -> SeenUrlIndex:
+    """프로세스 전역에서 공유하는 SeenUrlIndex 인스턴스를 반환합니다."""
+    global _seen_url_index
+    with _seen_url_index_lock:
+        if _seen_url_index is None:
+            _seen_url_index = SeenUrlIndex()
+    return _seen_url_index
@@ -0,0 +1,73 @@
+import re
+import datetime as dt
+
+from typing import List, Tuple
+
+# 날짜 형식 (정규식, strptime 형식). 정규식은 숫자로 시작해야 하며 캡처 그룹을 사용하지 않습니다.
+DASH_DATETIME = (r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', '%Y-%m-%d %H:%M')           # 2025-05-29 08:52
+DASH_DATE = (r'\d{4}-\d{2}-\d{2}', '%Y-%m-%d')                                   # 2025-05-29
+DOT_DATETIME = (r'\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}', '%Y.%m.%d %H:%M')         # 2025.06.28 10:30
+DOT_DATE = (r'\d{4}\.\d{2}\.\d{2}', '%Y.%m.%d')                                  # 2025.06.28
+DOT_AMPM_DATETIME = (r'\d{4}\.\d{2}\.\d{2}\s+[AP]M\s+\d{1,2}:\d{2}', '%Y.%m.%d %p %I:%M')  # 2025.05.23 AM 11:22
+LINK_TIMESTAMP = (r'(?<=no=)\d{14}', '%Y%m%d%H%M%S')                              # ?no=20250628100000
+
+_DIGITS_PATTERN = re.compile(r'\d+')
+_NUMERIC_DIRECTIVES = ['%Y', '%m', '%d', '%H', '%M', '%S']
+
+
+def _is_numeric_format(fmt: str) -> bool:
+    """
+    구분자로 나뉜 %Y %m %d [%H %M [%S]] 순서의 형식인지 여부.
+    이런 형식은 strptime 대신 숫자 묶음을 바로 datetime 으로 변환합니다.
+    """
+    directives = re.findall(r'%\w', fmt)
+    separators = re.split(r'%\w', fmt)[1:-1]
+    return (len(directives) >= 3 and directives == _NUMERIC_DIRECTIVES[:len(directives)]
+            and all(separators) and not any(char.isdigit() for char in ''.join(separators)))
+
+
+class DateExtractor:
+    """
+    우선순위가 있는 날짜 형식 표로 텍스트에서 날짜를 추출합니다.
+    모든 형식을 하나의 정규식(alternation)으로 미리 컴파일해 텍스트를 한 번만 훑으며,
+    가장 우선순위가 높은 형식이 나오면 바로 종료합니다.
+    """
+
+    def __init__(self, formats: List[Tuple[str, str]]):
+        """
+        :param list formats: (정규식, strptime 형식) 목록, 앞에 있을수록 우선순위가 높음
+        """
+        self.formats = formats
+        # 숫자 위치에서만 각 형식을 시도하도록 전방 탐색을 앞에 둡니다.
+        self._pattern = re.compile('(?=\\d)(?:' + '|'.join(f'(?P<f{i}>{regex})' for i, (regex, _) in enumerate(formats)) + ')')
+        self._numeric = [_is_numeric_format(fmt) for _, fmt in formats]
+
+    def extract(self, text: str) -> dt.datetime | None:
+        """
+        텍스트에서 우선순위가 가장 높은 형식의 날짜를 찾아 반환합니다. 같은 형식이면 먼저 나온 날짜를 사용합니다.
+        날짜가 없거나 유효하지 않으면 None 을 반환합니다.
+        """
+        best_index, best_datetime = len(self.formats), None
+        for match in self._pattern.finditer(text or ''):
+            index = int(match.lastgroup[1:])
+            if index >= best_index:
+                continue
+            try:
+                if self._numeric[index]:
+                    best_datetime = dt.datetime(*map(int, _DIGITS_PATTERN.findall(match.group())))
+                else:
+                    best_datetime = dt.datetime.strptime(' '.join(match.group().split()), self.formats[index][1])
+            except ValueError:
+                continue
+            best_index = index
+            if best_index == 0:
+                break
+        return best_datetime
+
+
+# 크롤러별 날짜 추출기
+ZDNET_LIST_DATES = DateExtractor([DOT_AMPM_DATETIME])
+ZDNET_LINK_DATES = DateExtractor([LINK_TIMESTAMP])
+ETNEWS_LIST_DATES = DateExtractor([DASH_DATETIME])
+THELEC_LIST_DATES = DateExtractor([DASH_DATETIME, DASH_DATE])
+THELEC_ARTICLE_DATES = DateExtractor([DOT_DATETIME, DASH_DATETIME, DOT_DATE, DASH_DATE])
@@ -0,0 +1,444 @@
+import os
+import sys
+import site
+import time
+import random
+import logging
+import asyncio
+import threading
+import functools
+import collections
+
+from typing import List, Dict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import http_cache
+from src.services import rate_limiter
+from src.services import circuit_breaker
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 전체 동시 요청 수 / 호스트별 최대 동시 요청 수 / 요청 타임아웃(초) 기본값
+# (호스트별 동시 요청 수는 응답 상태에 따라 1 ~ 최대값 사이에서 자동 조정됩니다.)
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PER_HOST_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 10
+
+# 재시도 횟수 / 재시도 대기 시간(초) 기본값 (지수 증가, 0 ~ 상한 사이 무작위 지터)
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 기사 본문 페이지 캐시 유효 시간(초). 이 시간 안에는 네트워크 요청 없이 캐시를 사용하고,
+# 이후에는 조건부 요청(304)으로 재검증합니다. 목록 페이지는 항상 재검증합니다.
+ARTICLE_CACHE_TTL = 12 * 60 * 60
+
+
+# 요청 실패 사유
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_CONNECTION = 'connection'
+FAILURE_CIRCUIT_OPEN = 'circuit_open'
+FAILURE_HTTP = 'http_error'
+FAILURE_CONTENT_NOT_FOUND = 'content_not_found'
+FAILURE_ERROR = 'error'
+
+
+def is_retryable(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 요청 오류인지 여부 (타임아웃, 연결 오류, 429/5xx)"""
+    if isinstance(error, circuit_breaker.CircuitOpenError):
+        return False
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+@dataclass
+class FetchFailure:
+    """재시도 후에도 기사 본문을 얻지 못한 결과. 크롤러는 이 기사를 저장/요약 대상에서 제외합니다."""
+    url: str
+    reason: str
+    message: str
+
+    @classmethod
+    def from_error(cls, url: str, error: Exception) -> 'FetchFailure':
+        """요청/파싱 예외를 실패 사유로 분류합니다."""
+        if isinstance(error, circuit_breaker.CircuitOpenError):
+            reason = FAILURE_CIRCUIT_OPEN
+        elif isinstance(error, requests.exceptions.Timeout):
+            reason = FAILURE_TIMEOUT
+        elif isinstance(error, requests.exceptions.ConnectionError):
+            reason = FAILURE_CONNECTION
+        elif isinstance(error, requests.exceptions.HTTPError):
+            reason = FAILURE_HTTP
+        else:
+            reason = FAILURE_ERROR
+        return cls(url, reason, repr(error))
+
+
+def as_fetch_result(url: str, result, failure_prefixes: tuple = ()) -> 'str | FetchFailure':
+    """
+    본문 수집 결과(본문 문자열 또는 예외)를 본문 문자열 또는 FetchFailure 로 변환합니다.
+    :param str url: 기사 URL
+    :param result: 파싱 파이프라인 결과
+    :param tuple failure_prefixes: 파서가 본문을 찾지 못했을 때 반환하는 문구
+    """
+    if isinstance(result, Exception):
+        failure = FetchFailure.from_error(url, result)
+    elif result.startswith(failure_prefixes):
+        failure = FetchFailure(url, FAILURE_CONTENT_NOT_FOUND, result)
+    else:
+        return result
+    logger.warning(f"Failed to fetch content for {url} ({failure.reason}): {failure.message}")
+    return failure
+
+
+def exclude_failed_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    본문 수집에 실패한(content 가 FetchFailure 인) 기사를 제외합니다.
+    제외된 기사는 수집 상태 인덱스에도 기록되지 않으므로 다음 실행에서 다시 수집합니다.
+    """
+    failed = [article for article in articles if isinstance(article['content'], FetchFailure)]
+    if failed:
+        reasons = collections.Counter(article['content'].reason for article in failed)
+        logger.warning(f"Excluding {len(failed)} articles without content: {dict(reasons)}")
+    return [article for article in articles if not isinstance(article['content'], FetchFailure)]
+
+
+class SessionPool:
+    """
+    호스트별 requests.Session 을 프로세스 전역에서 공유하는 풀.
+    - 같은 호스트에 대한 요청은 크롤러 인스턴스/섹션 실행과 무관하게 같은 세션(keep-alive 커넥션)을 재사용합니다.
+    - 세션 재사용(hit)/신규 생성(miss) 횟수와 호스트별 커넥션 재사용 통계를 제공합니다.
+    """
+
+    def __init__(self, pool_maxsize: int = DEFAULT_MAX_CONCURRENCY):
+        self.pool_maxsize = pool_maxsize
+        self.hits = 0
+        self.misses = 0
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, host: str) -> requests.Session:
+        """호스트에 해당하는 세션을 반환합니다. 없으면 새로 생성합니다."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is not None:
+                self.hits += 1
+                return session
+
+            self.misses += 1
+            session = requests.Session()
+            adapter = self._create_adapter()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._sessions[host] = session
+            logger.info(f"New HTTP session created for host: {host}")
+            return session
+
+    def _create_adapter(self) -> HTTPAdapter:
+        """세션에 연결할 전송 어댑터를 생성합니다. (오프라인 재생 등에서 전송 방식을 바꿀 때 재정의)"""
+        return HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        호스트별 커넥션 통계를 반환합니다.
+        :return: {host: {'requests': 요청 수, 'new_connections': 신규 커넥션 수, 'reused_connections': 재사용 횟수}}
+        """
+        stats = {}
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        for host, session in sessions.items():
+            num_requests = 0
+            num_connections = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    num_requests += pool.num_requests
+                    num_connections += pool.num_connections
+            stats[host] = {
+                'requests': num_requests,
+                'new_connections': num_connections,
+                'reused_connections': max(num_requests - num_connections, 0),
+            }
+        return stats
+
+    def stats(self) -> dict:
+        """세션 hit/miss 횟수와 호스트별 커넥션 통계를 반환합니다."""
+        return {
+            'session_hits': self.hits,
+            'session_misses': self.misses,
+            'connections': self.connection_stats(),
+        }
+
+    def close(self):
+        """풀에 있는 모든 세션을 닫습니다."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class FetchEngine:
+    """
+    뉴스 크롤러들이 공유하는 asyncio 기반 HTTP 수집 엔진.
+    - 전용 이벤트 루프 스레드에서 요청을 스케줄링하고, 실제 I/O 는 스레드 풀에서 requests 로 수행합니다.
+    - 전체 동시 요청 수는 세마포어로 제한하고, 호스트별 요청은 적응형 제한기(HostRateLimiter)로
+      초당 요청 수와 동시 요청 수를 응답 상태(429/5xx/지연)에 맞춰 조절하여 각 사이트에 과도한 부하를 주지 않습니다.
+    - 호스트별 세션 풀(SessionPool)을 공유하여 keep-alive 커넥션을 재사용합니다.
+    - 일시적인 오류는 지수 백오프로 재시도하고, 계속 실패하는 호스트는 차단기(CircuitBreaker)로 잠시 요청을 멈춥니다.
+    - 응답 캐시(HttpResponseCache)가 주어지면 ETag / Last-Modified 기반 조건부 요청으로 재다운로드를 줄입니다.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 session_pool: SessionPool = None,
+                 cache: http_cache.HttpResponseCache = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 retry_base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+                 host_rate: float = rate_limiter.DEFAULT_HOST_RATE):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.timeout = timeout
+        self.session_pool = session_pool or SessionPool(pool_maxsize=per_host_concurrency)
+        self.cache = cache
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.host_rate = host_rate
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='fetch_engine')
+        self._lock = threading.Lock()
+        self._loop = None
+
+        # 세마포어/호스트별 제한기는 이벤트 루프 스레드 안에서만 생성/사용합니다.
+        self._global_semaphore = None
+        self._host_limiters: Dict[str, rate_limiter.HostRateLimiter] = {}
+        self._host_breakers: Dict[str, circuit_breaker.CircuitBreaker] = {}
+
+        logger.info(f"FetchEngine initialized (max_concurrency={max_concurrency}, "
+                    f"per_host_concurrency={per_host_concurrency}, timeout={timeout})")
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """전용 이벤트 루프 스레드를 (최초 1회) 기동하고 루프를 반환합니다."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                loop_thread = threading.Thread(target=self._loop.run_forever,
+                                               name='fetch_engine_loop',
+                                               daemon=True)
+                loop_thread.start()
+        return self._loop
+
+    def _limiters(self, host: str):
+        if self._global_semaphore is None:
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        if host not in self._host_limiters:
+            self._host_limiters[host] = rate_limiter.HostRateLimiter(host, max_concurrency=self.per_host_concurrency,
+                                                                       rate=self.host_rate)
+        return self._global_semaphore, self._host_limiters[host]
+
+    def _breaker(self, host: str) -> circuit_breaker.CircuitBreaker:
+        if host not in self._host_breakers:
+            self._host_breakers[host] = circuit_breaker.CircuitBreaker(host)
+        return self._host_breakers[host]
+
+    def _fresh_cached_text(self, url: str, encoding: str, cache_ttl: float) -> str | None:
+        """(스레드 풀에서 실행) 재검증 없이 사용할 수 있는 캐시 본문이 있으면 반환합니다."""
+        cached = self.cache.lookup(url)
+        if cached is not None and cached.is_fresh(cache_ttl):
+            self.cache.record('hits')
+            return cached.text(encoding)
+        return None
+
+    def _request(self, url: str, headers: dict, timeout: float) -> requests.Response:
+        """(스레드 풀에서 실행) 실제 HTTP GET 요청을 수행합니다."""
+        session = self.session_pool.get_session(urlsplit(url).netloc)
+        response = session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()  # HTTP 오류가 발생하면 예외 발생
+        return response
+
+    def _fetch(self, url: str, headers: dict, timeout: float, encoding: str) -> str:
+        """
+        (스레드 풀에서 실행) 응답 캐시를 고려하여 URL 의 본문 문자열을 반환합니다.
+        재검증 없이 사용할 수 있는 캐시(hit)는 afetch_text 에서 _fresh_cached_text 로 먼저 확인합니다.
+        - 캐시 항목이 있으면 조건부 요청을 보내고 304 응답 시 캐시 본문 반환 (revalidated)
+        - 캐시 항목이 없거나 변경된 경우 전체 본문을 받아 캐시에 저장 (miss)
+        """
+        if self.cache is None:
+            response = self._request(url, headers, timeout)
+            if encoding:
+                response.encoding = encoding
+            return response.text
+
+        cached = self.cache.lookup(url)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+
+        response = self._request(url, request_headers, timeout)
+        if response.status_code == 304 and cached is not None:
+            self.cache.record('revalidated')
+            self.cache.mark_revalidated(url)
+            return cached.text(encoding)
+
+        self.cache.record('misses')
+        if encoding:
+            response.encoding = encoding
+        self.cache.store(url, response.content,
+                         encoding=response.encoding or response.apparent_encoding,
+                         etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'))
+        return response.text
+
+    async def _attempt(self, url: str, headers: dict, timeout: float, encoding: str) -> str:
+        """호스트별 제한기와 전체 세마포어를 거쳐 요청을 1회 수행하고, 결과를 제한기에 반영합니다."""
+        loop = asyncio.get_running_loop()
+        global_semaphore, host_limiter = self._limiters(urlsplit(url).netloc)
+        await host_limiter.acquire()
+        started = time.monotonic()
+        status_code, retry_after = None, None
+        try:
+            async with global_semaphore:
+                text = await loop.run_in_executor(self._executor,
+                                                  functools.partial(self._fetch, url, headers, timeout, encoding))
+            status_code = 200
+            return text
+        except requests.HTTPError as e:
+            if e.response is not None:
+                status_code = e.response.status_code
+                retry_after = e.response.headers.get('Retry-After')
+            raise
+        finally:
+            await host_limiter.release(status_code, time.monotonic() - started, retry_after)
+
+    async def afetch_text(self, url: str, headers: dict = None, timeout: float = None, encoding: str = None,
+                          cache_ttl: float = 0) -> str:
+        """
+        URL 의 응답 본문을 비동기로 가져옵니다.
+        타임아웃/연결 오류/429/5xx 는 지수 백오프(지터 포함)로 max_retries 번까지 재시도하고,
+        그래도 실패하면 마지막 requests 예외를 발생시킵니다. 차단기가 열린 호스트는 요청 없이 CircuitOpenError 를 발생시킵니다.
+        :param str url: 요청 URL
+        :param dict headers: 요청 헤더
+        :param float timeout: 요청 타임아웃(초), 미입력 시 엔진 기본값
+        :param str encoding: 응답 인코딩 강제 지정 (예: 'utf-8')
+        :param float cache_ttl: 응답 캐시를 재검증 없이 사용할 시간(초), 0 이면 항상 조건부 요청으로 재검증
+        """
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+
+        # 재검증 없이 사용할 수 있는 캐시는 요청 제한을 거치지 않고 바로 반환합니다.
+        if self.cache is not None and cache_ttl > 0:
+            cached_text = await loop.run_in_executor(self._executor, self._fresh_cached_text, url, encoding, cache_ttl)
+            if cached_text is not None:
+                return cached_text
+
+        breaker = self._breaker(urlsplit(url).netloc)
+        for attempt in range(self.max_retries + 1):
+            breaker.check()
+            try:
+                text = await self._attempt(url, headers, timeout, encoding)
+            except requests.RequestException as e:
+                if not is_retryable(e):
+                    # 404 등은 서버가 응답한 것이므로 차단기 실패로 보지 않습니다.
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if attempt == self.max_retries:
+                    raise
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, self.retry_base_delay * 2 ** attempt))
+                logger.warning(f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries}): {e!r}")
+                await asyncio.sleep(delay)
+            except Exception:
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # 요청이 취소되면(asyncio.CancelledError) 결과가 없으므로 반열림 시험 요청만 해제합니다.
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return text
+
+    async def afetch_text_many(self, urls: List[str], headers: dict = None, timeout: float = None,
+                               encoding: str = None, cache_ttl: float = 0) -> list:
+        """
+        여러 URL 을 동시에 가져옵니다. 결과는 입력 순서를 유지하며, 실패한 URL 은 예외 객체로 반환됩니다.
+        """
+        tasks = [self.afetch_text(url, headers=headers, timeout=timeout, encoding=encoding, cache_ttl=cache_ttl)
+                 for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def rate_limit_state(self) -> Dict[str, dict]:
+        """호스트별 현재 요청 속도, 동시 요청 수, 백오프 상태를 반환합니다."""
+        return {host: limiter.state() for host, limiter in list(self._host_limiters.items())}
+
+    def circuit_state(self) -> Dict[str, dict]:
+        """호스트별 차단기 상태를 반환합니다."""
+        return {host: breaker.stats() for host, breaker in list(self._host_breakers.items())}
+
+    def run_coroutine(self, coro):
+        """코루틴을 엔진의 이벤트 루프 스레드에서 실행하고 결과를 기다립니다. 동기 코드에서 호출합니다."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result()
+
+    def fetch_text(self, url: str, headers: dict = None, timeout: float = None, encoding: str = None,
+                   cache_ttl: float = 0) -> str:
+        """afetch_text 의 동기 버전. 크롤러의 동기 코드에서 호출합니다."""
+        return self.run_coroutine(
+            self.afetch_text(url, headers=headers, timeout=timeout, encoding=encoding, cache_ttl=cache_ttl))
+
+    def fetch_text_many(self, urls: List[str], headers: dict = None, timeout: float = None,
+                        encoding: str = None, cache_ttl: float = 0) -> list:
+        """afetch_text_many 의 동기 버전. 크롤러의 동기 코드에서 호출합니다."""
+        return self.run_coroutine(
+            self.afetch_text_many(urls, headers=headers, timeout=timeout, encoding=encoding, cache_ttl=cache_ttl))
+
+
+_engine = None
+_session_pool = None
+_engine_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """프로세스 전역에서 공유하는 SessionPool 인스턴스를 반환합니다."""
+    global _session_pool
+    with _engine_lock:
+        if _session_pool is None:
+            _session_pool = SessionPool(pool_maxsize=DEFAULT_PER_HOST_CONCURRENCY)
+    return _session_pool
+
+
+def get_engine() -> FetchEngine:
+    """프로세스 전역에서 공유하는 FetchEngine 인스턴스를 반환합니다."""
+    global _engine
+    session_pool = get_session_pool()
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine(session_pool=session_pool, cache=http_cache.HttpResponseCache())
+    return _engine
@@ -90,7 +90,8 @@ def local_test():
     
 def main(target_news_site: str, base_ymd: str):
     """
-    articles.json 파일 GCS 업로드 메인 배치
+    수집 기사 파일(<사이트>_<섹션>_articles.jsonl) GCS 업로드 메인 배치
+    이전 형식(*_articles.json) 등 data 디렉터리에 남은 다른 파일은 업로드하지 않습니다.
     :param str target_news_site: 뉴스 수집 사이트 이름 (zdnet, thelec)
     :param str base_ymd: GCS 업로드 날짜 (yyyymmdd)  
     :return: None
@@ -99,7 +100,7 @@ def main(target_news_site: str, base_ymd: str):
     local_data_dir=f'{pjt_home_path}/data'
     try:
         for filename in os.listdir(local_data_dir):
-            if filename.endswith('.json') and filename.startswith(target_news_site):
+            if filename.endswith('_articles.jsonl') and filename.startswith(target_news_site):
                 local_file_path = os.path.join(local_data_dir, filename)
                 upload_local_file_to_gcs(local_file_path, date_str=base_ymd)
             else:
@@ -131,7 +132,7 @@ def main_tweet(base_ymd: str):
 if __name__ == "__main__":
     import argparse
     
-    parser = argparse.ArgumentParser('articles.json 파일 GCS 업로드')
+    parser = argparse.ArgumentParser('articles.jsonl 파일 GCS 업로드')
     
     # target_news_site 인자 추가
     parser.add_argument(
@@ -0,0 +1,101 @@
+import sys
+import logging
+import threading
+
+from typing import List
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 헤더 프로필 수 (서로 다른 User-Agent 개수)
+DEFAULT_POOL_SIZE = 32
+
+# User-Agent 외 공통 요청 헤더
+BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache'
+}
+
+# fake_useragent 를 사용할 수 없을 때 사용하는 User-Agent
+FALLBACK_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:127.0) Gecko/20100101 Firefox/127.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36 Edg/126.0.0.0',
+]
+
+
+def _load_user_agents(size: int) -> List[str]:
+    """fake_useragent 에서 서로 다른 User-Agent 를 최대 size 개 가져옵니다."""
+    try:
+        from fake_useragent import UserAgent
+        ua = UserAgent()
+        user_agents = []
+        for _ in range(size * 4):
+            user_agent = ua.random
+            if user_agent not in user_agents:
+                user_agents.append(user_agent)
+            if len(user_agents) >= size:
+                break
+        return user_agents or FALLBACK_USER_AGENTS
+    except Exception as e:
+        logger.warning(f"fake_useragent unavailable, using fallback user agents: {e!r}")
+        return FALLBACK_USER_AGENTS
+
+
+class HeaderProfilePool:
+    """
+    크롤러가 공유하는 요청 헤더 프로필 풀.
+    - 첫 사용 시 1회만 User-Agent 목록을 불러와 헤더 프로필을 미리 만들어 둡니다. (fake_useragent 데이터 로딩 비용을 1회로 제한)
+    - next() 는 프로필을 순서대로 돌려가며 복사본을 반환합니다.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, user_agents: List[str] = None):
+        self.size = size
+        self._user_agents = user_agents
+        self._profiles = None
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def _ensure_profiles(self) -> list:
+        if self._profiles is None:
+            user_agents = self._user_agents or _load_user_agents(self.size)
+            self._profiles = [{'User-Agent': user_agent, **BASE_HEADERS} for user_agent in user_agents]
+            logger.info(f"HeaderProfilePool loaded {len(self._profiles)} profiles")
+        return self._profiles
+
+    def next(self) -> dict:
+        """다음 헤더 프로필(복사본)을 반환합니다."""
+        with self._lock:
+            profiles = self._ensure_profiles()
+            profile = profiles[self._index % len(profiles)]
+            self._index += 1
+        return dict(profile)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ensure_profiles())
+
+
+_header_pool = None
+_header_pool_lock = threading.Lock()
+
+
+def get_header_pool() -> HeaderProfilePool:
+    """프로세스 전역에서 공유하는 HeaderProfilePool 인스턴스를 반환합니다. (프로필은 첫 사용 시 생성)"""
+    global _header_pool
+    with _header_pool_lock:
+        if _header_pool is None:
+            _header_pool = HeaderProfilePool()
+    return _header_pool
@@ -0,0 +1,48 @@
+import os
+import sys
+import logging
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 파서 백엔드: lxml 이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 html.parser 를 사용합니다.
+# (환경 변수 NEWS_HTML_PARSER 로 강제 지정 가능)
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+DEFAULT_PARSER = os.environ.get('NEWS_HTML_PARSER', DEFAULT_PARSER)
+
+# 사이트별 파싱 범위 (크롤러가 실제로 사용하는 요소와 그 하위 트리만 생성)
+ZDNET_LIST = SoupStrainer('div', class_=['top_news', 'sub_news', 'newsPost'])
+ZDNET_ARTICLE = SoupStrainer(id='articleBody')
+ETNEWS_LIST = SoupStrainer('ul', class_='news_list')
+ETNEWS_ARTICLE = SoupStrainer('div', class_='article_body')
+THELEC_LIST = SoupStrainer(['div', 'li'], class_=re.compile(r'table-row|article|list-item|news-item', re.I))
+
+
+def parse_html(html: str, parse_only: SoupStrainer = None, fallback_to_full: bool = False,
+               parser: str = None) -> BeautifulSoup:
+    """
+    HTML 을 BeautifulSoup 트리로 파싱합니다. 세 크롤러가 공통으로 사용합니다.
+    :param str html: 페이지 HTML
+    :param SoupStrainer parse_only: 파싱 범위 (지정하면 일치하는 요소와 그 하위 트리만 생성)
+    :param bool fallback_to_full: 범위 파싱 결과에 요소가 없으면 전체 페이지를 다시 파싱할지 여부
+        (범위 밖의 대체 선택자를 사용하는 경우 지정)
+    :param str parser: 파서 백엔드 (기본값 DEFAULT_PARSER)
+    """
+    parser = parser or DEFAULT_PARSER
+    soup = BeautifulSoup(html, parser, parse_only=parse_only)
+    if parse_only is not None and fallback_to_full and soup.find() is None:
+        logger.debug("No element matched the parse scope, parsing the full page")
+        soup = BeautifulSoup(html, parser)
+    return soup
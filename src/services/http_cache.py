@@ -0,0 +1,197 @@
+import os
+import sys
+import logging
+import sqlite3
+import threading
+import time
+
+from dataclasses import dataclass
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 캐시 파일 기본 경로 / 보관 기간(초) / 최대 용량(byte)
+DEFAULT_CACHE_PATH = os.path.join(pjt_home_path, 'data', 'http_cache.sqlite3')
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장된 HTTP 응답"""
+    url: str
+    body: bytes
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def text(self, encoding: str = None) -> str:
+        """저장된 본문을 문자열로 디코딩합니다."""
+        return self.body.decode(encoding or self.encoding or 'utf-8', errors='replace')
+
+    def is_fresh(self, ttl: float) -> bool:
+        """마지막 검증 이후 ttl(초)이 지나지 않았으면 네트워크 요청 없이 사용할 수 있습니다."""
+        return ttl > 0 and (time.time() - self.fetched_at) < ttl
+
+    def conditional_headers(self) -> dict:
+        """조건부 요청(If-None-Match / If-Modified-Since) 헤더를 반환합니다."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """
+    크롤러 HTTP 응답을 SQLite 파일에 저장하는 영구 캐시.
+    - 본문과 함께 ETag / Last-Modified 를 저장하여 다음 실행에서 조건부 요청(304)으로 재검증합니다.
+    - 보관 기간(max_age)이 지난 항목과 최대 용량(max_bytes)을 넘는 항목(가장 오래 사용되지 않은 순)을 제거합니다.
+    - hit(네트워크 요청 없음) / revalidated(304) / miss(전체 다운로드) 횟수를 집계합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH,
+                 max_age: float = DEFAULT_MAX_AGE,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """(최초 사용 시) 캐시 DB 를 열고 테이블을 생성합니다. self._lock 안에서 호출합니다."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    encoding TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            logger.info(f"HTTP response cache opened: {self.db_path} ({self._total_bytes} bytes)")
+        return self._conn
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        """URL 에 해당하는 캐시 항목을 반환합니다. 보관 기간이 지난 항목은 없는 것으로 처리합니다."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, encoding, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            if now - row[4] > self.max_age:
+                return None
+
+            conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+            conn.commit()
+        return CachedResponse(url=url, body=row[0], encoding=row[1], etag=row[2], last_modified=row[3],
+                              fetched_at=row[4])
+
+    def store(self, url: str, body: bytes, encoding: str = None, etag: str = None, last_modified: str = None):
+        """응답을 캐시에 저장하고, 최대 용량을 넘으면 오래된 항목을 제거합니다."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is not None:
+                self._total_bytes -= row[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, encoding, etag, last_modified, fetched_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, encoding, etag, last_modified, now, now, len(body)))
+            self._total_bytes += len(body)
+            conn.commit()
+
+            if self._total_bytes > self.max_bytes:
+                self._evict_by_size(conn)
+
+    def mark_revalidated(self, url: str):
+        """304 응답으로 재검증된 항목의 검증 시각을 갱신합니다."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE responses SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, url))
+            conn.commit()
+
+    def _evict_by_size(self, conn: sqlite3.Connection):
+        """가장 오래 사용되지 않은 항목부터 최대 용량 이하가 될 때까지 제거합니다."""
+        rows = conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall()
+        evicted = 0
+        for url, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total_bytes -= size
+            evicted += 1
+        conn.commit()
+        logger.info(f"HTTP response cache evicted {evicted} entries by size ({self._total_bytes} bytes left)")
+
+    def evict_expired(self) -> int:
+        """보관 기간(max_age)이 지난 항목을 제거하고 제거된 항목 수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            expire_before = time.time() - self.max_age
+            cursor = conn.execute("DELETE FROM responses WHERE fetched_at < ?", (expire_before,))
+            conn.commit()
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if cursor.rowcount:
+            logger.info(f"HTTP response cache evicted {cursor.rowcount} expired entries")
+        return cursor.rowcount
+
+    def record(self, outcome: str):
+        """
+        캐시 사용 결과를 집계합니다.
+        :param str outcome: 'hits' (네트워크 요청 없음), 'revalidated' (304), 'misses' (전체 다운로드)
+        """
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> dict:
+        """hit / revalidated / miss 횟수와 캐시 용량을 반환합니다."""
+        total = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'hit_rate': round((self.hits + self.revalidated) / total, 4) if total else 0.0,
+            'total_bytes': self._total_bytes,
+        }
+
+    def close(self):
+        """캐시 DB 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,172 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+
+from typing import Callable
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 캐시 파일 기본 경로 / 보관 기간(초) / 최대 항목 수
+DEFAULT_CACHE_PATH = os.path.join(pjt_home_path, 'data', 'llm_cache.sqlite3')
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 50000
+
+
+def cache_key(model_name: str, template_version: int, input_text: str, generation_config: dict = None) -> str:
+    """
+    모델 이름, 프롬프트 템플릿 버전, 입력(프롬프트) 텍스트, 응답 형식 설정으로 캐시 키(sha256)를 만듭니다.
+    프롬프트 템플릿이나 응답 후처리를 바꾸면 템플릿 버전을 올려 이전 결과를 사용하지 않도록 합니다.
+    """
+    payload = json.dumps([model_name, template_version, input_text, generation_config or {}],
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LlmResultCache:
+    """
+    Gemini 응답 텍스트를 SQLite 파일에 저장하는 영구 캐시. (키: cache_key())
+    - 같은 입력은 실행이 바뀌어도 다시 요청하지 않습니다. (기간이 겹치는 뉴스 요약, Tweet 재실행 배치 등)
+    - 보관 기간(max_age)이 지난 항목과 최대 항목 수(max_entries)를 넘는 항목(가장 오래 사용되지 않은 순)을 제거합니다.
+    - hit / miss 횟수를 집계합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH,
+                 max_age: float = DEFAULT_MAX_AGE,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._entries = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """(최초 사용 시) 캐시 DB 를 열고 테이블을 생성합니다. self._lock 안에서 호출합니다."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access)")
+            self._conn.commit()
+            self._entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            logger.info(f"LLM result cache opened: {self.db_path} ({self._entries} entries)")
+        return self._conn
+
+    def get(self, key: str) -> str | None:
+        """키에 해당하는 저장 결과를 반환합니다. 보관 기간이 지난 항목은 없는 것으로 처리합니다."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT result, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row is None or now - row[1] > self.max_age:
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return row[0]
+
+    def put(self, key: str, result: str):
+        """결과를 저장하고, 최대 항목 수를 넘으면 오래 사용되지 않은 항목을 제거합니다."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            exists = conn.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, result, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, result, now, now))
+            conn.commit()
+            if exists is None:
+                self._entries += 1
+
+            if self._entries > self.max_entries:
+                self._evict_by_count(conn)
+
+    def get_or_generate(self, key: str, generate: Callable[[], str]) -> str:
+        """
+        저장 결과가 있으면 반환하고, 없으면 generate() 로 결과를 만들어 저장합니다.
+        generate() 의 예외는 저장하지 않고 그대로 전달하므로 실패한 요청은 다음 실행에서 다시 요청합니다.
+        """
+        result = self.get(key)
+        if result is None:
+            result = generate()
+            self.put(key, result)
+        return result
+
+    def _evict_by_count(self, conn: sqlite3.Connection):
+        """가장 오래 사용되지 않은 항목부터 최대 항목 수 이하가 될 때까지 제거합니다."""
+        evict_count = self._entries - self.max_entries
+        conn.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_access LIMIT ?)",
+                     (evict_count,))
+        conn.commit()
+        self._entries -= evict_count
+        logger.info(f"LLM result cache evicted {evict_count} entries by count ({self._entries} entries left)")
+
+    def evict_expired(self) -> int:
+        """보관 기간(max_age)이 지난 항목을 제거하고 제거된 항목 수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute("DELETE FROM results WHERE created_at < ?", (time.time() - self.max_age,))
+            conn.commit()
+            self._entries = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if cursor.rowcount:
+            logger.info(f"LLM result cache evicted {cursor.rowcount} expired entries")
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        """hit / miss 횟수와 저장 항목 수를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'entries': self._entries,
+        }
+
+    def close(self):
+        """캐시 DB 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LlmResultCache:
+    """프로세스 전역에서 공유하는 LlmResultCache 인스턴스를 반환합니다. (뉴스/트윗 요약이 같은 캐시를 사용)"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LlmResultCache()
+            _llm_cache.evict_expired()
+    return _llm_cache
@@ -0,0 +1,253 @@
+import os
+import re
+import sys
+import time
+import random
+import logging
+import threading
+
+from typing import Callable, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 동시에 진행할 최대 Gemini API 요청 수
+DEFAULT_MAX_IN_FLIGHT = int(os.environ.get('GEMINI_MAX_IN_FLIGHT', 8))
+# 분당 최대 Gemini API 요청 수 / 토큰 수 (gemini-2.0-flash-lite 유료 Tier 1 공개 한도: 4,000 RPM / 4,000,000 TPM)
+# 배치는 하루 뉴스 기사 + 트윗 게시물 수백 건을 요청하므로 무료 등급(30 RPM / 1,000,000 TPM, 하루 1,500건)으로는
+# 분 단위로 밀리고 일일 한도도 넘을 수 있어 유료 키 기준을 기본으로 합니다. 무료 키로 실행하면 환경 변수로 낮춥니다.
+# (예: GEMINI_REQUESTS_PER_MINUTE=30 GEMINI_TOKENS_PER_MINUTE=1000000)
+DEFAULT_REQUESTS_PER_MINUTE = float(os.environ.get('GEMINI_REQUESTS_PER_MINUTE', 4000))
+DEFAULT_TOKENS_PER_MINUTE = float(os.environ.get('GEMINI_TOKENS_PER_MINUTE', 4000000))
+
+# 요청 1건의 최대 재시도 횟수 / 프로세스 전체 재시도 예산 (다 쓰면 더 이상 재시도하지 않고 실패 처리)
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_RETRY_BUDGET = int(os.environ.get('GEMINI_RETRY_BUDGET', 100))
+# 지수 백오프 시작 대기 시간(초) / 최대 대기 시간(초), 서버가 이보다 오래 기다리라고 하면(일일 한도 초과 등) 재시도하지 않습니다.
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 90.0
+
+# 재시도할 응답 상태 코드 (요청 한도 초과, 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 503, 504}
+STATUS_RATE_LIMITED = 429
+
+# 요청 전 입력 토큰 수 추정에 사용하는 토큰당 문자 수 (한국어 기사 기준으로 보수적으로 잡음, 응답 후 실제 사용량으로 보정)
+CHARS_PER_TOKEN = 2
+
+_RETRY_HINT_PATTERNS = [
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)'),
+    re.compile(r'retry in\s+(\d+(?:\.\d+)?)\s*s', re.IGNORECASE),
+]
+
+
+def estimate_tokens(*args) -> int:
+    """요청 인자 중 문자열(프롬프트) 길이로 입력 토큰 수를 추정합니다."""
+    return sum(len(arg) for arg in args if isinstance(arg, str)) // CHARS_PER_TOKEN + 1
+
+
+def status_code_of(error: Exception) -> int | None:
+    """
+    API 오류의 HTTP 상태 코드를 반환합니다.
+    google.api_core 예외는 code 속성(예: ResourceExhausted -> 429), HTTP 클라이언트 예외는 response.status_code 를 사용합니다.
+    """
+    code = getattr(error, 'code', None)
+    if isinstance(code, int):
+        return int(code)
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def retry_hint_seconds(error: Exception) -> float | None:
+    """오류에 담긴 재시도 대기 시간(RetryInfo.retry_delay, Retry-After 헤더, 오류 메시지) 을 초 단위로 반환합니다."""
+    for detail in getattr(error, 'details', None) or []:
+        retry_delay = getattr(detail, 'retry_delay', None)
+        if retry_delay is not None:
+            return getattr(retry_delay, 'seconds', 0) + getattr(retry_delay, 'nanos', 0) / 1e9
+
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    retry_after = headers.get('Retry-After') if hasattr(headers, 'get') else None
+    if retry_after is not None and str(retry_after).replace('.', '', 1).isdigit():
+        return float(retry_after)
+
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(str(error))
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class RequestBudget:
+    """
+    분당 요청 수 / 분당 토큰 수 예산 (토큰 버킷 2개).
+    요청 버킷 크기는 동시 요청 수와 같게 두어 한꺼번에 몰리는 요청 수를 제한하고, 이후에는 분당 요청 수에 맞춰 간격을 둡니다.
+    토큰 버킷은 1분 분량을 채워두고 요청의 추정 입력 토큰 수만큼 사용하며, 응답 후 실제 사용량으로 보정합니다.
+    acquire() 는 요청을 보낼 수 있을 때까지 호출한 스레드를 대기시키고,
+    요청 한도 초과 응답을 받으면 pause() 로 모든 스레드의 요청을 재시도 시각까지 멈춥니다.
+    """
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE, burst: int = DEFAULT_MAX_IN_FLIGHT,
+                 tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.tokens_per_minute = tokens_per_minute
+        self.waited_seconds = 0.0
+
+        self._requests = float(burst)
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled_at
+        self._requests = min(self.burst, self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+        self._refilled_at = now
+
+    def acquire(self, tokens: int = 0):
+        """요청 1건과 입력 토큰 tokens 개의 예산을 확보합니다. 예산이 없으면 채워질 때까지 대기합니다."""
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait_seconds = self._paused_until - now
+                else:
+                    request_wait = max(0.0, (1 - self._requests) * 60 / self.requests_per_minute)
+                    token_wait = max(0.0, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+                    wait_seconds = max(request_wait, token_wait)
+                    if wait_seconds <= 0:
+                        self._requests -= 1
+                        self._tokens -= tokens
+                        return
+                self.waited_seconds += wait_seconds
+            time.sleep(wait_seconds)
+
+    def settle(self, estimated_tokens: int, used_tokens: int):
+        """요청 전 추정한 토큰 수를 실제 사용량(입력 + 출력)으로 보정합니다."""
+        with self._lock:
+            self._tokens -= used_tokens - estimated_tokens
+
+    def pause(self, seconds: float):
+        """요청 한도 초과 응답을 받으면 seconds 동안 모든 요청을 멈춥니다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._requests = min(self._requests, 0.0)
+
+
+class LlmExecutor:
+    """
+    Gemini API 요청을 동시에 실행하는 실행기.
+    - map(): 작업(기사 요약, 게시물 번역 등)을 스레드 풀에서 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+    - call(): 실제 API 요청을 감싸 동시 요청 수(max_in_flight)와 분당 요청 수 / 토큰 수 예산(RequestBudget)을 지킵니다.
+      한 작업이 여러 번 요청하더라도 요청마다 예산을 사용하므로, 프로세스 전체의 요청 속도가 예산을 넘지 않습니다.
+      요청 한도 초과(429)나 일시적 서버 오류는 지수 백오프(서버가 알려준 재시도 시각 우선)로 재시도하며,
+      요청별 최대 재시도 횟수(max_retries)와 프로세스 전체 재시도 예산(retry_budget) 안에서만 재시도합니다.
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, budget: RequestBudget = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, retry_budget: int = DEFAULT_RETRY_BUDGET,
+                 retry_base_delay: float = RETRY_BASE_DELAY, retry_max_delay: float = RETRY_MAX_DELAY):
+        self.max_in_flight = max_in_flight
+        self.budget = budget or RequestBudget(burst=max_in_flight)
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.calls = 0
+        self.retries = 0
+        self.rate_limited = 0
+
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float | None:
+        """
+        재시도 대기 시간(초)을 반환합니다. 재시도하지 않을 오류이거나 재시도 한도/예산을 넘으면 None 을 반환합니다.
+        지수 백오프(지터 포함)와 서버가 알려준 재시도 시각 중 긴 쪽을 사용합니다.
+        """
+        if status_code_of(error) not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+            return None
+        backoff = min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+        delay = max(backoff, retry_hint_seconds(error) or 0.0)
+        if delay > self.retry_max_delay:
+            return None
+        with self._lock:
+            if self.retry_budget <= 0:
+                return None
+            self.retry_budget -= 1
+            self.retries += 1
+        return delay
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        예산과 동시 요청 수 제한 안에서 API 요청 함수를 호출합니다.
+        재시도할 수 있는 오류는 백오프 후 다시 요청하고, 재시도하지 않는 오류는 그대로 전달합니다.
+        """
+        estimated_tokens = estimate_tokens(*args)
+        for attempt in range(self.max_retries + 1):
+            with self._in_flight:
+                self.budget.acquire(estimated_tokens)
+                with self._lock:
+                    self.calls += 1
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    if status_code_of(e) == STATUS_RATE_LIMITED:
+                        # 한도를 넘었으면 다른 스레드의 요청도 재시도 시각까지 멈춥니다.
+                        with self._lock:
+                            self.rate_limited += 1
+                        self.budget.pause(delay)
+                    logger.warning(f"Gemini API request failed ({status_code_of(e)}), retry {attempt + 1}/{self.max_retries} "
+                                   f"in {delay:.1f}s: {str(e)[:200]}")
+                else:
+                    usage = getattr(result, 'usage_metadata', None)
+                    used_tokens = getattr(usage, 'total_token_count', None)
+                    if isinstance(used_tokens, int):
+                        self.budget.settle(estimated_tokens, used_tokens)
+                    return result
+            time.sleep(delay)
+
+    def map(self, func: Callable, *iterables: Iterable) -> List:
+        """
+        입력 각각에 func 를 동시에 적용하고 입력 순서대로 결과를 반환합니다. (func 의 예외는 그대로 전달)
+        여러 iterable 을 주면 ThreadPoolExecutor.map 처럼 같은 위치의 항목을 인자로 전달합니다.
+        """
+        argument_lists = list(zip(*iterables))
+        if not argument_lists:
+            return []
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(argument_lists)), thread_name_prefix='llm') as executor:
+            results = list(executor.map(lambda arguments: func(*arguments), argument_lists))
+        logger.info(f"LlmExecutor processed {len(argument_lists)} items in {time.monotonic() - started:.1f}s => {self.stats()}")
+        return results
+
+    def stats(self) -> dict:
+        """누적 요청 수, 재시도 / 한도 초과 횟수, 남은 재시도 예산, 예산 대기 시간을 반환합니다."""
+        with self._lock:
+            return {'calls': self.calls, 'retries': self.retries, 'rate_limited': self.rate_limited,
+                    'retry_budget_left': self.retry_budget,
+                    'budget_wait_seconds': round(self.budget.waited_seconds, 2)}
+
+
+_llm_executor = None
+_llm_executor_lock = threading.Lock()
+
+
+def get_llm_executor() -> LlmExecutor:
+    """프로세스 전역에서 공유하는 LlmExecutor 인스턴스를 반환합니다. (뉴스/트윗 요약이 같은 예산을 사용)"""
+    global _llm_executor
+    with _llm_executor_lock:
+        if _llm_executor is None:
+            _llm_executor = LlmExecutor()
+    return _llm_executor
@@ -0,0 +1,138 @@
+import os
+import sys
+import site
+import zlib
+import random
+import logging
+
+from typing import List, Dict, Set, Tuple
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import crawl_state
+from src.services import news_sites
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 문자 n-gram 크기 (한국어는 띄어쓰기/조사 차이가 커서 공백을 제거한 문자 단위로 비교)
+SHINGLE_SIZE = 5
+# 비교에 사용하는 본문 앞부분 길이 (통신사 기사는 리드 문단이 같으므로 앞부분으로 충분)
+MAX_TEXT_CHARS = 2000
+
+# MinHash 서명 길이 / LSH 밴드 수 (밴드당 4행: 자카드 유사도 약 0.5 이상이면 후보가 될 확률이 높음)
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+
+# 같은 기사로 묶을 자카드 유사도 기준
+DEFAULT_THRESHOLD = 0.5
+
+_PRIME = (1 << 61) - 1
+# 실행마다 같은 서명이 나오도록 고정 시드로 해시 함수 계수를 만듭니다.
+_random = random.Random(20250628)
+_PERMUTATIONS = [(_random.randrange(1, _PRIME), _random.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+
+def shingles(text: str) -> Set[int]:
+    """정규화한 텍스트(공백 제거, 소문자)의 문자 n-gram 해시 집합을 반환합니다."""
+    text = ''.join(crawl_state.normalize_content(text).lower().split())
+    if len(text) <= SHINGLE_SIZE:
+        return {zlib.crc32(text.encode('utf-8'))} if text else set()
+    return {zlib.crc32(text[i:i + SHINGLE_SIZE].encode('utf-8')) for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def article_shingles(article: Dict) -> Set[int]:
+    """기사 제목과 본문 앞부분의 n-gram 해시 집합"""
+    text = f"{article.get('title') or ''} {(article.get('content') or '')[:MAX_TEXT_CHARS]}"
+    return shingles(text)
+
+
+def minhash(shingle_set: Set[int]) -> Tuple[int, ...]:
+    """n-gram 해시 집합의 MinHash 서명"""
+    if not shingle_set:
+        return ()
+    return tuple(min((a * value + b) % _PRIME for value in shingle_set) for a, b in _PERMUTATIONS)
+
+
+def jaccard(set_a: Set[int], set_b: Set[int]) -> float:
+    if not set_a or not set_b:
+        return 0.0
+    return len(set_a & set_b) / len(set_a | set_b)
+
+
+def _representative_key(article: Dict) -> tuple:
+    """클러스터 대표 기사 선택 기준: 본문이 가장 긴 기사 (같으면 URL 순)"""
+    return -len(article.get('content') or ''), article.get('url', '')
+
+
+def cluster_articles(articles: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[List[Dict]]:
+    """
+    제목/본문이 거의 같은 기사(여러 매체에 실린 같은 통신사 기사 등)를 묶습니다.
+    MinHash 서명을 LSH 밴드로 나누어 같은 밴드 값을 가진 기사만 후보로 비교하고,
+    후보 쌍은 n-gram 집합의 실제 자카드 유사도가 threshold 이상일 때 같은 클러스터로 합칩니다.
+    :return: 클러스터 목록 (입력 순서 기준). 각 클러스터의 첫 기사가 대표 기사이고 나머지는 다른 매체 기사입니다.
+    """
+    shingle_sets = [article_shingles(article) for article in articles]
+    signatures = [minhash(shingle_set) for shingle_set in shingle_sets]
+
+    parents = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    buckets: Dict[tuple, List[int]] = {}
+    for i, signature in enumerate(signatures):
+        if not signature:
+            continue
+        for band in range(LSH_BANDS):
+            buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), []).append(i)
+
+    compared = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pair = (members[x], members[y])
+                if pair in compared:
+                    continue
+                compared.add(pair)
+                if find(pair[0]) != find(pair[1]) and jaccard(shingle_sets[pair[0]], shingle_sets[pair[1]]) >= threshold:
+                    parents[find(pair[1])] = find(pair[0])
+
+    clusters: Dict[int, List[Dict]] = {}
+    for i, article in enumerate(articles):
+        clusters.setdefault(find(i), []).append(article)
+    result = [sorted(cluster, key=_representative_key) for cluster in clusters.values()]
+
+    duplicates = len(articles) - len(result)
+    if duplicates:
+        logger.info(f"{len(articles)} articles clustered into {len(result)} ({duplicates} near-duplicates, "
+                    f"{len(compared)} candidate pairs compared)")
+    return result
+
+
+def other_site_alternates(cluster: List[Dict]) -> List[Dict]:
+    """
+    클러스터 대표 기사(첫 기사)와 다른 매체에 실린 기사 링크 목록 ({title, url, site}) 을 반환합니다.
+    대표 기사와 같은 매체의 재게시 기사는 "다른 매체" 가 아니므로 제외합니다. (섹션 병합에는 그대로 사용)
+    """
+    representative, *alternates = cluster
+    representative_site = news_sites.site_of(representative['sections'][0])
+    links = []
+    for alternate in alternates:
+        site = news_sites.site_of(alternate['sections'][0])
+        if site == representative_site:
+            continue
+        links.append({"title": alternate.get('title', 'N/A'), "url": alternate.get('url', 'N/A'), "site": site})
+    return links
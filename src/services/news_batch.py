@@ -0,0 +1,84 @@
+import os
+import sys
+import site
+import time
+import logging
+
+from typing import Callable, Dict, List
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import news_crawl
+from src.services import crawl_journal
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 뉴스 배치 단계 (이 순서대로 실행)
+STAGES = ('crawl', 'upload', 'summarize', 'mail')
+
+# 실패한 섹션을 같은 실행에서 다시 수집하는 최대 시도 횟수 / 시도 간 대기 시간(초)
+CRAWL_ATTEMPTS = 3
+CRAWL_RETRY_DELAY = 30
+
+
+def crawl_stage(base_ymd: str, journal: crawl_journal.CrawlJournal, targets: list = None,
+                attempts: int = CRAWL_ATTEMPTS, retry_delay: float = CRAWL_RETRY_DELAY) -> bool:
+    """
+    등록된 모든 사이트 x 섹션을 수집합니다.
+    실패한 섹션이 있으면 retry_delay 초 후 다시 수집하며(최대 attempts 회), 완료한 섹션은 체크포인트로 건너뜁니다.
+    그래도 실패한 섹션은 오류로 기록하고, 수집한 섹션으로 다음 단계(업로드/요약/메일)를 진행합니다.
+    :return: 수집에 성공한 섹션이 있으면 True, 모든 섹션이 실패하면 False (다음 단계는 재실행 때 수행)
+    """
+    for attempt in range(1, attempts + 1):
+        crawl_summary = news_crawl.crawl_all(base_ymd, targets=targets, journal=journal)
+        failed = {source: result for source, result in crawl_summary.items() if isinstance(result, Exception)}
+        if not failed:
+            return True
+        if attempt < attempts:
+            logger.warning(f"Failed to crawl {len(failed)} sections {list(failed)}. "
+                           f"Retrying in {retry_delay}s (attempt {attempt + 1}/{attempts})")
+            time.sleep(retry_delay)
+
+    logger.error(f"Failed to crawl {len(failed)} sections after {attempts} attempts: "
+                 f"{ {source: repr(error) for source, error in failed.items()} }")
+    if len(failed) == len(crawl_summary):
+        return False
+    logger.warning(f"Continuing with {len(crawl_summary) - len(failed)} collected sections")
+    return True
+
+
+def run_news_batch(base_ymd: str, stages: Dict[str, Callable[[crawl_journal.CrawlJournal], bool | None]],
+                   force: bool = False, journal_dir: str = crawl_journal.DEFAULT_JOURNAL_DIR) -> List[str]:
+    """
+    뉴스 배치 단계를 순서대로 실행하고 완료한 단계를 기준 일자 체크포인트에 기록합니다.
+    같은 기준 일자로 다시 실행하면 완료된 단계는 건너뜁니다.
+    단계 함수가 False 를 반환하면(모든 섹션 수집 실패 등) 그 단계와 이후 단계는 완료로 기록하지 않고 중단하여,
+    재실행 때 다시 수집한 뒤 업로드/요약/메일 발송을 수행합니다.
+    :param dict stages: 단계 이름 -> 단계 함수(journal), 입력 순서대로 실행
+    :param bool force: 기준 일자 체크포인트를 지우고 처음부터 다시 실행 (메일 재발송 등)
+    :return: 이번 실행에서 완료한 단계 목록
+    """
+    journal = crawl_journal.CrawlJournal(base_ymd, journal_dir=journal_dir)
+    if force:
+        journal.reset()
+
+    completed = []
+    for name, stage in stages.items():
+        if journal.is_done(crawl_journal.UNIT_STAGE, name):
+            logger.info(f"[{base_ymd}] Stage '{name}' already done in a previous run, skipping (use force to rerun)")
+            continue
+        if stage(journal) is False:
+            logger.warning(f"[{base_ymd}] Stage '{name}' did not complete. Remaining stages will run on the next run")
+            break
+        journal.mark(crawl_journal.UNIT_STAGE, name)
+        completed.append(name)
+    return completed
@@ -0,0 +1,237 @@
+import os
+import sys
+import site
+import logging
+import importlib
+import traceback
+import datetime as dt
+
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pytz
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+from src.services import crawl_state
+from src.services import news_sites
+from src.services import url_registry
+from src.services import article_store
+from src.services import crawl_journal
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+kst_timezone = pytz.timezone('Asia/Seoul')
+
+# 동시에 수집할 최대 섹션 수 (요청 수는 공유 수집 엔진에서 호스트별로 제한)
+DEFAULT_SECTION_WORKERS = 8
+
+# 본문 수집/파일 기록 단위 (이 건수만큼 본문을 수집할 때마다 파일에 기록하고 메모리에서 해제)
+CONTENT_BATCH_SIZE = 32
+
+
+def target_date_range(adapter: news_sites.SiteAdapter, base_ymd: str) -> Tuple[dt.datetime, dt.datetime]:
+    """기준 일자(yyyymmdd)로부터 사이트 수집 기간 [T - window_days, T + 1일) 을 계산합니다."""
+    end_date = dt.datetime.strptime(base_ymd, "%Y%m%d")
+    end_date = kst_timezone.localize(end_date) + dt.timedelta(hours=24)
+    start_date = end_date - dt.timedelta(days=adapter.window_days)
+    return start_date, end_date
+
+
+def create_section_crawler(adapter: news_sites.SiteAdapter, section: news_sites.Section, base_ymd: str):
+    """사이트 등록부에 지정된 크롤러 모듈로 섹션 크롤러를 생성하고 수집 기간을 설정합니다."""
+    crawler_module = importlib.import_module(f'src.services.{adapter.crawler}')
+    crawler = crawler_module.create_crawler(section, seen_index=crawl_state.get_seen_url_index())
+    crawler.set_target_date_range(*target_date_range(adapter, base_ymd))
+    return crawler
+
+
+def list_section(adapter: news_sites.SiteAdapter, section: news_sites.Section, base_ymd: str) -> tuple:
+    """
+    사이트의 한 섹션 목록을 수집합니다.
+    :return: (크롤러, 수집 기간 내 기사 목록)
+    """
+    crawler = create_section_crawler(adapter, section, base_ymd)
+
+    logger.info(f"--- Fetching recent {adapter.name} {section.name_en} articles from {section.url} ---")
+    return crawler, crawler.fetch_articles()
+
+
+def collect_section(adapter: news_sites.SiteAdapter, section: news_sites.Section, crawler, articles: List[Dict],
+                    run_key: str = '') -> int:
+    """
+    목록 기사의 본문을 수집하여 기사 JSON Lines 파일로 저장합니다.
+    CONTENT_BATCH_SIZE 건씩 새 기사(와 본문 확인 주기가 지난 기사) 본문 수집 -> 본문 수집 실패 기사 제외 -> 수집 상태 기록 -> 파일 기록 순서로 처리하고,
+    기록한 기사 본문은 메모리에서 해제합니다. 모두 기록하면 임시 파일을 최종 파일로 원자적으로 교체합니다.
+    중간에 실패하면 같은 run_key 로 다시 실행할 때 이미 기록한 기사는 건너뛰고 이어서 수집합니다.
+    :param str run_key: 재개 단위 (기준 일자 등), 다른 run_key 의 임시 파일은 버립니다
+    :return: 저장한 기사 수
+    """
+    source = adapter.source(section)
+    output_path = adapter.output_path(section)
+
+    with article_store.JsonlWriter(output_path, run_key=run_key) as writer:
+        written_urls = writer.open()
+        articles = [article for article in articles if article['url'] not in written_urls]
+        if articles:
+            logger.info(f"Found {len(articles)} recent articles. ({len(written_urls)} already saved)")
+        elif not written_urls:
+            logger.warning(f"No recent {adapter.name} {section.name_en} articles found or an error occurred.")
+
+        for batch_start in range(0, len(articles), CONTENT_BATCH_SIZE):
+            batch = articles[batch_start:batch_start + CONTENT_BATCH_SIZE]
+            # 이전 실행에서 수집하지 않은 기사와, 본문 확인 주기가 지난 기사만 본문을 요청합니다.
+            recheck_urls = set()
+            if crawler.seen_index is not None:
+                known_urls = [article['url'] for article in batch if article['content']]
+                recheck_urls = crawler.seen_index.due_for_recheck(known_urls) if known_urls else set()
+            fetch_targets = [article for article in batch if not article['content'] or article['url'] in recheck_urls]
+            checked_urls = set()
+            if fetch_targets:
+                contents = crawler.fetch_article_contents([article['url'] for article in fetch_targets])
+                for article, content in zip(fetch_targets, contents):
+                    # 다시 확인하는 기사는 본문을 받지 못하면 저장된 본문을 그대로 사용합니다.
+                    if isinstance(content, fetch_engine.FetchFailure) and article['content']:
+                        continue
+                    article['content'] = content
+                    checked_urls.add(article['url'])
+            # 본문 수집에 실패한 기사는 저장/요약 대상에서 제외합니다.
+            batch = fetch_engine.exclude_failed_articles(batch)
+
+            if crawler.seen_index is not None:
+                # 다시 받은 본문은 정규화한 본문 해시로 비교하여 바뀐 기사만 다시 요약되도록 기록합니다.
+                counts = crawler.seen_index.record_articles(source, batch, checked_urls=checked_urls)
+                if recheck_urls:
+                    logger.info(f"[{source}] Rechecked {len(recheck_urls)} known articles => {counts}")
+            for article in batch:
+                writer.write(article)
+                logger.info(f"[{source}] Article {writer.written}: {article['title']} ({article['published_date']}) {article['url']}")
+                # 파일에 기록한 본문은 메모리에서 해제합니다.
+                article['content'] = None
+
+    logger.info(f"{writer.written} articles saved to {os.path.basename(output_path)}")
+    return writer.written
+
+
+def crawl_section(adapter: news_sites.SiteAdapter, section: news_sites.Section, base_ymd: str) -> int:
+    """
+    사이트의 한 섹션을 수집하여 기사 JSON Lines 파일로 저장합니다.
+    :return: 저장한 기사 수
+    """
+    crawler, articles = list_section(adapter, section, base_ymd)
+    return collect_section(adapter, section, crawler, articles, run_key=base_ymd)
+
+
+def _restore_listed(adapter: news_sites.SiteAdapter, section: news_sites.Section, base_ymd: str,
+                    journal: crawl_journal.CrawlJournal) -> tuple | None:
+    """
+    체크포인트에 목록 수집 결과가 있으면 목록 페이지를 다시 요청하지 않고 복원합니다.
+    본문 수집까지 끝난 섹션은 크롤러를 만들지 않습니다.
+    :return: (크롤러 또는 None, 기사 목록), 체크포인트가 없으면 None
+    """
+    source = adapter.source(section)
+    listed = journal.get(crawl_journal.UNIT_LIST, source)
+    if listed is None:
+        return None
+    articles = listed['articles']
+    if journal.is_done(crawl_journal.UNIT_SECTION, source):
+        return None, articles
+    crawler = create_section_crawler(adapter, section, base_ymd)
+    if crawler.seen_index is not None:
+        crawler.seen_index.fill_known_articles(articles)
+    logger.info(f"[{source}] Restored {len(articles)} listed articles from checkpoint")
+    return crawler, articles
+
+
+def crawl_all(base_ymd: str,
+              targets: List[Tuple[news_sites.SiteAdapter, news_sites.Section]] = None,
+              max_workers: int = DEFAULT_SECTION_WORKERS,
+              journal: crawl_journal.CrawlJournal = None) -> Dict[str, int | Exception]:
+    """
+    등록된 모든 사이트 x 섹션을 동시에 수집합니다.
+    각 섹션은 스레드에서 실행되지만 요청은 모두 공유 수집 엔진의 이벤트 루프에서 처리되므로
+    세션 풀, 호스트별 요청 제한, 응답 캐시, 파서 프로세스 풀을 함께 사용합니다.
+    1) 모든 섹션 목록을 동시에 수집하고,
+    2) 여러 섹션에 나온 같은 기사는 배치 URL 등록부(ArticleRegistry)로 먼저 나온 섹션에만 남겨(sections 에 모든 섹션 기록)
+    3) 섹션별 본문 수집/저장을 동시에 수행합니다. 같은 기사는 본문 수집과 요약을 한 번만 합니다.
+    한 섹션의 실패는 다른 섹션 수집에 영향을 주지 않습니다.
+    체크포인트(journal)가 주어지면 완료한 목록/섹션을 기록하고, 같은 기준 일자로 다시 실행할 때 완료된 단위는 건너뜁니다.
+    :param str base_ymd: 뉴스 수집 기준 일자 (yyyymmdd)
+    :param list targets: 수집 대상 (사이트, 섹션) 목록, 미입력 시 일괄 수집 배치 대상 전체
+    :param int max_workers: 동시에 수집할 최대 섹션 수
+    :param CrawlJournal journal: 기준 일자 체크포인트 기록
+    :return: source(예: zdnet_semiconductor) 별 저장 기사 수 또는 실패 예외
+    """
+    if targets is None:
+        targets = news_sites.batch_targets()
+
+    def run_guarded(func, adapter, section, *args):
+        try:
+            return func(adapter, section, *args)
+        except Exception as e:
+            logger.error(traceback.format_exc())
+            logger.error(f"Failed to crawl {adapter.source(section)}: {e!r}")
+            return e
+
+    def list_or_restore(adapter, section):
+        if journal is not None:
+            restored = _restore_listed(adapter, section, base_ymd, journal)
+            if restored is not None:
+                return restored
+        crawler, articles = list_section(adapter, section, base_ymd)
+        if journal is not None:
+            # 본문은 수집 상태 인덱스/임시 파일에 있으므로 목록 정보만 기록합니다.
+            journal.mark(crawl_journal.UNIT_LIST, adapter.source(section),
+                         articles=[{**article, 'content': ''} for article in articles])
+        return crawler, articles
+
+    def collect_and_mark(adapter, section, crawler, articles):
+        saved = collect_section(adapter, section, crawler, articles, run_key=base_ymd)
+        if journal is not None:
+            journal.mark(crawl_journal.UNIT_SECTION, adapter.source(section), saved=saved)
+        return saved
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-crawl') as executor:
+        listed = list(executor.map(lambda target: run_guarded(list_or_restore, *target), targets))
+
+        # 등록부 순서(targets 순서)대로 등록하여 기사를 소유할 섹션이 실행마다 같도록 합니다.
+        registry = url_registry.ArticleRegistry()
+        collect_jobs = []
+        for (adapter, section), result in zip(targets, listed):
+            if isinstance(result, Exception):
+                collect_jobs.append(None)
+                continue
+            crawler, articles = result
+            collect_jobs.append((adapter, section, crawler, registry.register(adapter.source(section), articles)))
+        logger.info(f"batch url registry stats => {registry.stats()}")
+
+        def run_collect(job):
+            if job is None:
+                return None
+            adapter, section = job[0], job[1]
+            done = journal.get(crawl_journal.UNIT_SECTION, adapter.source(section)) if journal is not None else None
+            if done is not None:
+                logger.info(f"[{adapter.source(section)}] Already collected in a previous run, skipping")
+                return done['saved']
+            return run_guarded(collect_and_mark, *job)
+
+        collected = list(executor.map(run_collect, collect_jobs))
+
+    summary = {}
+    for (adapter, section), list_result, collect_result in zip(targets, listed, collected):
+        if isinstance(list_result, Exception):
+            summary[adapter.source(section)] = list_result
+        else:
+            summary[adapter.source(section)] = collect_result
+    logger.info(f"crawl summary => {summary}")
+    return summary
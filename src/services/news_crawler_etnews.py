@@ -1,24 +1,30 @@
 import os
 import sys
+import site
 import logging
 import traceback
 import re
-import json
-import time
-import random
 import datetime as dt
 
 from typing import List, Dict
 
 import pytz
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
 
 src_path = os.path.dirname(__file__)
 pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
 pjt_home_path = os.path.abspath(pjt_home_path)
 
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+from src.services import crawl_state
+from src.services import date_extractor
+from src.services import html_parser
+from src.services import parse_pipeline
+from src.services import header_profiles
+from src.services import news_sites
+from src.services import news_crawl
+
 # 로깅 설정
 logger = logging.getLogger(__file__)
 formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
@@ -29,6 +35,12 @@ logger.addHandler(stream_log)
 
 kst_timezone = pytz.timezone('Asia/Seoul')
 
+# 파서가 본문을 찾지 못했을 때 반환하는 문구 (FetchFailure 로 변환하여 저장/요약 대상에서 제외)
+CONTENT_FAILURE_PREFIXES = ("Content not found.",)
+
+# 목록 페이지 최대 요청 수 (수집 기간이 덮이지 않아도 이 페이지 수에서 중단)
+MAX_LIST_PAGES = 10
+
 class NewsCrawlerEtnews:
     """
     etnews.com의 '전자', 'SW', 'IT' 섹션에서 뉴스 기사 목록과 본문을 수집하는 크롤러 클래스.
@@ -43,11 +55,16 @@ class NewsCrawlerEtnews:
         "03": "it",
     }
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, seen_index: crawl_state.SeenUrlIndex = None):
         self.base_url = base_url   
-        # 랜덤 User-Agent 생성
-        self.ua = UserAgent()
+        # 이전 실행에서 수집한 기사 URL 인덱스 (None 이면 매번 전체 수집)
+        self.seen_index = seen_index
+        # 크롤러 간 공유되는 요청 헤더 프로필 풀 (User-Agent 순환)
+        self.header_pool = header_profiles.get_header_pool()
         self._update_headers()
+        # 크롤러 간 공유되는 HTTP 수집 엔진
+        self.engine = fetch_engine.get_engine()
+        self.parse_pipeline = parse_pipeline.get_parse_pipeline()
         
         self.end_date = dt.datetime.now(kst_timezone)
         self.start_date = self.end_date - dt.timedelta(days=3)
@@ -64,28 +81,19 @@ class NewsCrawlerEtnews:
         logger.info(f"end_date=> {end_date}")
     
     def _update_headers(self):
-        """랜덤한 User-Agent를 사용하여 헤더를 업데이트합니다."""
-        self.headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
+        """공유 헤더 프로필 풀에서 다음 User-Agent 의 헤더를 사용합니다."""
+        self.headers = self.header_pool.next()
         
     def _parse_date(self, datetime_str: str) -> dt.datetime:
         """
         날짜 문자열을 datetime 객체로 파싱합니다.
         ETNews 날짜 형식: YYYY.MM.DD HH:MM  (예: 2025-05-23 19:22)
         """
-        try:
-            return dt.datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-        except ValueError as e:
-            logger.error(f"Failed to parse date string '{datetime_str}': {e}")
+        published_datetime = date_extractor.ETNEWS_LIST_DATES.extract(datetime_str)
+        if published_datetime is None:
+            logger.error(f"Failed to parse date string '{datetime_str}'")
             return dt.datetime.min  # 파싱 실패 시 매우 오래된 날짜 반환하여 필터링되도록 함
+        return published_datetime
 
     def _fetch_html(self, url: str):
         """
@@ -93,36 +101,56 @@ class NewsCrawlerEtnews:
         :param url: HTML을 가져올 URL
         :return: 성공 시 HTML 문자열, 실패 시 None
         """
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-            response.encoding = 'utf-8' # 인코딩 설정
-            return response.text
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching URL {url}: {e}")
-            return None
+        return self._fetch_html_many([url])[0]
+
+    def _fetch_html_many(self, urls: List[str], cache_ttl: float = 0) -> list:
+        """
+        여러 URL 의 HTML 콘텐츠를 공유 수집 엔진으로 동시에 가져옵니다.
+        :param urls: HTML을 가져올 URL 목록
+        :param cache_ttl: 응답 캐시를 재검증 없이 사용할 시간(초), 목록 페이지는 0 (항상 재검증)
+        :return: urls 순서대로 성공 시 HTML 문자열, 실패 시 None
+        """
+        results = self.engine.fetch_text_many(urls, headers=self.headers, timeout=10, encoding='utf-8',
+                                              cache_ttl=cache_ttl)
+        
+        html_list = []
+        for url, result in zip(urls, results):
+            if isinstance(result, requests.exceptions.RequestException):
+                logger.error(f"Error fetching URL {url}: {result}")
+                html_list.append(None)
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                html_list.append(result)
+        return html_list
         
-    def fetch_articles(self, target_page_num: int = 1) -> List[Dict[str, str]]:
+    def fetch_articles(self, max_page_num: int = MAX_LIST_PAGES) -> List[Dict[str, str]]:
         """
         뉴스 목록 페이지에서 기사 제목, URL, 날짜를 가져와 설정된 일자 (디폴트 최근 3일) 이내 뉴스만 필터링합니다.
         ETNews 의 HTML 구조에 맞춰져 있습니다.
+        목록은 최신순이므로 페이지의 가장 오래된 기사가 start_date 이전이면 다음 페이지를 요청하지 않고,
+        수집 기간이 덮일 때까지 (최대 max_page_num 페이지) 다음 페이지를 요청합니다.
         """
         news_list = []
         
-        for page_num in range(1, target_page_num + 1):
+        for page_num in range(1, max_page_num + 1):
+            page_url = self.base_url + f'&page={page_num}'
             
-            logger.info(f"Fetching articles from {self.base_url + f'&page={page_num}'} published from {self.start_date} to {self.end_date}")
+            logger.info(f"Fetching articles from {page_url} published from {self.start_date} to {self.end_date}")
         
-            html = self._fetch_html(self.base_url + f'&page={page_num}')
-            soup = BeautifulSoup(html, 'html.parser')
+            html = self._fetch_html(page_url)
+            if html is None:
+                continue
+            soup = html_parser.parse_html(html, parse_only=html_parser.ETNEWS_LIST)
             
             # 데스크탑 페이지 구조: 기사 목록은 'div' 태그와 'class=list_news' 안에 'ul > li' 형태로 존재        
             article_list_ul = soup.find('ul', class_='news_list')
             if not article_list_ul:
                 logger.warning("Could not find 'ul' inside the news_list container.")
-                return []
+                break
 
             list_items = article_list_ul.find_all('li')
+            oldest_datetime = None
 
             for item in list_items:
                 link_tag = item.find('a')
@@ -144,6 +172,14 @@ class NewsCrawlerEtnews:
                 
                 title = title_tag.get_text(strip=True)
                 article_datetime = date_tag.get_text(strip=True)
+                published_datetime = self._parse_date(article_datetime)
+                if published_datetime == dt.datetime.min:
+                    continue
+                
+                # 페이지의 가장 오래된 기사 일시 (다음 페이지 요청 여부 판단용)
+                published_datetime = kst_timezone.localize(published_datetime)
+                if oldest_datetime is None or published_datetime < oldest_datetime:
+                    oldest_datetime = published_datetime
                 
                 # '[포토]'로 시작하는 제목은 건너뜀
                 if title.startswith('[포토]'):
@@ -153,11 +189,8 @@ class NewsCrawlerEtnews:
                 logger.info(f'title: {title}')
                 logger.info(f'link: {article_link}')
                 logger.info(f'article_datetime: {article_datetime}')
-                            
-                published_datetime = self._parse_date(article_datetime)
                 
                 # Check if the article is within from start_date to end_date
-                published_datetime = kst_timezone.localize(published_datetime)
                 if published_datetime >= self.start_date and published_datetime <= self.end_date:            
                     news_list.append({
                         'title': title,
@@ -168,98 +201,90 @@ class NewsCrawlerEtnews:
                 else:
                     logger.debug(f"Skipping old article: {title} ({published_datetime})")
             
+            if oldest_datetime is None:
+                logger.info(f"No dated articles on page {page_num}. Stop fetching next pages.")
+                break
+            if oldest_datetime < self.start_date:
+                logger.info(f"Page {page_num} reaches before start_date ({oldest_datetime}). Stop fetching next pages.")
+                break
+        else:
+            logger.warning(f"Reached max_page_num ({max_page_num}) before covering start_date {self.start_date}")
+        
+        # 이전 실행에서 수집한 기사는 본문을 인덱스에서 채워 본문 요청을 생략합니다.
+        if self.seen_index is not None:
+            self.seen_index.fill_known_articles(news_list)
+            
         return news_list
     
-    def fetch_article_content(self, article_url: str) -> str:
+    def fetch_article_content(self, article_url: str) -> 'str | fetch_engine.FetchFailure':
         """
         개별 기사 페이지의 HTML에서 본문 텍스트를 파싱합니다.
-        :param html: 기사 페이지의 HTML 콘텐츠
+        :param article_url: 기사 URL
         :return: 기사 본문 텍스트
         """
-        logger.info(f"Fetching content for article: {article_url}")
+        return self.fetch_article_contents([article_url])[0]
+
+    def fetch_article_contents(self, article_urls: List[str]) -> List['str | fetch_engine.FetchFailure']:
+        """
+        여러 기사의 본문 텍스트를 가져옵니다. 다운로드는 공유 수집 엔진에서 동시에, 본문 파싱은 파서 프로세스 풀에서 수행합니다.
+        :param article_urls: 기사 URL 목록
+        :return: article_urls 순서대로 기사 본문 텍스트 목록 (재시도 후에도 본문을 얻지 못한 기사는 FetchFailure)
+        """
+        logger.info(f"Fetching content for {len(article_urls)} articles")
         
         self._update_headers()
-        html = self._fetch_html(article_url)
-        if html is None:
-            return "Content not found. (request fail!!)"
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        results = self.parse_pipeline.fetch_and_parse_many(article_urls, parse_article_content,
+                                                           headers=self.headers, timeout=10, encoding='utf-8',
+                                                           cache_ttl=fetch_engine.ARTICLE_CACHE_TTL)
         
-        # 본문은 'div' 태그와 'article_body' 클래스에 포함되어 있음
-        content_div = soup.find('div', class_='article_body')
-        
-        if content_div:
-            # 기사 본문 내 불필요한 태그(광고, 관련기사 등) 제거
-            for unwanted_tag in content_div.find_all(['figure', 'script', 'div', 'table']):
-                unwanted_tag.decompose()
-            
-            # 텍스트 추출 및 공백 정리
-            text = content_div.get_text(separator='\n', strip=True)
-            return text
-        
-        return "Content not found."
+        return [fetch_engine.as_fetch_result(url, result, CONTENT_FAILURE_PREFIXES)
+                for url, result in zip(article_urls, results)]
+
+
+def parse_article_content(html: str, article_url: str = None) -> str:
+    """
+    개별 기사 페이지의 HTML에서 본문 텍스트를 파싱합니다.
+    :param html: 기사 페이지의 HTML 콘텐츠
+    :param article_url: 기사 URL (파싱 파이프라인의 parse_func(html, url) 형식에 맞추기 위한 인자)
+    :return: 기사 본문 텍스트
+    """
+    soup = html_parser.parse_html(html, parse_only=html_parser.ETNEWS_ARTICLE)
+
+    # 본문은 'div' 태그와 'article_body' 클래스에 포함되어 있음
+    content_div = soup.find('div', class_='article_body')
+
+    if content_div:
+        # 기사 본문 내 불필요한 태그(광고, 관련기사 등) 제거
+        for unwanted_tag in content_div.find_all(['figure', 'script', 'div', 'table']):
+            unwanted_tag.decompose()
+
+        # 텍스트 추출 및 공백 정리
+        text = content_div.get_text(separator='\n', strip=True)
+        return text
+
+    return "Content not found."
+
+
+def create_crawler(section: news_sites.Section, seen_index: crawl_state.SeenUrlIndex = None):
+    """사이트 등록부(news_sites)의 섹션 설정으로 크롤러를 생성합니다. (수집 오케스트레이터용)"""
+    return NewsCrawlerEtnews(section.url, seen_index=seen_index)
 
 
 def main(target_section: str, base_ymd: str):
     """
     etnews 뉴스 수집 메인 배치 함수
     :param str target_section: 뉴스 수집 대상 색션 (전자, SW, IT)
-    :param str base_ymd: 뉴스 수집 기준 일자 (yyyymmdd), 뉴스 수집 기본 일자 범위는 [T-3, T]
+    :param str base_ymd: 뉴스 수집 기준 일자 (yyyymmdd), 뉴스 수집 기본 일자 범위는 [T-2, T]
     """
-    
-    section_url_dict = {
-        "전자": "https://etnews.com/news/section.html?id1=06",
-        "SW": "https://etnews.com/news/section.html?id1=04",
-        "IT": "https://etnews.com/news/section.html?id1=03",
-    }
-    
-    target_section_en_dict = {
-        "전자": "electronics",
-        "SW": "software",
-        "IT": "it",
-    }
-    
-    target_section_en = target_section_en_dict[target_section]
-    
-    ETNEWS_URL = section_url_dict[target_section]
-    
-    end_date = dt.datetime.strptime(base_ymd, "%Y%m%d")
-    end_date = kst_timezone.localize(end_date) + dt.timedelta(hours=24)
-    start_date = end_date - dt.timedelta(days=2)
-    
-    crawler = NewsCrawlerEtnews(ETNEWS_URL)
-    crawler.set_target_date_range(start_date, end_date)
-    
     try:
-        logger.info(f"--- Fetching recent articles from {ETNEWS_URL} ---")
-        articles = crawler.fetch_articles(target_page_num=4)
-        
-        if articles:
-            logger.info(f"Found {len(articles)} recent articles.")
-            for i, article in enumerate(articles):
-                logger.info(f"\n--- Article {i + 1} ---")
-                logger.info(f"Title: {article['title']}")
-                logger.info(f"URL: {article['url']}")
-                logger.info(f"Published Date: {article['published_date']}")
-        
-                content = crawler.fetch_article_content(article['url'])
-                logger.info(f"Content Snippet (first 200 chars): {content[:200]}...")
-                article['content'] = content
-                time.sleep(random.randint(1, 3))
-                
-        else:
-            logger.warning("No recent articles found or an error occurred.")
-        
-        # 뉴스 데이터 json 파일로 저장 
-        with open(f'{pjt_home_path}/data/etnews_{target_section_en}_articles.json', 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        logger.info(f"Articles saved to etnews_{target_section_en}_articles.json")
-        
+        adapter = news_sites.get_site('etnews')
+        news_crawl.crawl_section(adapter, adapter.section(target_section), base_ymd)
+
     except Exception as e:
         msg = traceback.format_exc()
         logger.error(msg)
-        sys.exit(1)    
-    
+        sys.exit(1)
+
 
 if __name__ == '__main__':
     import argparse
@@ -273,7 +298,7 @@ if __name__ == '__main__':
         "target_section",
         type=str,        
         default="전자",
-        choices=["전자", "SW", "IT",],
+        choices=news_sites.ETNEWS.section_names(),
         help="뉴스 수집 대상 색션 [%(choices)s] default=[%(default)s]",
         metavar='target_section',
         nargs='?'
@@ -1,22 +1,31 @@
 import os
 import sys
+import site
 import logging
 import traceback
 import datetime as dt
 import re
-import json
 
-from typing import List, Dict
+from typing import List, Dict, Tuple, Iterator, NamedTuple, Set
 
 import pytz
 import requests
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
 
 src_path = os.path.dirname(__file__)
 pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
 pjt_home_path = os.path.abspath(pjt_home_path)
 
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+from src.services import crawl_state
+from src.services import date_extractor
+from src.services import html_parser
+from src.services import parse_pipeline
+from src.services import header_profiles
+from src.services import news_sites
+from src.services import news_crawl
+
 # 로깅 설정
 logger = logging.getLogger(__file__)
 formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
@@ -27,17 +36,68 @@ logger.addHandler(stream_log)
 
 kst_timezone = pytz.timezone('Asia/Seoul')
 
+# 파서가 본문을 찾지 못했을 때 반환하는 문구 (FetchFailure 로 변환하여 저장/요약 대상에서 제외)
+CONTENT_FAILURE_PREFIXES = ("기사 내용을 찾을 수 없습니다.", "파싱 오류:")
+
+# 섹션별 키워드 (목록 페이지 섹션 텍스트 / 기사 페이지 meta 섹션 확인용)
+SECTION_KEYWORDS = {
+    "반도체": ["반도체", "semiconductor", "S1N2"],
+    "디스플레이": ["디스플레이", "display"],
+    "IT‧게임": ["IT‧게임", "IT·게임", "IT게임"],
+    "방산‧에너지": ["방산‧에너지", "방산·에너지", "방산에너지"],
+    "중국산업동향": ["중국산업동향", "China Industry Trends"],
+    "배터리": ["배터리", "battery", "Battery"],
+    "자동차": ["자동차", "car", "automotive"]
+}
+
+# 목록 페이지 기사 후보 요소 / 기사 링크 패턴
+_LIST_ITEM_CLASS_PATTERN = re.compile(r'article|list-item|news-item', re.I)
+_AUTO_ARTICLE_CLASS_PATTERN = re.compile(r'^auto-article auto-*')
+_ARTICLE_LINK_PATTERN = re.compile(r'/news/articleView\.html\?idxno=\d+')
+_DATE_CONTAINER_CLASS_PATTERN = re.compile(r'info|date|viewinfo|article-view-info', re.I)
+
+
+class ListItem(NamedTuple):
+    """목록 페이지에서 추출한 기사 후보 (날짜/섹션은 목록에서 찾지 못하면 None)"""
+    title: str
+    url: str
+    published_datetime: dt.datetime | None
+    section: str | None
+
+
+def _is_list_item_candidate(tag) -> bool:
+    """목록 페이지의 기사 후보 요소 (div.table-row 또는 article/list-item/news-item 클래스의 div, li) 여부"""
+    if tag.name not in ('div', 'li'):
+        return False
+    classes = tag.get('class') or []
+    if tag.name == 'div' and 'table-row' in classes:
+        return True
+    return any(_LIST_ITEM_CLASS_PATTERN.search(class_name) for class_name in classes)
+
+
+# 목록 페이지 최대 요청 수 (수집 기간이 덮이지 않아도 이 페이지 수에서 중단)
+MAX_LIST_PAGES = 10
+
 class ThelecNewsCrawler:
     """
     디일렉(thelec.kr) 뉴스 웹사이트에서 기사를 크롤링하는 클래스.
     IT·게임 섹션의 뉴스를 가져옵니다.
     """
 
-    def __init__(self, base_url: str, target_section: str = "반도체"):
+    def __init__(self, base_url: str, target_section: str = "반도체", seen_index: crawl_state.SeenUrlIndex = None):
         self.base_url = base_url
         self.target_section = target_section  # 필터링할 섹션 추가
-        self.ua = UserAgent()
+        # 이전 실행에서 수집한 기사 URL 인덱스 (None 이면 매번 전체 수집)
+        self.seen_index = seen_index
+        # 크롤러 간 공유되는 요청 헤더 프로필 풀 (User-Agent 순환)
+        self.header_pool = header_profiles.get_header_pool()
         self._update_headers()
+        # 크롤러 간 공유되는 HTTP 수집 엔진
+        self.engine = fetch_engine.get_engine()
+        self.parse_pipeline = parse_pipeline.get_parse_pipeline()
+        # 기사 페이지 파싱 결과 캐시 (URL -> BeautifulSoup), 날짜/섹션/본문 추출 시 1회만 다운로드 및 파싱
+        # 목록 필터링을 통과해 본문을 요청할 기사의 페이지만 남깁니다. (_retain_article_pages)
+        self._article_page_cache: Dict[str, BeautifulSoup] = {}
         
         self.end_date = dt.datetime.now(kst_timezone)
         self.start_date = self.end_date - dt.timedelta(days=3)
@@ -53,96 +113,65 @@ class ThelecNewsCrawler:
         logger.info(f"start_date=> {start_date}")
         logger.info(f"end_date=> {end_date}")
 
-    def _is_target_section(self, article_element) -> bool:
-        """
-        기사가 목표 섹션에 속하는지 확인합니다.
-        섹션 정보는 기사 요소와 주변 요소의 텍스트에서 찾습니다.
-        이 함수는 목록 페이지의 요소만을 기반으로 판단합니다.
-        """
+    def _is_target_section_text(self, section_text: str) -> bool:
+        """목록 페이지의 섹션 텍스트에 목표 섹션 키워드가 포함되어 있는지 확인합니다."""
         if not self.target_section:
             return True  # 섹션 필터링 없음
-            
-        text_to_check = []
-        if article_element:
-            section_tag = article_element.find('small', class_="list-section")
-            if not section_tag:
-                logger.warning(f"The article element is missing section tag: {article_element.get_text()}") 
-                return False
-            text_to_check.append(section_tag.get_text())
-        
-        section_keywords = {
-            "반도체": ["반도체", "semiconductor", "S1N2"],
-            "디스플레이": ["디스플레이", "display"],
-            "IT‧게임": ["IT‧게임", "IT·게임", "IT게임"],
-            "방산‧에너지": ["방산‧에너지", "방산·에너지", "방산에너지"],
-            "중국산업동향": ["중국산업동향", "China Industry Trends"],
-            "배터리": ["배터리", "battery", "Battery"],
-            "자동차": ["자동차", "car", "automotive"]
-        }
-        
-        target_keywords = section_keywords.get(self.target_section, [self.target_section])
-        
-        for indicator in text_to_check:
-            for keyword in target_keywords:
-                if keyword.lower() in indicator.lower():
-                    return True
+
+        target_keywords = SECTION_KEYWORDS.get(self.target_section, [self.target_section])
+        for keyword in target_keywords:
+            if keyword.lower() in section_text.lower():
+                return True
                             
         return False
 
     def _update_headers(self):
-        """랜덤한 User-Agent를 사용하여 헤더를 업데이트합니다."""
-        self.headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
+        """공유 헤더 프로필 풀에서 다음 User-Agent 의 헤더를 사용합니다."""
+        self.headers = self.header_pool.next()
 
     def _parse_date(self, datetime_str: str) -> dt.datetime:
         """
         날짜 문자열을 datetime 객체로 파싱합니다.
         디일렉 날짜 형식:YYYY-MM-DD HH:MM (예: 2025-05-29 08:52)
         """
-        try:
-            # 시간 정보가 포함된 경우
-            if ':' in datetime_str:
-                return dt.datetime.strptime(datetime_str.strip(), "%Y-%m-%d %H:%M")
-            # 날짜만 있는 경우
-            else:
-                return dt.datetime.strptime(datetime_str.strip(), "%Y-%m-%d")
-        except ValueError as e:
-            logger.error(f"Failed to parse date string '{datetime_str}': {e}")
+        published_datetime = date_extractor.THELEC_LIST_DATES.extract(datetime_str)
+        if published_datetime is None:
+            logger.error(f"Failed to parse date string '{datetime_str}'")
             return dt.datetime.min
+        return published_datetime
 
-    def _extract_date_from_element(self, element) -> str | None:
+    def _extract_date_from_element(self, element) -> dt.datetime | None:
         """
-        주어진 BeautifulSoup 요소에서 날짜 정보를 추출합니다.
-        다양한 위치에서 날짜를 찾을 수 있도록 개선합니다.
+        주어진 BeautifulSoup 요소의 텍스트에서 날짜 정보를 추출합니다. (YYYY-MM-DD HH:MM 우선, 없으면 YYYY-MM-DD)
+        하위 요소의 텍스트는 요소 전체 텍스트의 일부이므로 요소 전체 텍스트만 확인합니다.
         """
-        text = element.get_text(strip=True)
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', text)
-        if date_match:
-            return f"{date_match.group(1)} {date_match.group(2)}"
-        
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', text)
-        if date_match:
-            return date_match.group(1)
-
-        possible_date_tags = element.find_all(['span', 'div', 'p', 'em', 'td'])
-        for tag in possible_date_tags:
-            tag_text = tag.get_text(strip=True)
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', tag_text)
-            if date_match:
-                return f"{date_match.group(1)} {date_match.group(2)}"
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', tag_text)
-            if date_match:
-                return date_match.group(1)
-        
-        return None
+        return date_extractor.THELEC_LIST_DATES.extract(element.get_text(strip=True))
+
+    def _get_article_page(self, article_url: str) -> BeautifulSoup:
+        """
+        개별 기사 페이지를 다운로드하여 파싱한 결과를 반환합니다.
+        같은 URL 은 크롤러 실행 동안 한 번만 다운로드/파싱하고 캐시된 결과를 재사용합니다.
+        """
+        soup = self._article_page_cache.get(article_url)
+        if soup is not None:
+            logger.debug(f"Article page cache hit: {article_url}")
+            return soup
+
+        self._update_headers()
+        html = self.engine.fetch_text(article_url, headers=self.headers, timeout=15, encoding='utf-8',
+                                      cache_ttl=fetch_engine.ARTICLE_CACHE_TTL)
+        # 기사 페이지는 날짜/섹션/본문 추출에 함께 사용하므로 범위를 좁히지 않고 파싱합니다.
+        soup = html_parser.parse_html(html)
+        self._article_page_cache[article_url] = soup
+        return soup
+
+    def _retain_article_pages(self, article_urls: Set[str]):
+        """
+        기사 페이지 캐시에서 article_urls 이외의 페이지를 제거합니다.
+        필터링에서 제외된(섹션/기간 밖) 기사의 파싱 트리가 수집이 끝날 때까지 메모리에 남지 않도록 합니다.
+        """
+        for url in [url for url in self._article_page_cache if url not in article_urls]:
+            del self._article_page_cache[url]
 
     def _get_published_date_from_article_page(self, article_url: str) -> dt.datetime | None:
         """
@@ -150,37 +179,12 @@ class ThelecNewsCrawler:
         """
         logger.info(f"Fetching article page to extract published date: {article_url}")
         try:
-            self._update_headers()
-            response = requests.get(article_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            possible_date_containers = soup.find_all(
-                ['div', 'ul', 'span', 'p'],
-                class_=re.compile(r'info|date|viewinfo|article-view-info', re.I)
-            )
-            
-            for container in possible_date_containers:
-                text = container.get_text(strip=True)
-                date_match = re.search(r'(?:승인\s*)?(\d{4}\.\d{2}\.\d{2})\s+(\d{2}:\d{2})', text)
-                if date_match:
-                    date_str = f"{date_match.group(1).replace('.', '-')}"
-                    time_str = date_match.group(2)
-                    return self._parse_date(f"{date_str} {time_str}")
-                
-                date_match_alt = re.search(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2})', text)
-                if date_match_alt:
-                    return self._parse_date(f"{date_match_alt.group(1)} {date_match_alt.group(2)}")
-                
-                date_only_match = re.search(r'(?:승인\s*)?(\d{4}\.\d{2}\.\d{2})', text)
-                if date_only_match:
-                    date_str = f"{date_only_match.group(1).replace('.', '-')}"
-                    return self._parse_date(date_str)
+            soup = self._get_article_page(article_url)
 
-                date_only_match_alt = re.search(r'(\d{4}-\d{2}-\d{2})', text)
-                if date_only_match_alt:
-                    return self._parse_date(date_only_match_alt.group(1))
+            for container in soup.find_all(['div', 'ul', 'span', 'p'], class_=_DATE_CONTAINER_CLASS_PATTERN):
+                published_datetime = date_extractor.THELEC_ARTICLE_DATES.extract(container.get_text(strip=True))
+                if published_datetime:
+                    return published_datetime
 
             logger.warning(f"Could not find date/time on article page: {article_url}")
             return None
@@ -202,11 +206,7 @@ class ThelecNewsCrawler:
         """
         logger.debug(f"Fetching article page to extract section from meta tag: {article_url}")
         try:
-            self._update_headers()
-            response = requests.get(article_url, headers=self.headers, timeout=10) # Shorter timeout for just meta
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._get_article_page(article_url)
 
             meta_section_tag = soup.find('meta', property='article:section')
             if meta_section_tag:
@@ -228,48 +228,25 @@ class ThelecNewsCrawler:
             logger.warning(f"Error parsing {article_url} for section meta: {e}")
             return None
 
-    def _extract_section_from_page(self, soup) -> List[Dict[str, str]]:
+    def _iter_list_items(self, soup) -> Iterator[ListItem]:
         """
-        페이지에서 기사 목록을 추출하고 목표 섹션 및 설정된 일자 (디폴트 최근 3일) 이내 기사만 필터링합니다.
-        디일렉 웹사이트의 HTML 구조를 기반으로 기사를 찾습니다.
+        목록 페이지를 한 번 순회하며 기사 후보 요소에서 (제목, URL, 날짜, 섹션) 을 추출합니다.
+        후보 요소는 문서 순서대로 한 번만 방문하고, 같은 기사 URL 은 처음 나온 요소만 사용합니다.
+        (중첩된 후보 요소가 같은 기사를 가리키는 경우 포함)
         """
-        articles = []
-        
-        potential_article_elements = []
-        article_rows = soup.find_all('div', class_="table-row")
-        if article_rows:
-            potential_article_elements.extend(article_rows)
-        list_items = soup.find_all(['div', 'li'], class_=re.compile(r'article|list-item|news-item', re.I))
-        if list_items:
-            potential_article_elements.extend(list_items)
-
-        seen_elements_text = set()
-        unique_potential_articles = []
-        for element in potential_article_elements:
-            element_str = str(element)
-            if element_str not in seen_elements_text:
-                seen_elements_text.add(element_str)
-                unique_potential_articles.append(element)
-        
-        logger.info(f"Total unique potential article elements to process: {len(unique_potential_articles)}")
+        seen_urls = set()
+        candidates = soup.find_all(_is_list_item_candidate)
+        logger.info(f"Total potential article elements to process: {len(candidates)}")
 
-        for element in unique_potential_articles:
-            
-            pattern_match = re.compile(r'^auto-article auto-*')
+        for element in candidates:
             # To-Do: 못찾는듯... 추가 조치 필요
-            matching_divs_find_all = element.find_all('div', class_=pattern_match)
-            # logger.info(f"{matching_divs_find_all}")
-            if matching_divs_find_all:
+            if element.find('div', class_=_AUTO_ARTICLE_CLASS_PATTERN):
                 logger.debug(f"Skipping article (class name pattern is auto-article auto-*): {element.get_text()}")
                 continue
-            
-            article_link = element.find('a', href=re.compile(r'/news/articleView\.html\?idxno=\d+'))
-            
+
+            article_link = element.find('a', href=_ARTICLE_LINK_PATTERN)
             if not article_link:
-                if element.name == 'a' and re.match(r'/news/articleView\.html\?idxno=\d+', element.get('href', '')):
-                    article_link = element
-                else:
-                    continue
+                continue
 
             title = article_link.get_text(strip=True)
             if not title or len(title) < 5:
@@ -280,39 +257,53 @@ class ThelecNewsCrawler:
                 article_url = 'https://www.thelec.kr' + href
             else:
                 article_url = href
+            if article_url in seen_urls:
+                continue
+            seen_urls.add(article_url)
 
-            published_datetime = None
-            date_text_from_list = self._extract_date_from_element(element)
-            
-            if date_text_from_list:
-                published_datetime = self._parse_date(date_text_from_list)
-            else:
+            section_tag = element.find('small', class_="list-section")
+            section = section_tag.get_text() if section_tag else None
+            yield ListItem(title, article_url, self._extract_date_from_element(element), section)
+
+    def _extract_section_from_page(self, soup) -> Tuple[List[Dict[str, str]], dt.datetime | None]:
+        """
+        페이지에서 기사 목록을 추출하고 목표 섹션 및 설정된 일자 (디폴트 최근 3일) 이내 기사만 필터링합니다.
+        디일렉 웹사이트의 HTML 구조를 기반으로 기사를 찾습니다.
+        :return: (필터링된 기사 목록, 페이지에서 가장 오래된 기사 일시 - 날짜를 찾은 기사가 없으면 None)
+        """
+        articles = []
+        oldest_datetime = None
+
+        for title, article_url, published_datetime, section in self._iter_list_items(soup):
+
+            if not published_datetime:
                 published_datetime = self._get_published_date_from_article_page(article_url)
 
             if not published_datetime:
                 logger.debug(f"Skipping article (no date found after all attempts): {title}")
                 continue
 
+            # 섹션 확인(기사 페이지 요청이 필요할 수 있음) 전에 기간부터 확인합니다.
+            published_datetime = kst_timezone.localize(published_datetime)
+            if oldest_datetime is None or published_datetime < oldest_datetime:
+                oldest_datetime = published_datetime
+            if published_datetime < self.start_date or published_datetime > self.end_date:
+                logger.debug(f"Skipping old article: {title} ({published_datetime})")
+                continue
+
             # --- SECTION FILTERING LOGIC ---
             # If a target section is specified, perform filtering
             if self.target_section:
                 # 1. Try to confirm section using existing text-based method (fast)
-                is_section_match_from_list = self._is_target_section(element)
+                if section is None:
+                    logger.warning(f"The article element is missing section tag: {title}")
+                is_section_match_from_list = section is not None and self._is_target_section_text(section)
 
                 # 2. If text-based check fails, try meta tag from article page (more reliable, but involves extra request)
                 if not is_section_match_from_list:
                     meta_section = self._get_section_from_article_page(article_url)
                     
-                    section_keywords_map = {
-                        "반도체": ["반도체", "semiconductor", "S1N2"],
-                        "디스플레이": ["디스플레이", "display"],
-                        "IT‧게임": ["IT‧게임", "IT·게임", "IT게임"],
-                        "방산‧에너지": ["방산‧에너지", "방산·에너지", "방산에너지"],
-                        "중국산업동향": ["중국산업동향", "China Industry Trends"],
-                        "배터리": ["배터리", "battery", "Battery"],
-                        "자동차": ["자동차", "car", "automotive"]
-                    }
-                    target_keywords = section_keywords_map.get(self.target_section, [self.target_section])
+                    target_keywords = SECTION_KEYWORDS.get(self.target_section, [self.target_section])
                     
                     found_in_meta = False
                     if meta_section:
@@ -330,26 +321,23 @@ class ThelecNewsCrawler:
                 # If is_section_match_from_list was False AND meta_section check failed, we continue (skip).
                 # If is_section_match_from_list was False AND meta_section check passed, we proceed.
 
-            # Check if the article is within from start_date to end_date
-            published_datetime = kst_timezone.localize(published_datetime)
-            if published_datetime >= self.start_date and published_datetime <= self.end_date:
-                articles.append({
-                    "title": title,
-                    "url": article_url,
-                    "published_date": published_datetime.strftime('%Y-%m-%d'),
-                    "author": "",
-                    "content": ""
-                })
-                logger.info(f"Found target section article: {title}")
-            else:
-                logger.debug(f"Skipping old article: {title} ({published_datetime})")
+            articles.append({
+                "title": title,
+                "url": article_url,
+                "published_date": published_datetime.strftime('%Y-%m-%d'),
+                "author": "",
+                "content": ""
+            })
+            logger.info(f"Found target section article: {title}")
         
-        return articles
+        return articles, oldest_datetime
 
-    def fetch_articles(self, pages: int = 3) -> List[Dict[str, str]]:
+    def fetch_articles(self, max_pages: int = MAX_LIST_PAGES) -> List[Dict[str, str]]:
         """
         뉴스 목록 페이지에서 기사 제목, URL, 날짜를 가져와 최근 7일간의 뉴스만 필터링합니다.
         디일렉의 HTML 구조에 맞춰져 있으며, 특정 섹션만 필터링합니다.
+        목록은 최신순이므로 페이지의 가장 오래된 기사가 start_date 이전이면 다음 페이지를 요청하지 않고,
+        수집 기간이 덮일 때까지 (최대 max_pages 페이지) 다음 페이지를 요청합니다.
         """
         news_list = []
         
@@ -359,24 +347,31 @@ class ThelecNewsCrawler:
         logger.info(f"Fetching articles from {self.base_url}")
         logger.info(f"Filtering for section: {self.target_section} published from {str_start_date} to {str_end_date}")
 
-        for page in range(1, pages + 1):
+        for page in range(1, max_pages + 1):
+            if 'page=' in self.base_url:
+                url = re.sub(r'page=\d+', f'page={page}', self.base_url)
+            else:
+                url = self.base_url + (f"&page={page}" if "?" in self.base_url else f"?page={page}")
+            
             try:
-                if 'page=' in self.base_url:
-                    url = re.sub(r'page=\d+', f'page={page}', self.base_url)
-                else:
-                    url = self.base_url + (f"&page={page}" if "?" in self.base_url else f"?page={page}")
-                
                 logger.info(f"Fetching page {page}: {url}")
                 
                 self._update_headers()
-                
-                response = requests.get(url, headers=self.headers, timeout=15)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
-                soup = BeautifulSoup(response.text, 'html.parser')
+                html = self.engine.fetch_text(url, headers=self.headers, timeout=15, encoding='utf-8')
+                soup = html_parser.parse_html(html, parse_only=html_parser.THELEC_LIST)
 
-                section_articles = self._extract_section_from_page(soup)
+                section_articles, oldest_datetime = self._extract_section_from_page(soup)
                 news_list.extend(section_articles)
+                self._retain_article_pages({article['url'] for article in news_list})
+                
+                if oldest_datetime is None:
+                    logger.info(f"No dated articles on page {page}. Stop fetching next pages.")
+                    break
+                if oldest_datetime < self.start_date:
+                    logger.info(f"Page {page} reaches before start_date ({oldest_datetime}). Stop fetching next pages.")
+                    break
+                if page == max_pages:
+                    logger.warning(f"Reached max_pages ({max_pages}) before covering start_date {str_start_date}")
                 
             except requests.RequestException as e:
                 msg = traceback.format_exc()
@@ -397,94 +392,133 @@ class ThelecNewsCrawler:
                 unique_articles.append(article)
         
         logger.info(f"Found {len(unique_articles)} unique articles in target section")
+        
+        # 이전 실행에서 수집한 기사는 본문을 인덱스에서 채워 본문 요청을 생략합니다.
+        if self.seen_index is not None:
+            self.seen_index.fill_known_articles(unique_articles)
+        # 본문을 인덱스에서 채운 기사는 본문 요청을 하지 않으므로 캐시된 페이지도 제거합니다.
+        self._retain_article_pages({article['url'] for article in unique_articles if not article.get('content')})
         return unique_articles
 
-    def fetch_article_content(self, article_url: str) -> str:
+    def fetch_article_content(self, article_url: str) -> 'str | fetch_engine.FetchFailure':
         """
         개별 기사의 전체 내용을 가져옵니다.
         디일렉의 HTML 구조에 맞춰져 있습니다.
         """
-        logger.info(f"Fetching content for article: {article_url}")
+        return self.fetch_article_contents([article_url])[0]
+
+    def fetch_article_contents(self, article_urls: List[str]) -> List['str | fetch_engine.FetchFailure']:
+        """
+        여러 기사의 전체 내용을 가져옵니다. 다운로드는 공유 수집 엔진에서 동시에, 본문 파싱은 파서 프로세스 풀에서 수행합니다.
+        결과는 article_urls 순서를 유지하며, 재시도 후에도 본문을 얻지 못한 기사는 FetchFailure 로 반환합니다.
+        """
+        # 목록 필터링 단계에서 이미 파싱한 기사 페이지는 다시 다운로드하지 않습니다.
+        # 본문 추출은 파싱 트리를 변경하므로 캐시에서 꺼내어 사용합니다.
+        cached_pages = {url: self._article_page_cache.pop(url) for url in article_urls if url in self._article_page_cache}
+        urls_to_fetch = [url for url in article_urls if url not in cached_pages]
+        logger.info(f"Fetching content for {len(article_urls)} articles ({len(cached_pages)} from article page cache)")
         
-        try:
+        results = {}
+        if urls_to_fetch:
             self._update_headers()
-            
-            response = requests.get(article_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            content_selectors = [
-                'div.article-content',
-                'div.news-content', 
-                'div.view-content',
-                'div#article-content',
-                'div.article_content',
-                'div.articleContent',
-                'div[id*="content"]',
-                'div[class*="content"]',
-                'div.user-content'
-            ]
-
-            content_div = None
-            for selector in content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
+            fetched = self.parse_pipeline.fetch_and_parse_many(urls_to_fetch, parse_article_html,
+                                                               headers=self.headers, timeout=15, encoding='utf-8',
+                                                               cache_ttl=fetch_engine.ARTICLE_CACHE_TTL)
+            results = dict(zip(urls_to_fetch, fetched))
+
+        contents = []
+        for article_url in article_urls:
+            if article_url in cached_pages:
+                result = parse_article_content(cached_pages[article_url], article_url)
+            else:
+                result = results[article_url]
+            contents.append(fetch_engine.as_fetch_result(article_url, result, CONTENT_FAILURE_PREFIXES))
+        return contents
+
+
+def parse_article_content(soup: BeautifulSoup, article_url: str) -> str:
+    """
+    파싱된 기사 페이지에서 본문 텍스트를 추출합니다.
+    """
+    try:
+        content_selectors = [
+            'div.article-content',
+            'div.news-content', 
+            'div.view-content',
+            'div#article-content',
+            'div.article_content',
+            'div.articleContent',
+            'div[id*="content"]',
+            'div[class*="content"]',
+            'div.user-content'
+        ]
+
+        content_div = None
+        for selector in content_selectors:
+            content_div = soup.select_one(selector)
+            if content_div:
+                break
+
+        if not content_div:
+            content_div = soup.find('article') or soup.find('main')
+
+        if not content_div:
+            potential_content = soup.find_all('div', string=re.compile(r'.{100,}'))
+            if potential_content:
+                content_div = max(potential_content, key=lambda x: len(x.get_text()))
+
+        if content_div:
+            for unwanted in content_div(["script", "style", "nav", "header", "footer", 
+                                         "aside", "figure", "figcaption", "iframe", "img", "a"]):
+                unwanted.extract()
+
+            for ad_class in ['ad', 'advertisement', 'related', 'recommend', 'popular', 'copyright']: 
+                for element in content_div.find_all(attrs={'class': re.compile(ad_class, re.I)}):
+                    element.extract()
+
+            for heading in content_div.find_all(['h2', 'h3', 'h4']):
+                heading_text = heading.get_text(strip=True)
+                if any(keyword in heading_text for keyword in ['관련기사', '관련 기사', '추천기사', '인기기사', '저작권']): 
+                    current = heading
+                    while current:
+                        next_sibling = current.next_sibling
+                        current.extract()
+                        current = next_sibling
                     break
 
-            if not content_div:
-                content_div = soup.find('article') or soup.find('main')
+            paragraphs = content_div.find_all(['p', 'div', 'span'])
+            content_parts = []
+            for p in paragraphs:
+                text = p.get_text(separator=' ', strip=True)
+                if text and len(text) > 10:
+                    content_parts.append(text)
 
-            if not content_div:
-                potential_content = soup.find_all('div', string=re.compile(r'.{100,}'))
-                if potential_content:
-                    content_div = max(potential_content, key=lambda x: len(x.get_text()))
+            content = '\n'.join(content_parts)
+            content = re.sub(r'\n\s*\n', '\n\n', content)
 
-            if content_div:
-                for unwanted in content_div(["script", "style", "nav", "header", "footer", 
-                                             "aside", "figure", "figcaption", "iframe", "img", "a"]):
-                    unwanted.extract()
-
-                for ad_class in ['ad', 'advertisement', 'related', 'recommend', 'popular', 'copyright']: 
-                    for element in content_div.find_all(attrs={'class': re.compile(ad_class, re.I)}):
-                        element.extract()
-
-                for heading in content_div.find_all(['h2', 'h3', 'h4']):
-                    heading_text = heading.get_text(strip=True)
-                    if any(keyword in heading_text for keyword in ['관련기사', '관련 기사', '추천기사', '인기기사', '저작권']): 
-                        current = heading
-                        while current:
-                            next_sibling = current.next_sibling
-                            current.extract()
-                            current = next_sibling
-                        break
-
-                paragraphs = content_div.find_all(['p', 'div', 'span'])
-                content_parts = []
-                for p in paragraphs:
-                    text = p.get_text(separator=' ', strip=True)
-                    if text and len(text) > 10:
-                        content_parts.append(text)
-
-                content = '\n'.join(content_parts)
-                content = re.sub(r'\n\s*\n', '\n\n', content)
-                
-                logger.info(f"Successfully fetched content for {article_url}")
-                return content.strip()
-            else:
-                logger.warning(f"Could not find article content for {article_url}")
-                return "기사 내용을 찾을 수 없습니다."
-                
-        except requests.RequestException as e:
-            msg = traceback.format_exc()
-            logger.error(msg)
-            logger.error(f"Network error fetching {article_url}: {e}")
-            return f"네트워크 오류: {e}"
-        except Exception as e:
-            msg = traceback.format_exc()
-            logger.error(msg)
-            logger.error(f"Error parsing content from {article_url}: {e}")
-            return f"파싱 오류: {e}"
+            logger.info(f"Successfully fetched content for {article_url}")
+            return content.strip()
+        else:
+            logger.warning(f"Could not find article content for {article_url}")
+            return "기사 내용을 찾을 수 없습니다."
+
+    except Exception as e:
+        msg = traceback.format_exc()
+        logger.error(msg)
+        logger.error(f"Error parsing content from {article_url}: {e}")
+        return f"파싱 오류: {e}"
+
+
+def parse_article_html(html: str, article_url: str) -> str:
+    """
+    기사 페이지 HTML 을 파싱하여 본문 텍스트를 추출합니다. (파싱 파이프라인용)
+    """
+    return parse_article_content(html_parser.parse_html(html), article_url)
+
+
+def create_crawler(section: news_sites.Section, seen_index: crawl_state.SeenUrlIndex = None):
+    """사이트 등록부(news_sites)의 섹션 설정으로 크롤러를 생성합니다. (수집 오케스트레이터용)"""
+    return ThelecNewsCrawler(section.url, target_section=section.name, seen_index=seen_index)
 
 
 def main(target_section: str, base_ymd: str):
@@ -493,59 +527,13 @@ def main(target_section: str, base_ymd: str):
     :param str target_section: 뉴스 수집 대상 색션 (반도체, 자동차, 배터리)
     :param str base_ymd: 뉴스 수집 기준 일자 (yyyymmdd), 뉴스 수집 기본 일자 범위는 [T-3, T]
     """
-    
-    section_url_dict = {
-       "반도체": "https://www.thelec.kr/news/articleList.html?sc_section_code=S1N2&view_type=sm",
-       "자동차": "https://www.thelec.kr/news/articleList.html?sc_section_code=S1N13&view_type=sm",
-       "배터리": "https://www.thelec.kr/news/articleList.html?sc_section_code=S1N9&view_type=sm", 
-    }
-    
-    target_section_en_dict = {
-        "반도체": "semiconductor",
-        "자동차": "automotive",
-        "배터리": "battery",
-    }
-    
     try:
-        target_section_en = target_section_en_dict[target_section]
-        
-        THELEC_URL = section_url_dict[target_section]
-        
-        end_date = dt.datetime.strptime(base_ymd, "%Y%m%d")
-        end_date = kst_timezone.localize(end_date) + dt.timedelta(hours=24)
-        start_date = end_date - dt.timedelta(days=3)
-        
-        # 타겟 섹션만 크롤링하도록 설정
-        crawler = ThelecNewsCrawler(THELEC_URL, target_section=target_section)
-        crawler.set_target_date_range(start_date, end_date)
-
-        logger.info(f"--- Fetching recent {target_section_en} articles from {THELEC_URL} ---")
-        articles = crawler.fetch_articles(pages=2)
-
-        if articles:
-            logger.info(f"Found {len(articles)} recent semiconductor articles.")
-            for i, article in enumerate(articles):
-                logger.info(f"\n--- Article {i + 1} ---")
-                logger.info(f"Title: {article['title']}")
-                logger.info(f"URL: {article['url']}")
-                logger.info(f"Published Date: {article['published_date']}")        
-                
-                content = crawler.fetch_article_content(article['url'])
-                logger.info(f"Content Snippet (first 300 chars): {content[:300]}...")
-                article['content'] = content
-                
-        else:
-            logger.warning("No recent semiconductor articles found or an error occurred.")
+        adapter = news_sites.get_site('thelec')
+        news_crawl.crawl_section(adapter, adapter.section(target_section), base_ymd)
 
-        
-        # 뉴스 데이터 json 파일로 저장    
-        with open(f'{pjt_home_path}/data/thelec_{target_section_en}_articles.json', 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        logger.info(f"Articles saved to thelec_{target_section_en}_articles.json")
-    
     except Exception as e:
-        err_msg = traceback.format_exc()
-        logger.error(err_msg)
+        msg = traceback.format_exc()
+        logger.error(msg)
         sys.exit(1)
 
 
@@ -561,7 +549,7 @@ if __name__ == "__main__":
         "target_section",
         type=str,        
         default="반도체",
-        choices=["반도체", "자동차", "배터리"],
+        choices=news_sites.THELEC.section_names(),
         help="뉴스 수집 대상 색션 [%(choices)s] default=[%(default)s]",
         metavar='target_section',
         nargs='?'
@@ -1,22 +1,29 @@
 import os
 import sys
+import site
 import logging
 import traceback
-import re
-import json
 import datetime as dt
 
 from typing import List, Dict
 
 import pytz
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
 
 src_path = os.path.dirname(__file__)
 pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
 pjt_home_path = os.path.abspath(pjt_home_path)
 
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+from src.services import crawl_state
+from src.services import date_extractor
+from src.services import html_parser
+from src.services import parse_pipeline
+from src.services import header_profiles
+from src.services import news_sites
+from src.services import news_crawl
+
 # 로깅 설정
 logger = logging.getLogger(__file__)
 formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
@@ -27,17 +34,25 @@ logger.addHandler(stream_log)
 
 kst_timezone = pytz.timezone('Asia/Seoul')
 
+# 파서가 본문을 찾지 못했을 때 반환하는 문구 (FetchFailure 로 변환하여 저장/요약 대상에서 제외)
+CONTENT_FAILURE_PREFIXES = ("기사 내용을 찾을 수 없습니다.",)
+
 class NewsCrawler_ZDNet:
     """
     지정된 뉴스 웹사이트에서 기사를 크롤링하는 클래스.
     현재 ZDNet Korea의 반도체 뉴스 섹션에 맞춰져 있습니다.
     """
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, seen_index: crawl_state.SeenUrlIndex = None):
         self.base_url = base_url
-        # 랜덤 User-Agent 생성
-        self.ua = UserAgent()
+        # 이전 실행에서 수집한 기사 URL 인덱스 (None 이면 매번 전체 수집)
+        self.seen_index = seen_index
+        # 크롤러 간 공유되는 요청 헤더 프로필 풀 (User-Agent 순환)
+        self.header_pool = header_profiles.get_header_pool()
         self._update_headers()
+        # 크롤러 간 공유되는 HTTP 수집 엔진
+        self.engine = fetch_engine.get_engine()
+        self.parse_pipeline = parse_pipeline.get_parse_pipeline()
         
         self.end_date = dt.datetime.now(kst_timezone)
         self.start_date = self.end_date - dt.timedelta(days=3)
@@ -54,40 +69,25 @@ class NewsCrawler_ZDNet:
         logger.info(f"end_date=> {end_date}")
         
     def _update_headers(self):
-        """랜덤한 User-Agent를 사용하여 헤더를 업데이트합니다."""
-        self.headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
+        """공유 헤더 프로필 풀에서 다음 User-Agent 의 헤더를 사용합니다."""
+        self.headers = self.header_pool.next()
 
     def _parse_date(self, datetime_str: str) -> dt.datetime:
         """
         날짜 문자열을 datetime 객체로 파싱합니다.
         ZDNet 날짜 형식: YYYY.MM.DD AM HH:MM  (예: 2025.05.23 AM 11:22)
         """
-        try:
-            return dt.datetime.strptime(datetime_str, "%Y.%m.%d %p %I:%M")
-        except ValueError as e:
-            logger.error(f"Failed to parse date string '{datetime_str}': {e}")
+        published_datetime = date_extractor.ZDNET_LIST_DATES.extract(datetime_str)
+        if published_datetime is None:
+            logger.error(f"Failed to parse date string '{datetime_str}'")
             return dt.datetime.min  # 파싱 실패 시 매우 오래된 날짜 반환하여 필터링되도록 함
+        return published_datetime
         
     def _parse_date_from_link(self, article_link: str):
-        # 정규 표현식을 사용하여 숫자 부분 추출
-        match = re.search(r'no=(\d+)', article_link)
-
-        if match:
-            # 추출된 숫자 문자열
-            datetime_str = match.group(1)
-            # datetime 객체로 파싱
-            # %Y: 년도 (4자리), %m: 월 (2자리), %d: 일 (2자리)
-            # %H: 시 (24시간 형식), %M: 분 (2자리), %S: 초 (2자리)
-            datetime_object = dt.datetime.strptime(datetime_str, '%Y%m%d%H%M%S')
+        # 기사 번호(no=YYYYmmddHHMMSS)에서 등록 일시 추출
+        datetime_object = date_extractor.ZDNET_LINK_DATES.extract(article_link)
+
+        if datetime_object:
             return datetime_object
         else:
             logger.error(f"Failed to parse article_link: '{article_link}' ....")
@@ -105,9 +105,13 @@ class NewsCrawler_ZDNet:
         
         logger.info(f"Fetching articles from {self.base_url}published from {str_start_date} to {str_end_date}")
 
-        response = requests.get(self.base_url, headers=self.headers, timeout=10)
-        response.raise_for_status()  # HTTP 오류가 발생하면 예외 발생
-        soup = BeautifulSoup(response.text, 'html.parser')
+        try:
+            html = self.engine.fetch_text(self.base_url, headers=self.headers, timeout=10)
+        except requests.RequestException as e:
+            # 재시도 후에도 목록 페이지를 받지 못하면 이번 실행은 빈 목록으로 처리합니다.
+            logger.error(f"Error fetching list page {self.base_url}: {e!r}")
+            return news_list
+        soup = html_parser.parse_html(html, parse_only=html_parser.ZDNET_LIST)
 
         # ZDNet 뉴스 목록 컨테이너 (예시 CSS 선택자, 실제 웹사이트 검사 필요)
         top_news = soup.find_all('div', class_='top_news')
@@ -217,139 +221,113 @@ class NewsCrawler_ZDNet:
                 })
             else:
                 logger.debug(f"Skipping old article: {title} ({published_datetime})")
+        
+        # 이전 실행에서 수집한 기사는 본문을 인덱스에서 채워 본문 요청을 생략합니다.
+        if self.seen_index is not None:
+            self.seen_index.fill_known_articles(news_list)
             
         return news_list
 
-    def fetch_article_content(self, article_url: str) -> str:
+    def fetch_article_content(self, article_url: str) -> 'str | fetch_engine.FetchFailure':
         """
         개별 기사의 전체 내용을 가져옵니다.
         ZDNet Korea의 HTML 구조에 맞춰져 있습니다.
         """
-        logger.info(f"Fetching content for article: {article_url}")
-        try:
-            response = requests.get(article_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-        except requests.exceptions.Timeout:
-            logger.warning(f"Timeout occurred while fetching content for {article_url}")
-            return "타임아웃으로 기사 내용을 찾을 수 없습니다."
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 기사 내용이 담긴 div/p 태그를 찾습니다. 실제 선택자로 변경 필요
-        # ZDNet은 보통 'article_view_content' 같은 클래스를 사용합니다.
-        content_div = soup.select_one('#articleBody')  # 실제 선택자로 변경 필요
-        if content_div is None: content_div = soup.find('div', class_='sub_view_cont')  # content 없는 경우 추가 탐색
-
-        if content_div:
-            # 불필요한 태그 제거 (예: 광고, 이미지 캡션, 기자 정보 등)
-            for script_or_style in content_div(
-                    ["script", "style", "figure", "figcaption", "span.writer", "div.ad_area"]):
-                script_or_style.extract()
-                
-            # 관련 기사 내용 제거
-            # 1. h2 태그 중 "관련기사" 텍스트를 포함한 요소와 그 이후 내용 제거
-            h2_tags = content_div.find_all('h2')
-            for h2 in h2_tags:
-                h2_text = h2.get_text(strip=True)
-                if '관련기사' in h2_text or '관련 기사' in h2_text:
-                    # h2 태그와 그 이후의 모든 형제 요소들을 제거
-                    current = h2
-                    while current:
-                        next_sibling = current.next_sibling
-                        current.extract()
-                        current = next_sibling
-                    break
-
-            # 2. div class="news_box connect" 요소 제거
-            related_news_divs = content_div.find_all('div', class_=['news_box', 'connect'])
-            for div in related_news_divs:
-                div.extract()
-
-            # 3. div class="news_box connect" (클래스가 함께 있는 경우) 제거
-            related_news_combined = content_div.find_all('div', class_='news_box connect')
-            for div in related_news_combined:
-                div.extract()
-
-            # 4. 추가적인 관련 기사 섹션 제거 (다양한 패턴 대응)
-            # "관련기사", "추천기사", "인기기사" 등의 텍스트를 포함한 div 제거
-            related_keywords = ['관련기사', '관련 기사', '추천기사', '추천 기사', '인기기사', '인기 기사', '더보기']
-            all_divs = content_div.find_all('div')
-            for div in all_divs:
-                div_text = div.get_text(strip=True)
-                if any(keyword in div_text for keyword in related_keywords):
-                    # 해당 div가 관련 기사 섹션인지 확인 (짧은 텍스트이거나 링크가 많은 경우)
-                    if len(div_text) < 100 or len(div.find_all('a')) > 2:
-                        div.extract()
-
-            paragraphs = content_div.find_all(['p', 'div', 'h1', 'h2', 'h3', 'li'])  # 텍스트 추출할 태그 지정
-            content = "\n".join(
-                [p.get_text(separator=' ', strip=True) for p in paragraphs if p.get_text(strip=True)])
-            logger.info(f"Successfully fetched content for {article_url}")
-            return content.strip()
-        else:
-            logger.warning(
-                f"Could not find article content with selector '#article_view_content' for {article_url}")
-            return "기사 내용을 찾을 수 없습니다."
-        
+        return self.fetch_article_contents([article_url])[0]
+
+    def fetch_article_contents(self, article_urls: List[str]) -> List['str | fetch_engine.FetchFailure']:
+        """
+        여러 기사의 전체 내용을 가져옵니다. 다운로드는 공유 수집 엔진에서 동시에, 본문 파싱은 파서 프로세스 풀에서 수행합니다.
+        결과는 article_urls 순서를 유지하며, 재시도 후에도 본문을 얻지 못한 기사는 FetchFailure 로 반환합니다.
+        """
+        logger.info(f"Fetching content for {len(article_urls)} articles")
+        results = self.parse_pipeline.fetch_and_parse_many(article_urls, parse_article_content,
+                                                           headers=self.headers, timeout=10,
+                                                           cache_ttl=fetch_engine.ARTICLE_CACHE_TTL)
+
+        return [fetch_engine.as_fetch_result(article_url, result, CONTENT_FAILURE_PREFIXES)
+                for article_url, result in zip(article_urls, results)]
+
+
+def parse_article_content(html: str, article_url: str) -> str:
+    """
+    기사 페이지 HTML 에서 본문 텍스트를 추출합니다.
+    """
+    # 본문(#articleBody)이 없는 페이지는 전체를 다시 파싱해 대체 선택자(div.sub_view_cont)를 찾습니다.
+    soup = html_parser.parse_html(html, parse_only=html_parser.ZDNET_ARTICLE, fallback_to_full=True)
+
+    # 기사 내용이 담긴 div/p 태그를 찾습니다. 실제 선택자로 변경 필요
+    # ZDNet은 보통 'article_view_content' 같은 클래스를 사용합니다.
+    content_div = soup.select_one('#articleBody')  # 실제 선택자로 변경 필요
+    if content_div is None: content_div = soup.find('div', class_='sub_view_cont')  # content 없는 경우 추가 탐색
+
+    if content_div:
+        # 불필요한 태그 제거 (예: 광고, 이미지 캡션, 기자 정보 등)
+        for script_or_style in content_div(
+                ["script", "style", "figure", "figcaption", "span.writer", "div.ad_area"]):
+            script_or_style.extract()
+
+        # 관련 기사 내용 제거
+        # 1. h2 태그 중 "관련기사" 텍스트를 포함한 요소와 그 이후 내용 제거
+        h2_tags = content_div.find_all('h2')
+        for h2 in h2_tags:
+            h2_text = h2.get_text(strip=True)
+            if '관련기사' in h2_text or '관련 기사' in h2_text:
+                # h2 태그와 그 이후의 모든 형제 요소들을 제거
+                current = h2
+                while current:
+                    next_sibling = current.next_sibling
+                    current.extract()
+                    current = next_sibling
+                break
+
+        # 2. div class="news_box connect" 요소 제거
+        related_news_divs = content_div.find_all('div', class_=['news_box', 'connect'])
+        for div in related_news_divs:
+            div.extract()
+
+        # 3. div class="news_box connect" (클래스가 함께 있는 경우) 제거
+        related_news_combined = content_div.find_all('div', class_='news_box connect')
+        for div in related_news_combined:
+            div.extract()
+
+        # 4. 추가적인 관련 기사 섹션 제거 (다양한 패턴 대응)
+        # "관련기사", "추천기사", "인기기사" 등의 텍스트를 포함한 div 제거
+        related_keywords = ['관련기사', '관련 기사', '추천기사', '추천 기사', '인기기사', '인기 기사', '더보기']
+        all_divs = content_div.find_all('div')
+        for div in all_divs:
+            div_text = div.get_text(strip=True)
+            if any(keyword in div_text for keyword in related_keywords):
+                # 해당 div가 관련 기사 섹션인지 확인 (짧은 텍스트이거나 링크가 많은 경우)
+                if len(div_text) < 100 or len(div.find_all('a')) > 2:
+                    div.extract()
+
+        paragraphs = content_div.find_all(['p', 'div', 'h1', 'h2', 'h3', 'li'])  # 텍스트 추출할 태그 지정
+        content = "\n".join(
+            [p.get_text(separator=' ', strip=True) for p in paragraphs if p.get_text(strip=True)])
+        logger.info(f"Successfully fetched content for {article_url}")
+        return content.strip()
+    else:
+        logger.warning(
+            f"Could not find article content with selector '#article_view_content' for {article_url}")
+        return "기사 내용을 찾을 수 없습니다."
+
+
+def create_crawler(section: news_sites.Section, seen_index: crawl_state.SeenUrlIndex = None):
+    """사이트 등록부(news_sites)의 섹션 설정으로 크롤러를 생성합니다. (수집 오케스트레이터용)"""
+    return NewsCrawler_ZDNet(section.url, seen_index=seen_index)
+
+
 def main(target_section: str, base_ymd: str):
     """
     zdnet 뉴스 수집 메인 배치 함수
     :param str target_section: 뉴스 수집 대상 색션 (반도체, 자동차, 배터리, 인공지능, 컴퓨팅)
     :param str base_ymd: 뉴스 수집 기준 일자 (yyyymmdd), 뉴스 수집 기본 일자 범위는 [T-3, T]
     """
-    
-    section_url_dict = {
-        "반도체": "https://zdnet.co.kr/news/?lstcode=0050",
-        "자동차": "https://zdnet.co.kr/news/?lstcode=0057&page=1",
-        "배터리": "https://zdnet.co.kr/newskey/?lstcode=%EB%B0%B0%ED%84%B0%EB%A6%AC",
-        "인공지능": "https://zdnet.co.kr/newskey/?lstcode=%EC%9D%B8%EA%B3%B5%EC%A7%80%EB%8A%A5",
-        "컴퓨팅": "https://zdnet.co.kr/news/?lstcode=0020&page=1",
-    }
-    
-    target_section_en_dict = {
-        "반도체": "semiconductor",
-        "자동차": "automotive",
-        "배터리": "battery",
-        "인공지능": "ai",
-        "컴퓨팅": "computing",
-    }
-    
-    target_section_en = target_section_en_dict[target_section]
-    
-    ZDNET_URL = section_url_dict[target_section]
-    
-    end_date = dt.datetime.strptime(base_ymd, "%Y%m%d")
-    end_date = kst_timezone.localize(end_date) + dt.timedelta(hours=24)
-    start_date = end_date - dt.timedelta(days=3)
-    
-    crawler = NewsCrawler_ZDNet(ZDNET_URL)
-    crawler.set_target_date_range(start_date, end_date)
-    
     try:
-        logger.info(f"--- Fetching recent articles from {ZDNET_URL} ---")
-        articles = crawler.fetch_articles()
-
-        if articles:
-            logger.info(f"Found {len(articles)} recent articles.")
-            for i, article in enumerate(articles):
-                logger.info(f"\n--- Article {i + 1} ---")
-                logger.info(f"Title: {article['title']}")
-                logger.info(f"URL: {article['url']}")
-                logger.info(f"Published Date: {article['published_date']}")
-        
-                content = crawler.fetch_article_content(article['url'])
-                logger.info(f"Content Snippet (first 200 chars): {content[:200]}...")
-                article['content'] = content
-                
-        else:
-            logger.warning("No recent articles found or an error occurred.")
-            
-        # 뉴스 데이터 json 파일로 저장 
-        with open(f'{pjt_home_path}/data/zdnet_{target_section_en}_articles.json', 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        logger.info(f"Articles saved to zdnet_{target_section_en}_articles.json")
-        
-        
+        adapter = news_sites.get_site('zdnet')
+        news_crawl.crawl_section(adapter, adapter.section(target_section), base_ymd)
+
     except Exception as e:
         msg = traceback.format_exc()
         logger.error(msg)
@@ -368,7 +346,7 @@ if __name__ == "__main__":
         "target_section",
         type=str,        
         default="반도체",
-        choices=["반도체", "자동차", "배터리", "인공지능", "컴퓨팅"],
+        choices=news_sites.ZDNET.section_names(),
         help="뉴스 수집 대상 색션 [%(choices)s] default=[%(default)s]",
         metavar='target_section',
         nargs='?'
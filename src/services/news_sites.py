@@ -0,0 +1,103 @@
+import os
+
+from typing import Tuple, List
+from dataclasses import dataclass
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+
+@dataclass(frozen=True)
+class Section:
+    """뉴스 사이트의 수집 대상 섹션"""
+    name: str                 # 섹션명 (CLI 인자, 예: 반도체)
+    name_en: str              # 영문 섹션명 (출력 파일명/수집 상태 source 에 사용)
+    url: str                  # 뉴스 목록 페이지 URL
+    in_batch: bool = True     # 일괄 수집 배치(run_news_batch) 대상 여부
+
+
+@dataclass(frozen=True)
+class SiteAdapter:
+    """
+    뉴스 사이트 수집 설정.
+    목록/본문 파싱 규칙(파싱 범위, 날짜 형식, 본문 선택자)은 crawler 모듈에 있고,
+    crawler 모듈은 create_crawler(section, seen_index) 로 크롤러 인스턴스를 생성합니다.
+    """
+    name: str                       # 사이트명 (출력 파일 접두어, 예: zdnet)
+    crawler: str                    # 크롤러 모듈명 (src.services 하위)
+    window_days: int                # 수집 기간 (기준 일자로부터 며칠 전까지)
+    sections: Tuple[Section, ...]
+
+    def section(self, name: str) -> Section:
+        """섹션명으로 섹션 설정을 찾습니다."""
+        for section in self.sections:
+            if section.name == name:
+                return section
+        raise KeyError(f"Unknown section '{name}' for {self.name}")
+
+    def section_names(self) -> List[str]:
+        return [section.name for section in self.sections]
+
+    def source(self, section: Section) -> str:
+        """수집 상태 인덱스에 기록할 source 이름 (예: zdnet_semiconductor)"""
+        return f'{self.name}_{section.name_en}'
+
+    def output_path(self, section: Section) -> str:
+        """섹션별 기사 JSON Lines 파일 경로"""
+        return f'{pjt_home_path}/data/{self.source(section)}_articles.jsonl'
+
+
+ZDNET = SiteAdapter(
+    name='zdnet',
+    crawler='news_crawler_zdnet',
+    window_days=3,
+    sections=(
+        Section('반도체', 'semiconductor', 'https://zdnet.co.kr/news/?lstcode=0050'),
+        Section('자동차', 'automotive', 'https://zdnet.co.kr/news/?lstcode=0057&page=1'),
+        Section('배터리', 'battery', 'https://zdnet.co.kr/newskey/?lstcode=%EB%B0%B0%ED%84%B0%EB%A6%AC'),
+        Section('인공지능', 'ai', 'https://zdnet.co.kr/newskey/?lstcode=%EC%9D%B8%EA%B3%B5%EC%A7%80%EB%8A%A5',
+                in_batch=False),
+        Section('컴퓨팅', 'computing', 'https://zdnet.co.kr/news/?lstcode=0020&page=1'),
+    ),
+)
+
+THELEC = SiteAdapter(
+    name='thelec',
+    crawler='news_crawler_thelec',
+    window_days=3,
+    sections=(
+        Section('반도체', 'semiconductor', 'https://www.thelec.kr/news/articleList.html?sc_section_code=S1N2&view_type=sm'),
+        Section('자동차', 'automotive', 'https://www.thelec.kr/news/articleList.html?sc_section_code=S1N13&view_type=sm'),
+        Section('배터리', 'battery', 'https://www.thelec.kr/news/articleList.html?sc_section_code=S1N9&view_type=sm'),
+    ),
+)
+
+ETNEWS = SiteAdapter(
+    name='etnews',
+    crawler='news_crawler_etnews',
+    window_days=2,
+    sections=(
+        Section('전자', 'electronics', 'https://etnews.com/news/section.html?id1=06'),
+        Section('SW', 'software', 'https://etnews.com/news/section.html?id1=04'),
+        Section('IT', 'it', 'https://etnews.com/news/section.html?id1=03'),
+    ),
+)
+
+# 뉴스 사이트 등록부. 새 사이트는 crawler 모듈(create_crawler 포함)과 여기 항목만 추가하면 됩니다.
+SITES = {adapter.name: adapter for adapter in (ZDNET, THELEC, ETNEWS)}
+
+
+def get_site(name: str) -> SiteAdapter:
+    """사이트명으로 수집 설정을 반환합니다."""
+    return SITES[name]
+
+
+def site_of(source: str) -> str:
+    """source 이름(예: zdnet_semiconductor)의 사이트명을 반환합니다."""
+    return source.split('_', 1)[0]
+
+
+def batch_targets() -> List[Tuple[SiteAdapter, Section]]:
+    """일괄 수집 배치 대상 (사이트, 섹션) 목록을 반환합니다."""
+    return [(adapter, section) for adapter in SITES.values() for section in adapter.sections if section.in_batch]
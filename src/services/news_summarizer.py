@@ -6,6 +6,8 @@ import traceback
 import json
 import datetime as dt
 
+from typing import List
+
 import pytz
 import google.generativeai as genai
 
@@ -15,6 +17,13 @@ pjt_home_path = os.path.abspath(pjt_home_path)
 
 site.addsitedir(pjt_home_path)
 from src.services import gcs_upload_json
+from src.services import crawl_state
+from src.services import news_sites
+from src.services import url_registry
+from src.services import article_store
+from src.services import near_duplicates
+from src.services import llm_executor
+from src.services import llm_cache
 
 # 로깅 설정
 logger = logging.getLogger(__file__)
@@ -44,7 +53,11 @@ if not API_KEY:
 genai.configure(api_key=API_KEY)
 
 # Gemini 2.0 Flash Lite 모델 로드
-model = genai.GenerativeModel('gemini-2.0-flash-lite')
+MODEL_NAME = 'gemini-2.0-flash-lite'
+model = genai.GenerativeModel(MODEL_NAME)
+
+# 요약 프롬프트 템플릿 버전 (프롬프트나 응답 후처리를 바꾸면 올려서 이전 요약 캐시를 사용하지 않도록 합니다)
+SUMMARY_PROMPT_VERSION = 1
 
 def summarize_news(news_item, num_sentences=3):
     """
@@ -62,15 +75,53 @@ def summarize_news(news_item, num_sentences=3):
     뉴스 내용: {content}
     """
 
-    try:
-        response = model.generate_content(prompt)
+    def generate() -> str:
+        # 동시 요청 수 / 분당 요청 수 예산은 공유 실행기가 관리합니다.
+        response = llm_executor.get_llm_executor().call(model.generate_content, prompt)
         # 응답에서 요약 텍스트 추출. 보통 첫 번째 파트의 텍스트입니다.
-        summary = response.text.strip()
-        return summary
+        return response.text.strip()
+
+    try:
+        # 같은 모델/템플릿/프롬프트로 요약한 결과가 있으면 API 를 호출하지 않습니다. (실패한 요약은 저장하지 않음)
+        key = llm_cache.cache_key(MODEL_NAME, SUMMARY_PROMPT_VERSION, prompt)
+        return llm_cache.get_llm_cache().get_or_generate(key, generate)
     except Exception as e:
         logger.error(f"뉴스 ID {news_item.get('id', 'N/A')} 요약 중 오류 발생: {e}")
         return f"요약 실패: {e}"
 
+def load_news_items(news_source_list: List[str]) -> List[dict]:
+    """
+    수집 결과 JSON Lines 파일에서 요약 대상 섹션에 나온 기사를 읽습니다.
+    여러 섹션에 나온 기사는 일괄 수집 시 한 섹션 파일에만 저장되고 sections 에 나온 섹션이 모두 기록되므로,
+    등록된 모든 섹션 파일을 읽어 요약 대상 섹션에 나온 기사를 고릅니다. 같은 기사(정규화 URL)는 한 번만 포함합니다.
+    :param list news_source_list: 요약 대상 섹션 (예: zdnet_semiconductor)
+    """
+    targets = set(news_source_list)
+    news_items = {}
+    for adapter in news_sites.SITES.values():
+        for section in adapter.sections:
+            source = adapter.source(section)
+            json_file_path = adapter.output_path(section)  # 뉴스 데이터 JSON Lines 파일 경로
+            if not os.path.exists(json_file_path):
+                if source in targets:
+                    logger.warning(f"입력 파일 '{json_file_path}'을(를) 찾을 수 없습니다.")
+                continue
+
+            for news_item in article_store.iter_jsonl(json_file_path):
+                sections = news_item.get('sections') or [source]
+                if not targets.intersection(sections):
+                    continue
+                key = url_registry.canonical_url(news_item.get('url', 'N/A'))
+                if key in news_items:
+                    # 개별 실행으로 여러 파일에 저장된 같은 기사는 섹션만 합칩니다.
+                    merged = news_items[key].setdefault('sections', [])
+                    merged.extend(section for section in sections if section not in merged)
+                else:
+                    news_item['sections'] = list(sections)
+                    news_items[key] = news_item
+    return list(news_items.values())
+
+
 def main(base_ymd: str):
     
     news_source_list = ['zdnet_semiconductor',
@@ -80,30 +131,59 @@ def main(base_ymd: str):
                         'etnews_software',
                         'etnews_it']
     summarized_results = []
+    seen_index = crawl_state.get_seen_url_index()
+    reused_count = 0
     
     try:
-        for news_source in news_source_list:
-            logger.info(f"뉴스사이트: {news_source}")
-            json_file_path = f'{pjt_home_path}/data/{news_source}_articles.json' # 뉴스 데이터 JSON 파일 경로
-            
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                news_data_list = json.load(f)        
-
-            logger.info(f"총 {len(news_data_list)}개의 뉴스 기사를 요약합니다.\n")
-            
-            for news_item in news_data_list:
-                news_title = news_item.get('title', 'N/A')
-                news_url = news_item.get('url', 'N/A')
-                logger.info(f"--- 뉴스 타이틀: {news_title} ---")
-                summary = summarize_news(news_item, num_sentences=3)
-                logger.info(f"요약:\n{summary}\n")
-
-                summarized_results.append({
-                    "title": news_title,
-                    "date": news_item.get('published_date', 'N/A'),
-                    "url":  news_url,     
-                    "summary": summary
-                })
+        news_data_list = load_news_items(news_source_list)
+        # 여러 매체에 실린 거의 같은 기사는 대표 기사 하나만 요약하고 나머지는 다른 매체 기사로 함께 표시합니다.
+        clusters = near_duplicates.cluster_articles(news_data_list)
+        logger.info(f"총 {len(news_data_list)}개의 뉴스 기사 중 {len(clusters)}개를 요약합니다.\n")
+        seen_articles = seen_index.lookup_many([cluster[0].get('url', 'N/A') for cluster in clusters])
+
+        # 이전 실행에서 요약했고 본문이 바뀌지 않은 기사는 저장된 요약을 사용하고, 나머지만 요약합니다.
+        summaries = {}
+        to_summarize = []
+        for news_item, *_ in clusters:
+            news_url = news_item.get('url', 'N/A')
+            seen = seen_articles.get(news_url)
+            if (seen is not None and seen.summary_status == crawl_state.SUMMARY_DONE
+                    and seen.content_hash == crawl_state.content_hash(news_item.get('content', ''))):
+                summaries[news_url] = seen.summary
+                reused_count += 1
+            else:
+                to_summarize.append(news_item)
+
+        # 요약할 기사는 공유 실행기에서 동시에 요약합니다. (동시 요청 수 / 분당 요청 수 제한)
+        logger.info(f"이전 실행 요약 재사용 {reused_count}건, 신규 요약 {len(to_summarize)}건을 동시에 요약합니다.")
+        new_summaries = llm_executor.get_llm_executor().map(
+            lambda news_item: summarize_news(news_item, num_sentences=3), to_summarize)
+        for news_item, summary in zip(to_summarize, new_summaries):
+            status = crawl_state.SUMMARY_FAILED if summary.startswith("요약 실패") else crawl_state.SUMMARY_DONE
+            seen_index.record_summary(news_item.get('url', 'N/A'), summary, status)
+            summaries[news_item.get('url', 'N/A')] = summary
+
+        for news_item, *alternates in clusters:
+            news_title = news_item.get('title', 'N/A')
+            news_url = news_item.get('url', 'N/A')
+            sections = list(news_item['sections'])
+            for alternate in alternates:
+                sections.extend(section for section in alternate['sections'] if section not in sections)
+            summary = summaries[news_url]
+            logger.info(f"--- 뉴스 타이틀: {news_title} ({', '.join(sections)}) ---")
+            if alternates:
+                logger.info(f"같은 기사의 유사 기사 {len(alternates)}건: {[alternate.get('url') for alternate in alternates]}")
+            logger.info(f"요약:\n{summary}\n")
+
+            summarized_results.append({
+                "title": news_title,
+                "date": news_item.get('published_date', 'N/A'),
+                "url":  news_url,
+                "sections": sections,
+                "summary": summary,
+                # 같은 매체의 재게시 기사는 "다른 매체" 링크에서 제외합니다.
+                "alternates": near_duplicates.other_site_alternates([news_item, *alternates])
+            })
          
         # 요약 결과를 'date'를 1차 기준으로, 'url'을 2차 기준으로 정렬
         sorted_results = sorted(summarized_results, key=lambda x: (x['date'], x['url']), reverse=True)
@@ -113,6 +193,11 @@ def main(base_ymd: str):
         with open(output_json_path, 'w', encoding='utf-8') as f:
             json.dump(sorted_results, f, ensure_ascii=False, indent=2)
         logger.info(f"\n모든 요약이 완료되었습니다. 결과는 '{output_json_path}'에 저장되었습니다.")
+        logger.info(f"이전 실행 요약 재사용: {reused_count}건 / 전체 {len(summarized_results)}건")
+        logger.info(f"LLM result cache stats => {llm_cache.get_llm_cache().stats()}")
+        
+        # 보관 기간이 지난 수집 상태 정리
+        seen_index.compact()
         
         # json 파일 GCS 에 업로드
         gcs_upload_json.upload_local_file_to_gcs(local_file_path=output_json_path,
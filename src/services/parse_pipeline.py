@@ -0,0 +1,184 @@
+import os
+import sys
+import site
+import time
+import logging
+import asyncio
+import threading
+import functools
+import multiprocessing
+
+from typing import List, Callable
+from concurrent.futures import ProcessPoolExecutor
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 파서 프로세스 수 (0 이면 프로세스 풀 없이 스레드에서 파싱) / 다운로드 -> 파싱 대기열 크기
+DEFAULT_PARSE_WORKERS = int(os.environ.get('NEWS_PARSE_WORKERS', os.cpu_count() or 1))
+DEFAULT_QUEUE_SIZE = 16
+
+
+class ParsePipeline:
+    """
+    다운로드와 본문 파싱을 분리한 수집 파이프라인.
+    - 다운로드 단계: 공유 수집 엔진(FetchEngine)의 이벤트 루프에서 동시에 페이지를 받아 크기가 제한된 대기열에 넣습니다.
+      대기열이 가득 차면 다운로드가 대기하여(backpressure) 파싱되지 않은 HTML 이 메모리에 쌓이지 않습니다.
+    - 파싱 단계: 대기열의 HTML 을 프로세스 풀에서 파싱하여 네트워크 I/O 와 별개로 모든 코어를 사용합니다.
+      파싱 함수는 (html, url) -> 결과 형태의 모듈 수준 함수여야 합니다. (프로세스 간 전달)
+    - 단계별 처리량 통계를 stats() 로 제공합니다.
+    """
+
+    def __init__(self,
+                 engine: fetch_engine.FetchEngine,
+                 max_workers: int = DEFAULT_PARSE_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.engine = engine
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+
+        self._pool = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'download': {'count': 0, 'errors': 0, 'busy_seconds': 0.0},
+            'parse': {'count': 0, 'errors': 0, 'busy_seconds': 0.0},
+            'queue': {'high_water': 0, 'full_wait_seconds': 0.0},
+            'wall_seconds': 0.0,
+        }
+
+        logger.info(f"ParsePipeline initialized (max_workers={max_workers}, queue_size={queue_size})")
+
+    def _ensure_pool(self) -> ProcessPoolExecutor | None:
+        """파서 프로세스 풀을 (최초 1회) 생성합니다. max_workers 가 0 이면 None 을 반환합니다."""
+        with self._lock:
+            if self._pool is None and self.max_workers > 0:
+                # 수집 엔진 스레드가 실행 중인 프로세스를 fork 하지 않도록 spawn 방식으로 생성합니다.
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def _record(self, stage: str, started: float, error: bool = False):
+        """(이벤트 루프 스레드에서 호출) 단계별 처리 건수/오류/소요 시간을 기록합니다."""
+        stage_stats = self._stats[stage]
+        stage_stats['count'] += 1
+        stage_stats['busy_seconds'] += time.monotonic() - started
+        if error:
+            stage_stats['errors'] += 1
+
+    async def afetch_and_parse_many(self, urls: List[str], parse_func: Callable[[str, str], object],
+                                    headers: dict = None, timeout: float = None, encoding: str = None,
+                                    cache_ttl: float = 0) -> list:
+        """
+        여러 URL 을 내려받아 parse_func(html, url) 로 파싱합니다.
+        결과는 입력 순서를 유지하며, 다운로드/파싱에 실패한 URL 은 예외 객체로 반환됩니다.
+        """
+        results = [None] * len(urls)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        loop = asyncio.get_running_loop()
+        pool = self._ensure_pool()
+        run_started = time.monotonic()
+
+        async def download(index: int, url: str):
+            started = time.monotonic()
+            try:
+                html = await self.engine.afetch_text(url, headers=headers, timeout=timeout, encoding=encoding,
+                                                     cache_ttl=cache_ttl)
+            except Exception as e:
+                self._record('download', started, error=True)
+                results[index] = e
+                return
+            self._record('download', started)
+
+            # 대기열이 가득 차면 파싱 단계가 따라올 때까지 대기합니다. (backpressure)
+            wait_started = time.monotonic()
+            await queue.put((index, url, html))
+            self._stats['queue']['full_wait_seconds'] += time.monotonic() - wait_started
+            self._stats['queue']['high_water'] = max(self._stats['queue']['high_water'], queue.qsize())
+
+        async def parse_worker():
+            while True:
+                index, url, html = await queue.get()
+                started = time.monotonic()
+                try:
+                    results[index] = await loop.run_in_executor(pool, functools.partial(parse_func, html, url))
+                    self._record('parse', started)
+                except Exception as e:
+                    logger.error(f"Error parsing {url}: {e}")
+                    self._record('parse', started, error=True)
+                    results[index] = e
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(parse_worker()) for _ in range(max(1, self.max_workers))]
+        try:
+            await asyncio.gather(*(download(index, url) for index, url in enumerate(urls)))
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._stats['wall_seconds'] += time.monotonic() - run_started
+        return results
+
+    def fetch_and_parse_many(self, urls: List[str], parse_func: Callable[[str, str], object],
+                             headers: dict = None, timeout: float = None, encoding: str = None,
+                             cache_ttl: float = 0) -> list:
+        """afetch_and_parse_many 의 동기 버전. 크롤러의 동기 코드에서 호출합니다."""
+        return self.engine.run_coroutine(
+            self.afetch_and_parse_many(urls, parse_func, headers=headers, timeout=timeout, encoding=encoding,
+                                       cache_ttl=cache_ttl))
+
+    def stats(self) -> dict:
+        """
+        단계별 처리량 통계를 반환합니다.
+        - download / parse: 처리 건수, 오류 건수, 초당 처리 페이지 수(실행 시간 기준), 건당 평균 소요 시간(ms)
+        - queue: 대기열 최대 적재 수, 대기열이 가득 차 다운로드가 대기한 시간(초)
+        """
+        wall_seconds = self._stats['wall_seconds']
+        result = {'workers': self.max_workers, 'wall_seconds': round(wall_seconds, 3),
+                  'queue': {'max_size': self.queue_size,
+                            'high_water': self._stats['queue']['high_water'],
+                            'full_wait_seconds': round(self._stats['queue']['full_wait_seconds'], 3)}}
+        for stage in ('download', 'parse'):
+            stage_stats = self._stats[stage]
+            count = stage_stats['count']
+            result[stage] = {
+                'count': count,
+                'errors': stage_stats['errors'],
+                'pages_per_sec': round(count / wall_seconds, 2) if wall_seconds else 0.0,
+                'avg_ms': round(stage_stats['busy_seconds'] / count * 1000, 2) if count else 0.0,
+            }
+        return result
+
+    def close(self):
+        """파서 프로세스 풀을 종료합니다."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+_parse_pipeline = None
+_parse_pipeline_lock = threading.Lock()
+
+
+def get_parse_pipeline() -> ParsePipeline:
+    """프로세스 전역에서 공유하는 ParsePipeline 인스턴스를 반환합니다."""
+    global _parse_pipeline
+    engine = fetch_engine.get_engine()
+    with _parse_pipeline_lock:
+        if _parse_pipeline is None:
+            _parse_pipeline = ParsePipeline(engine)
+    return _parse_pipeline
@@ -0,0 +1,141 @@
+import time
+import asyncio
+import email.utils
+
+from typing import Dict
+
+# 호스트별 초당 요청 수(토큰 버킷) 기본값 / 최소 / 최대, 버스트 크기
+DEFAULT_HOST_RATE = 5.0
+MIN_HOST_RATE = 0.2
+MAX_HOST_RATE = 20.0
+DEFAULT_HOST_BURST = 4
+
+# 동시 요청 수(AIMD) 초기값 / 응답 지연이 이 값(초)을 넘으면 혼잡으로 판단
+INITIAL_HOST_CONCURRENCY = 2
+SLOW_RESPONSE_SECONDS = 5.0
+
+# 429/503 응답 시 Retry-After 가 없을 때의 백오프 시간(초), 연속 발생 시 2배씩 증가
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 120.0
+
+# 속도 증가 폭 (성공 응답 1건당 초당 요청 수 증가량)
+RATE_INCREASE_STEP = 0.2
+
+# 서버가 속도 제한을 요청하는 상태 코드
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostRateLimiter:
+    """
+    호스트 하나에 대한 적응형 요청 제한기. (이벤트 루프 스레드에서만 사용)
+    - 토큰 버킷으로 초당 요청 수(rate)를 제한합니다.
+    - 동시 요청 수는 AIMD 로 조정합니다. 정상 응답이면 조금씩 늘리고(additive increase),
+      429/5xx/타임아웃/지연 응답이면 절반으로 줄입니다(multiplicative decrease). 초당 요청 수도 같은 방식으로 조정합니다.
+    - 429/503 응답을 받으면 Retry-After (없으면 지수 증가 백오프) 동안 해당 호스트 요청을 멈춥니다.
+    """
+
+    def __init__(self,
+                 host: str,
+                 max_concurrency: int,
+                 initial_concurrency: int = INITIAL_HOST_CONCURRENCY,
+                 rate: float = DEFAULT_HOST_RATE,
+                 burst: int = DEFAULT_HOST_BURST,
+                 slow_response_seconds: float = SLOW_RESPONSE_SECONDS):
+        self.host = host
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(min(initial_concurrency, max_concurrency))
+        self.rate = rate
+        self.burst = burst
+        self.slow_response_seconds = slow_response_seconds
+
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._backoff_until = 0.0
+        self._backoff_seconds = DEFAULT_BACKOFF_SECONDS
+        self._condition = asyncio.Condition()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _wait_seconds(self) -> float | None:
+        """요청을 보낼 수 있으면 0, 시간이 지나면 보낼 수 있으면 대기 시간(초), 진행 중인 요청이 끝나야 하면 None."""
+        now = time.monotonic()
+        if now < self._backoff_until:
+            return self._backoff_until - now
+        if self.in_flight >= int(self.concurrency):
+            return None
+        self._refill(now)
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        return 0
+
+    async def acquire(self):
+        """요청 슬롯과 토큰을 얻을 때까지 대기합니다."""
+        async with self._condition:
+            while True:
+                wait_seconds = self._wait_seconds()
+                if wait_seconds == 0:
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    return
+                try:
+                    await asyncio.wait_for(self._condition.wait(), wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, status_code: int | None, elapsed: float, retry_after: str | None = None):
+        """
+        요청 결과를 반영하고 슬롯을 반환합니다.
+        :param int status_code: 응답 상태 코드 (타임아웃/연결 오류로 응답이 없으면 None)
+        :param float elapsed: 응답 시간(초)
+        :param str retry_after: 응답의 Retry-After 헤더 값
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if status_code in THROTTLE_STATUS_CODES:
+                self.throttled += 1
+                backoff = parse_retry_after(retry_after)
+                if backoff is None:
+                    backoff = self._backoff_seconds
+                    self._backoff_seconds = min(MAX_BACKOFF_SECONDS, self._backoff_seconds * 2)
+                self._backoff_until = max(self._backoff_until, time.monotonic() + min(backoff, MAX_BACKOFF_SECONDS))
+                self._decrease()
+            elif status_code is None or status_code >= 500 or elapsed > self.slow_response_seconds:
+                self._decrease()
+            elif status_code < 400:
+                self._backoff_seconds = DEFAULT_BACKOFF_SECONDS
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+                self.rate = min(MAX_HOST_RATE, self.rate + RATE_INCREASE_STEP)
+            # 그 외 4xx (404 등) 는 서버 부하와 무관하므로 조정하지 않습니다.
+            self._condition.notify_all()
+
+    def _decrease(self):
+        self.concurrency = max(1.0, self.concurrency / 2)
+        self.rate = max(MIN_HOST_RATE, self.rate / 2)
+
+    def state(self) -> Dict[str, float]:
+        """현재 요청 속도, 동시 요청 수, 백오프 상태를 반환합니다."""
+        return {
+            'rate_per_sec': round(self.rate, 2),
+            'concurrency': int(self.concurrency),
+            'in_flight': self.in_flight,
+            'throttled': self.throttled,
+            'backoff_remaining_sec': round(max(0.0, self._backoff_until - time.monotonic()), 2),
+        }
@@ -0,0 +1,357 @@
+import os
+import sys
+import site
+import json
+import time
+import random
+import hashlib
+import logging
+import importlib
+import threading
+import contextlib
+import datetime as dt
+
+from typing import List, Tuple
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests.adapters import HTTPAdapter
+
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+
+site.addsitedir(pjt_home_path)
+from src.services import fetch_engine
+from src.services import parse_pipeline
+from src.services import news_sites
+from src.services import news_crawl
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 코퍼스 색인 파일 / 페이지 저장 디렉터리
+CORPUS_INDEX = 'index.json'
+CORPUS_PAGES_DIR = 'pages'
+
+DEFAULT_CONTENT_TYPE = 'text/html; charset=utf-8'
+
+
+def to_replay_url(server_url: str, url: str) -> str:
+    """원래 URL 을 대역 서버 URL 로 바꿉니다. (예: https://zdnet.co.kr/news/?a=1 -> {server_url}/https/zdnet.co.kr/news/?a=1)"""
+    parts = urlsplit(url)
+    replay_url = f"{server_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+    return f"{replay_url}?{parts.query}" if parts.query else replay_url
+
+
+def from_replay_path(path: str) -> str | None:
+    """대역 서버 요청 경로에서 원래 URL 을 복원합니다. 형식이 맞지 않으면 None."""
+    scheme, _, rest = path.lstrip('/').partition('/')
+    if scheme not in ('http', 'https') or not rest:
+        return None
+    return f'{scheme}://{rest}'
+
+
+class ReplayCorpus:
+    """
+    오프라인 재생용 페이지 모음 (URL -> 응답 본문).
+    디렉터리에 index.json (메타 정보, URL 별 페이지 파일/상태 코드/Content-Type) 과 pages/ 아래 페이지 파일로 저장합니다.
+    """
+
+    def __init__(self, corpus_dir: str):
+        self.corpus_dir = corpus_dir
+        self.meta = {}
+        self._pages = {}
+        self._lock = threading.Lock()
+
+        index_path = os.path.join(corpus_dir, CORPUS_INDEX)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self.meta = index.get('meta', {})
+            self._pages = index.get('pages', {})
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def urls(self) -> List[str]:
+        with self._lock:
+            return list(self._pages)
+
+    def add(self, url: str, body: bytes, status: int = 200, content_type: str = DEFAULT_CONTENT_TYPE):
+        """페이지를 코퍼스에 추가합니다. (같은 URL 은 덮어씀)"""
+        file_name = hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html'
+        pages_dir = os.path.join(self.corpus_dir, CORPUS_PAGES_DIR)
+        os.makedirs(pages_dir, exist_ok=True)
+        with open(os.path.join(pages_dir, file_name), 'wb') as f:
+            f.write(body)
+        with self._lock:
+            self._pages[url] = {'file': f'{CORPUS_PAGES_DIR}/{file_name}', 'status': status, 'content_type': content_type}
+
+    def get(self, url: str) -> Tuple[int, str, bytes] | None:
+        """URL 의 (상태 코드, Content-Type, 본문) 을 반환합니다. 코퍼스에 없으면 None."""
+        with self._lock:
+            page = self._pages.get(url)
+        if page is None:
+            return None
+        with open(os.path.join(self.corpus_dir, page['file']), 'rb') as f:
+            return page['status'], page['content_type'], f.read()
+
+    def save(self, **meta):
+        """색인 파일을 저장합니다. meta 는 기존 메타 정보에 합쳐집니다. (예: 기준 일자)"""
+        self.meta.update(meta)
+        os.makedirs(self.corpus_dir, exist_ok=True)
+        with self._lock:
+            index = {'meta': self.meta, 'pages': self._pages}
+        with open(os.path.join(self.corpus_dir, CORPUS_INDEX), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+class ReplayServer:
+    """
+    코퍼스 페이지를 응답하는 로컬 HTTP 대역 서버. (네트워크 없이 크롤러 수집 경로 전체를 실행)
+    - latency + [0, jitter) 초 동안 지연한 뒤 응답합니다. 요청은 스레드별로 처리되어 동시 요청의 지연이 겹칩니다.
+    - error_rate 확률로 error_status 응답을 주입합니다. (재시도/호스트 제한기/차단기 동작 확인용)
+    - 코퍼스에 없는 URL 은 404 로 응답합니다.
+    """
+
+    def __init__(self, corpus: ReplayCorpus, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'served': 0, 'not_found': 0, 'injected_errors': 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status, content_type, body = server._respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+    def _respond(self, path: str) -> Tuple[int, str, bytes]:
+        """(요청 처리 스레드에서 실행) 지연/오류 주입을 적용하여 응답을 만듭니다."""
+        with self._lock:
+            self._stats['requests'] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            inject_error = self.error_rate > 0 and self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+
+        if inject_error:
+            self._count('injected_errors')
+            return self.error_status, 'text/plain; charset=utf-8', b'injected error'
+
+        url = from_replay_path(path)
+        page = self.corpus.get(url) if url else None
+        if page is None:
+            self._count('not_found')
+            logger.warning(f"Replay corpus has no page for {url or path}")
+            return 404, 'text/plain; charset=utf-8', b'not found'
+
+        self._count('served')
+        return page
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self) -> dict:
+        """요청/응답/404/주입 오류 건수를 반환합니다."""
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> 'ReplayServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='replay_server', daemon=True)
+        self._thread.start()
+        logger.info(f"Replay server listening on {self.url} ({len(self.corpus)} pages)")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """요청을 대역 서버로 보내는 전송 어댑터. 응답의 url 은 원래 URL 로 되돌립니다."""
+
+    def __init__(self, server_url: str, **kwargs):
+        self.server_url = server_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        url = request.url
+        request.url = to_replay_url(self.server_url, url)
+        response = super().send(request, **kwargs)
+        response.url = url
+        return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """실제 사이트 응답 중 200 응답을 코퍼스에 기록하는 전송 어댑터."""
+
+    def __init__(self, corpus: ReplayCorpus, **kwargs):
+        self.corpus = corpus
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            self.corpus.add(request.url, response.content,
+                            content_type=response.headers.get('Content-Type', DEFAULT_CONTENT_TYPE))
+        return response
+
+
+class ReplaySessionPool(fetch_engine.SessionPool):
+    """모든 호스트의 요청을 대역 서버로 보내는 세션 풀. (호스트별 세션/제한기는 원래 호스트 기준으로 유지)"""
+
+    def __init__(self, server_url: str, pool_maxsize: int = fetch_engine.DEFAULT_PER_HOST_CONCURRENCY):
+        self.server_url = server_url
+        super().__init__(pool_maxsize=pool_maxsize)
+
+    def _create_adapter(self) -> HTTPAdapter:
+        return ReplayAdapter(self.server_url, pool_connections=1, pool_maxsize=self.pool_maxsize)
+
+
+class RecordingSessionPool(fetch_engine.SessionPool):
+    """실제 사이트 응답을 코퍼스에 기록하는 세션 풀."""
+
+    def __init__(self, corpus: ReplayCorpus, pool_maxsize: int = fetch_engine.DEFAULT_PER_HOST_CONCURRENCY):
+        self.corpus = corpus
+        super().__init__(pool_maxsize=pool_maxsize)
+
+    def _create_adapter(self) -> HTTPAdapter:
+        return RecordingAdapter(self.corpus, pool_connections=1, pool_maxsize=self.pool_maxsize)
+
+
+@contextlib.contextmanager
+def installed_engine(engine: fetch_engine.FetchEngine, parse_workers: int = parse_pipeline.DEFAULT_PARSE_WORKERS):
+    """
+    블록 안에서 생성하는 크롤러가 주어진 수집 엔진(과 그 엔진을 쓰는 파싱 파이프라인)을 사용하도록 전역 인스턴스를 바꿉니다.
+    블록을 벗어나면 파싱 파이프라인을 닫고 원래 인스턴스로 되돌립니다.
+    """
+    pipeline = parse_pipeline.ParsePipeline(engine, max_workers=parse_workers)
+    saved = fetch_engine._engine, parse_pipeline._parse_pipeline
+    fetch_engine._engine, parse_pipeline._parse_pipeline = engine, pipeline
+    try:
+        yield pipeline
+    finally:
+        fetch_engine._engine, parse_pipeline._parse_pipeline = saved
+        pipeline.close()
+
+
+def run_section(adapter: news_sites.SiteAdapter, section: news_sites.Section, base_ymd: str) -> dict:
+    """
+    수집 상태 인덱스 없이 섹션 목록과 본문을 수집합니다. (파일은 저장하지 않음)
+    :return: {'articles': 목록 기사 수, 'contents': 본문 수집 성공 수, 'article_urls': 목록 기사 URL,
+              'list_seconds': 목록 소요 시간, 'content_seconds': 본문 소요 시간}
+    """
+    crawler_module = importlib.import_module(f'src.services.{adapter.crawler}')
+    crawler = crawler_module.create_crawler(section, seen_index=None)
+    crawler.set_target_date_range(*news_crawl.target_date_range(adapter, base_ymd))
+
+    started = time.monotonic()
+    articles = crawler.fetch_articles()
+    listed = time.monotonic()
+    article_urls = [article['url'] for article in articles]
+    contents = crawler.fetch_article_contents(article_urls) if article_urls else []
+    finished = time.monotonic()
+    return {
+        'articles': len(articles),
+        'contents': sum(1 for content in contents if not isinstance(content, fetch_engine.FetchFailure)),
+        'article_urls': article_urls,
+        'list_seconds': listed - started,
+        'content_seconds': finished - listed,
+    }
+
+
+def record_corpus(corpus_dir: str, base_ymd: str,
+                  targets: List[Tuple[news_sites.SiteAdapter, news_sites.Section]] = None) -> ReplayCorpus:
+    """
+    실제 사이트를 수집하면서 크롤러가 요청한 목록/기사 페이지를 코퍼스로 기록합니다. (네트워크 필요)
+    기록한 코퍼스는 같은 base_ymd 로 재생해야 수집 기간 필터가 같은 결과를 냅니다.
+    """
+    if targets is None:
+        targets = news_sites.batch_targets()
+    corpus = ReplayCorpus(corpus_dir)
+    engine = fetch_engine.FetchEngine(session_pool=RecordingSessionPool(corpus))
+    with installed_engine(engine):
+        for adapter, section in targets:
+            result = run_section(adapter, section, base_ymd)
+            logger.info(f"Recorded {adapter.source(section)}: {result}")
+    corpus.save(base_ymd=base_ymd, recorded_at=dt.datetime.now().isoformat(timespec='seconds'))
+    logger.info(f"Recorded {len(corpus)} pages to {corpus_dir}")
+    return corpus
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 재생용 코퍼스 기록 / 대역 서버 실행")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="실제 사이트 페이지를 코퍼스로 기록 (네트워크 필요)")
+    record_parser.add_argument('corpus_dir', type=str, help="코퍼스 디렉터리")
+    record_parser.add_argument('base_ymd', type=str, nargs='?', default=dt.datetime.now().strftime("%Y%m%d"),
+                               help="뉴스 기준 일자 (yyyymmdd), 미입력 시 현재 날짜")
+
+    serve_parser = subparsers.add_parser('serve', help="코퍼스 대역 서버 실행")
+    serve_parser.add_argument('corpus_dir', type=str, help="코퍼스 디렉터리")
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help="응답 지연 (초)")
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help="오류 응답 주입 확률 (0~1)")
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_corpus(args.corpus_dir, args.base_ymd)
+    else:
+        replay_server = ReplayServer(ReplayCorpus(args.corpus_dir), latency=args.latency, jitter=args.jitter,
+                                     error_rate=args.error_rate, port=args.port).start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            replay_server.stop()
@@ -115,6 +115,7 @@ def send_email_with_news(sender_email: str, sender_password: str, receiver_email
             .date {{ font-size: 0.9em; color: #666; }}
             .url {{ font-size: 0.9em; color: #007bff; text-decoration: none; display: block; margin-top: 5px; }}
             .summary {{ font-size: 1em; color: #555; }}
+            .alternates {{ font-size: 0.9em; color: #666; }}
             ul {{ list-style: none; padding: 0; margin: 0; }}
             li {{ margin-bottom: 5px; }}
             .footer {{ text-align: center; font-size: 0.8em; color: #999; margin-top: 20px; }}
@@ -137,7 +138,17 @@ def send_email_with_news(sender_email: str, sender_password: str, receiver_email
             html_body += f"""
                 <a href="{news_item['url']}" class="url" target="_blank" rel="noopener noreferrer">원문 보기</a>
             """
-        
+
+        # 같은 기사를 실은 다른 매체 기사 링크 (요약은 대표 기사 하나만 작성)
+        alternates = news_item.get('alternates') or []
+        if alternates:
+            links = ', '.join(
+                f'<a href="{alternate["url"]}" target="_blank" rel="noopener noreferrer">{alternate["site"]}</a>'
+                for alternate in alternates)
+            html_body += f"""
+                <p class="alternates">다른 매체: {links}</p>
+            """
+
         # 요약 내용을 줄바꿈 기준으로 리스트 아이템으로 변환하고, 선행하는 '*'와 공백을 제거
         html_body += f"""
                 <div class="summary">
@@ -0,0 +1,185 @@
+import sys
+import json
+import logging
+
+from typing import Callable, Dict, List
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 프롬프트 템플릿 버전 (프롬프트나 응답 처리를 바꾸면 올려서 이전 응답 캐시를 사용하지 않도록 합니다)
+PROMPT_VERSION = 1
+
+# 이 길이 이상의 게시물은 번역 + 타이틀 + 요약, 미만은 번역만 합니다.
+LONG_POST_MIN_CHARS = 250
+# 이 길이 미만의 게시물은 처리하지 않습니다.
+SHORT_POST_MIN_CHARS = 15
+
+# 구조화 응답(JSON) 요청 설정: 응답 본문을 JSON 으로만 받습니다.
+STRUCTURED_GENERATION_CONFIG = {'response_mime_type': 'application/json'}
+
+# 요약 항목 수
+SUMMARY_POINTS = 3
+
+# 짧은 게시물 번역을 한 번에 묶어 요청할 최대 게시물 수
+SHORT_BATCH_SIZE = 20
+
+# API 호출 실패 시 call_gemini_api 가 반환하는 문자열 (게시물 필드에 그대로 기록)
+API_ERROR_TEXT = "Error during API call."
+
+
+# --- 필드별 프롬프트 (구조화 응답을 파싱하지 못했을 때 사용) ---
+
+def translation_prompt(original_text: str) -> str:
+    return f"Translate the following English text to Korean:\n\n---\n{original_text}\n---"
+
+
+def title_prompt(original_text: str) -> str:
+    return (f"Create a concise and representative title in Korean for the following English text. "
+            f"Provide only the title text without any quotation marks or extra words.\n\n---\n{original_text}\n---")
+
+
+def summary_prompt(original_text: str) -> str:
+    return (f"Summarize the following English text into a {SUMMARY_POINTS}-point bullet list in most natural and modern Korean. "
+            f"Do not provide any other explanations or the original English text.:\n\n"
+            f"---\n{original_text}\n---")
+
+
+def short_translation_prompt(original_text: str) -> str:
+    return (f"Translate the following English text into a single, most natural and modern Korean sentence. "
+            f"Do not provide any other options or labels.:\n\n---\n{original_text}\n---")
+
+
+# --- 긴 게시물 구조화 프롬프트 (번역 / 타이틀 / 요약을 한 번에 요청) ---
+
+def structured_post_prompt(original_text: str) -> str:
+    """번역, 타이틀, 요약을 JSON 객체 하나로 응답하도록 요청하는 프롬프트"""
+    return (
+        "For the following English text, respond with a single JSON object with exactly these keys:\n"
+        '- "translated_text": the full text translated to Korean\n'
+        '- "title": a concise and representative title in Korean, without any quotation marks or extra words\n'
+        f'- "summary": a JSON array of {SUMMARY_POINTS} strings, a {SUMMARY_POINTS}-point summary in most natural and modern Korean\n'
+        "Do not include any other keys, explanations or the original English text.\n\n"
+        f"---\n{original_text}\n---")
+
+
+def _strip_code_fence(response_text: str) -> str:
+    """```json ... ``` 로 감싼 응답에서 JSON 본문만 꺼냅니다."""
+    text = response_text.strip()
+    if text.startswith('```'):
+        text = text.split('\n', 1)[1] if '\n' in text else ''
+        if text.rstrip().endswith('```'):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def _required_text(fields: dict, key: str) -> str:
+    value = fields.get(key)
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"'{key}' 항목이 없거나 비어있습니다.")
+    return value.strip()
+
+
+def parse_structured_post(response_text: str) -> dict:
+    """
+    구조화 응답을 검증하고 게시물 필드(translated_text, title, summary)로 변환합니다.
+    요약 배열은 메일 본문이 읽는 형식('* 항목' 줄 목록) 문자열로 바꿉니다.
+    :raises ValueError: JSON 이 아니거나 필수 항목이 없거나 형식이 맞지 않습니다.
+    """
+    try:
+        fields = json.loads(_strip_code_fence(response_text or ''))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON 형식이 아닙니다: {e}") from e
+    if not isinstance(fields, dict):
+        raise ValueError("JSON 객체가 아닙니다.")
+
+    summary = fields.get('summary')
+    if isinstance(summary, list):
+        points = [point.strip().lstrip('*-• ').strip() for point in summary if isinstance(point, str)]
+        points = [point for point in points if point]
+        if len(points) != len(summary) or not points:
+            raise ValueError("'summary' 항목에 비어있거나 문자열이 아닌 요소가 있습니다.")
+        summary = '\n'.join(f"* {point}" for point in points)
+    else:
+        summary = _required_text(fields, 'summary')
+
+    return {
+        'translated_text': _required_text(fields, 'translated_text'),
+        'title': _required_text(fields, 'title'),
+        'summary': summary,
+    }
+
+
+# --- 짧은 게시물 묶음 번역 (여러 게시물을 id 를 붙여 한 번에 요청) ---
+
+def is_short_post(original_text: str) -> bool:
+    """번역만 하는 짧은 게시물인지 여부"""
+    return SHORT_POST_MIN_CHARS <= len(original_text or '') < LONG_POST_MIN_CHARS
+
+
+def split_batches(texts: Dict[str, str], batch_size: int = SHORT_BATCH_SIZE) -> List[Dict[str, str]]:
+    """{id: 원문} 을 batch_size 건씩 나눕니다. (입력 순서 유지)"""
+    items = list(texts.items())
+    return [dict(items[i:i + batch_size]) for i in range(0, len(items), batch_size)]
+
+
+def batch_translation_prompt(texts: Dict[str, str]) -> str:
+    """{id: 원문} 을 JSON 으로 전달하고 같은 id 의 번역문 JSON 객체로 응답하도록 요청하는 프롬프트"""
+    return (
+        "Translate each English text in the following JSON object into a single, most natural and modern Korean sentence. "
+        "Respond with a single JSON object that maps each id to its Korean translation, using exactly the same ids. "
+        "Do not provide any other options, labels or explanations.\n\n"
+        f"{json.dumps(texts, ensure_ascii=False, indent=1)}")
+
+
+def parse_batch_translations(response_text: str, ids: List[str]) -> Dict[str, str] | None:
+    """
+    묶음 번역 응답에서 요청한 id 의 번역문만 꺼냅니다.
+    응답 전체를 파싱하지 못하면 None, 일부 id 가 없거나 비어있으면 해당 id 만 빠진 dict 를 반환합니다.
+    """
+    try:
+        translations = json.loads(_strip_code_fence(response_text or ''))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(translations, dict):
+        return None
+    return {post_id: translations[post_id].strip() for post_id in ids
+            if isinstance(translations.get(post_id), str) and translations[post_id].strip()}
+
+
+def translate_batch(texts: Dict[str, str], call_api: Callable[..., str]) -> Dict[str, str]:
+    """
+    {id: 원문} 묶음을 한 번에 번역합니다.
+    - 요청 자체가 실패하면(API_ERROR_TEXT) 다시 요청하지 않고 묶음의 모든 게시물에 실패 문자열을 기록합니다.
+      (재시도는 공유 실행기가 이미 수행했으므로, 나누어 다시 요청하면 장애/한도 초과 중 요청 수만 늘어남)
+    - 응답을 파싱하지 못하면 게시물마다 단건 번역 프롬프트로 한 번씩 요청합니다.
+    - 파싱한 응답에서 일부 id 만 빠졌으면 빠진 id 를 절반씩 나누어 다시 요청합니다.
+    :param call_api: call_api(prompt_text, generation_config=None) -> 응답 텍스트 (예: tweet_summarizer.call_gemini_api)
+    :return: {id: 번역문 또는 API_ERROR_TEXT}
+    """
+    if len(texts) == 1:
+        (post_id, original_text), = texts.items()
+        return {post_id: call_api(short_translation_prompt(original_text))}
+
+    response_text = call_api(batch_translation_prompt(texts), generation_config=STRUCTURED_GENERATION_CONFIG)
+    if response_text == API_ERROR_TEXT:
+        logger.warning(f"batch translation request failed. {len(texts)} ids are left untranslated")
+        return {post_id: API_ERROR_TEXT for post_id in texts}
+
+    translations = parse_batch_translations(response_text, list(texts))
+    if translations is None:
+        logger.warning(f"batch translation response is not a JSON object. translating {len(texts)} ids one by one")
+        return {post_id: call_api(short_translation_prompt(original_text)) for post_id, original_text in texts.items()}
+
+    missing = {post_id: original_text for post_id, original_text in texts.items() if post_id not in translations}
+    if missing:
+        logger.warning(f"batch translation returned {len(translations)}/{len(texts)} ids. re-splitting {len(missing)} ids")
+        half = (len(missing) + 1) // 2
+        for part in split_batches(missing, half):
+            translations.update(translate_batch(part, call_api))
+    return {post_id: translations[post_id] for post_id in texts}
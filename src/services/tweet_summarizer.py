@@ -4,7 +4,6 @@ import site
 import logging
 import traceback
 import json
-import time
 import datetime as dt
 
 import pytz
@@ -19,6 +18,9 @@ site.addsitedir(pjt_home_path)
 from src.services import gcs_upload_json
 from src.services import gcs_download_json
 from src.services import tweet_scrapper_post
+from src.services import llm_executor
+from src.services import llm_cache
+from src.services import tweet_prompts
 
 # 로깅 설정
 logger = logging.getLogger(__file__)
@@ -63,26 +65,30 @@ genai.configure(api_key=api_key)
 
 
 # Gemini 2.0 Flash Lite 모델 로드
-model = genai.GenerativeModel('gemini-2.0-flash-lite')
+MODEL_NAME = 'gemini-2.0-flash-lite'
+model = genai.GenerativeModel(MODEL_NAME)
 
 # --- 2. 헬퍼 함수: Gemini API 호출 ---
 
-def call_gemini_api(prompt_text):
+def call_gemini_api(prompt_text, generation_config: dict = None):
     """
     주어진 프롬프트로 Gemini API를 호출하고 결과를 반환합니다.
-    API 호출 제한(분당 요청 수)을 피하기 위해 재시도 로직을 포함합니다.
+    동시 요청 수 / 분당 요청 수 / 분당 토큰 수 예산과 요청 한도 초과 시 재시도(지수 백오프, 재시도 예산)는 공유 실행기가 관리합니다.
+    같은 모델/템플릿/프롬프트로 받은 응답이 있으면 API 를 호출하지 않고 저장된 응답을 반환합니다. (실패한 요청은 저장하지 않음)
+    :param dict generation_config: 응답 형식 설정 (예: JSON 응답), 미입력 시 모델 기본값
     """
-    try:
-        response = model.generate_content(prompt_text)
+    def generate() -> str:
+        response = llm_executor.get_llm_executor().call(model.generate_content, prompt_text,
+                                                        generation_config=generation_config)
         return response.text
+
+    try:
+        key = llm_cache.cache_key(MODEL_NAME, tweet_prompts.PROMPT_VERSION, prompt_text, generation_config)
+        return llm_cache.get_llm_cache().get_or_generate(key, generate)
     except Exception as e:
-        if "rate limit" in str(e).lower():
-            logger.warning("API Rate limit exceeded. Waiting for 20 seconds before retrying...")
-            time.sleep(20)
-            return call_gemini_api(prompt_text)
-        else:
-            logger.error(f"Gemini API 호출 중 예기치 않은 오류 발생: {e}", exc_info=True)
-            return "Error during API call."
+        # 재시도할 수 없는 오류이거나 재시도 한도/예산을 모두 사용한 경우입니다.
+        logger.error(f"Gemini API 호출 중 예기치 않은 오류 발생: {e}", exc_info=True)
+        return tweet_prompts.API_ERROR_TEXT
 
 def remove_duplicate_posts(posts_list: list) -> list:
     """
@@ -100,9 +106,66 @@ def remove_duplicate_posts(posts_list: list) -> list:
             unique_posts.append(item)
     return unique_posts
 
+def process_post(post: dict, index: int) -> dict:
+    """
+    게시물 1건을 내용 길이에 따라 번역 / 타이틀 & 요약합니다.
+    :param int index: 파일 내 게시물 순번 (id 가 없는 게시물의 로그 식별자)
+    """
+    original_text = post.get("text", "")
+    post_identifier = post.get('id', f"index_{index}")
+    logger.info(f"Tweet 처리 시작: {post_identifier}")
+
+    if not original_text:
+        logger.info(f"  - [{post_identifier}] 내용이 비어있어 API 호출을 건너뜁니다.")
+        return post
+
+    text_len = len(original_text)
+
+    if text_len >= tweet_prompts.LONG_POST_MIN_CHARS:
+        logger.info(f"  - [{post_identifier}] 내용 길이({text_len}) >= {tweet_prompts.LONG_POST_MIN_CHARS}. 번역 및 타이틀 & 요약을 생성 진행합니다.")
+        # 번역/타이틀/요약을 JSON 응답 한 번으로 요청하고, 응답을 파싱하지 못하면 항목별로 요청합니다.
+        response_text = call_gemini_api(tweet_prompts.structured_post_prompt(original_text),
+                                        generation_config=tweet_prompts.STRUCTURED_GENERATION_CONFIG)
+        try:
+            post.update(tweet_prompts.parse_structured_post(response_text))
+        except ValueError as e:
+            logger.warning(f"  - [{post_identifier}] 구조화 응답 파싱 실패({e}). 항목별로 다시 요청합니다.")
+            post['translated_text'] = call_gemini_api(tweet_prompts.translation_prompt(original_text))
+            post['title'] = call_gemini_api(tweet_prompts.title_prompt(original_text))
+            post['summary'] = call_gemini_api(tweet_prompts.summary_prompt(original_text))
+
+    elif tweet_prompts.is_short_post(original_text):
+        # 짧은 게시물 번역은 translate_short_posts() 에서 묶음으로 요청합니다.
+        if 'translated_text' not in post:
+            logger.info(f"  - [{post_identifier}] 내용 길이({text_len}) < {tweet_prompts.LONG_POST_MIN_CHARS}. 번역만 진행합니다.")
+            post['translated_text'] = call_gemini_api(tweet_prompts.short_translation_prompt(original_text))
+
+    else:
+        logger.info(f"  - [{post_identifier}] 내용 길이({text_len}) < {tweet_prompts.SHORT_POST_MIN_CHARS}. 처리를 건너뜁니다.")
+
+    return post
+
+def translate_short_posts(posts: list):
+    """
+    번역만 하는 짧은 게시물을 SHORT_BATCH_SIZE 건씩 묶어 한 번에 번역 요청하고 translated_text 에 기록합니다.
+    묶음 안의 게시물은 파일 내 순번을 id 로 사용하며, 응답에서 빠진 게시물은 나누어 다시 요청합니다.
+    """
+    short_posts = {str(index): post for index, post in enumerate(posts)
+                   if tweet_prompts.is_short_post(post.get("text", ""))}
+    if not short_posts:
+        return
+
+    batches = tweet_prompts.split_batches({post_id: post["text"] for post_id, post in short_posts.items()})
+    logger.info(f"짧은 게시물 {len(short_posts)}건을 {len(batches)}개 묶음으로 번역합니다.")
+    for translations in llm_executor.get_llm_executor().map(
+            lambda batch: tweet_prompts.translate_batch(batch, call_gemini_api), batches):
+        for post_id, translated_text in translations.items():
+            short_posts[post_id]['translated_text'] = translated_text
+
 def process_posts(input_filename: str, summarized_posts: list):
     """
     JSON 파일을 읽고, 각 게시물을 처리한 후, processed_posts 리스트에 추가
+    짧은 게시물은 묶음으로 번역하고, 게시물은 공유 실행기에서 동시에 처리하며, 결과는 파일의 게시물 순서대로 추가합니다.
     """
     try:
         logger.info(f"load data from {input_filename} ...")
@@ -115,44 +178,9 @@ def process_posts(input_filename: str, summarized_posts: list):
         logger.warning(f"'{input_filename}' 파일이 올바른 JSON 형식이 아닙니다.", exc_info=True)
         return    
 
-    for i, post in enumerate(posts):
-        original_text = post.get("text", "")
-        post_identifier = post.get('id', f"index_{i}")
-        logger.info(f"Tweet 처리 시작: {post_identifier}")
-
-        if not original_text:
-            logger.info("  - 내용이 비어있어 API 호출을 건너뜁니다.")
-            summarized_posts.append(post)
-            continue
-        
-        text_len = len(original_text)
-
-        if text_len >= 250:
-            logger.info(f"  - 내용 길이({text_len}) >= 250. 번역 및 타이틀 & 요약을 생성 진행합니다.")
-            translation_prompt = f"Translate the following English text to Korean:\n\n---\n{original_text}\n---"
-            post['translated_text'] = call_gemini_api(translation_prompt)
-                        
-            title_prompt = (f"Create a concise and representative title in Korean for the following English text. "
-                            f"Provide only the title text without any quotation marks or extra words.\n\n---\n{original_text}\n---")
-            post['title'] = call_gemini_api(title_prompt)
-
-            summary_prompt = (
-                f"Summarize the following English text into a 3-point bullet list in most natural and modern Korean. "
-                f"Do not provide any other explanations or the original English text.:\n\n"
-                f"---\n{original_text}\n---")
-            post['summary'] = call_gemini_api(summary_prompt)
-            
-        elif 15 <= text_len < 250:
-            logger.info(f"  - 내용 길이({text_len}) < 250. 번역만 진행합니다.")
-            translation_prompt = (
-                f"Translate the following English text into a single, most natural and modern Korean sentence. "
-                f"Do not provide any other options or labels.:\n\n---\n{original_text}\n---")
-            post['translated_text'] = call_gemini_api(translation_prompt)
-            
-        else:
-            logger.info(f"  - 내용 길이({text_len}) < 15. 처리를 건너뜁니다.")
-
-        summarized_posts.append(post)
+    translate_short_posts(posts)
+    processed = llm_executor.get_llm_executor().map(process_post, posts, range(len(posts)))
+    summarized_posts.extend(processed)
 
 # --- 3. 메인 로직 ---
 def main(base_ymd: str, gcs_mode: bool = True, tweet_usernames: list = None):
@@ -191,6 +219,7 @@ def main(base_ymd: str, gcs_mode: bool = True, tweet_usernames: list = None):
                                                      date_str=base_ymd)
 
         logger.info(f"✅ 신규 Tweet 처리가 완료되었습니다. 결과가 '{output_filename}' 파일에 저장되었습니다.")
+        logger.info(f"LLM result cache stats => {llm_cache.get_llm_cache().stats()}")
 
         output_filename = os.path.join(pjt_home_path, 'data', 'summarized_posts_agg.json')
 
@@ -0,0 +1,82 @@
+import sys
+import logging
+import threading
+
+from typing import List, Dict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 로깅 설정
+logger = logging.getLogger(__file__)
+formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(filename)s %(lineno)d: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+logger.setLevel(logging.INFO)
+stream_log = logging.StreamHandler(sys.stdout)
+stream_log.setFormatter(formatter)
+logger.addHandler(stream_log)
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터 (접두어)
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid')
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL 을 하나의 형태로 정규화합니다.
+    - 스킴/호스트 소문자, 기본 포트 제거, 프래그먼트 제거
+    - 추적용 쿼리 파라미터 제거 후 나머지 파라미터 정렬
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ''
+    if parts.port and str(parts.port) != _DEFAULT_PORTS.get(scheme):
+        host = f'{host}:{parts.port}'
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.lower().startswith(TRACKING_PARAM_PREFIXES))
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+
+class ArticleRegistry:
+    """
+    배치 전체에서 공유하는 기사 URL 등록부.
+    여러 섹션 목록에 나온 같은 기사(정규화 URL 기준)는 처음 등록한 섹션이 소유하여 본문 수집/요약을 한 번만 하고,
+    기사가 나온 모든 섹션은 기사의 sections 항목에 기록합니다.
+    """
+
+    def __init__(self):
+        self._owners: Dict[str, str] = {}
+        self._sections: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, source: str, articles: List[Dict]) -> List[Dict]:
+        """
+        섹션의 기사 목록을 등록하고, 이 섹션이 소유하는(처음 등록된) 기사만 반환합니다.
+        반환된 기사의 sections 항목은 이후 다른 섹션에서 같은 기사가 등록되면 함께 갱신됩니다.
+        :param str source: 섹션 이름 (예: zdnet_semiconductor)
+        :param list articles: 크롤러 fetch_articles 결과
+        """
+        owned = []
+        with self._lock:
+            for article in articles:
+                key = canonical_url(article['url'])
+                sections = self._sections.setdefault(key, [])
+                if source not in sections:
+                    sections.append(source)
+                if key not in self._owners:
+                    self._owners[key] = source
+                    article['sections'] = sections
+                    owned.append(article)
+        skipped = len(articles) - len(owned)
+        if skipped:
+            logger.info(f"[{source}] {skipped} articles already registered by other sections")
+        return owned
+
+    def sections(self, url: str) -> List[str]:
+        """기사가 나온 섹션 목록을 반환합니다."""
+        with self._lock:
+            return list(self._sections.get(canonical_url(url), []))
+
+    def stats(self) -> dict:
+        """등록된 기사 수와 여러 섹션에 나온 기사 수를 반환합니다."""
+        with self._lock:
+            shared = sum(1 for sections in self._sections.values() if len(sections) > 1)
+            return {'articles': len(self._owners), 'shared_across_sections': shared}
@@ -0,0 +1,69 @@
+import os
+import sys
+import site
+import json
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.article_store import JsonlWriter, iter_jsonl
+
+# --- Test Cases ---
+
+def test_commit_replaces_output_atomically(tmp_path):
+    """Test that records go to the partial file until commit renames it."""
+    path = str(tmp_path / 'zdnet_semiconductor_articles.jsonl')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"url": "old"}\n')
+
+    writer = JsonlWriter(path, run_key='20240101', fsync_every=2)
+    assert writer.open() == set()
+    writer.write({'url': 'a', 'title': '제목'})
+    writer.write({'url': 'b'})
+    assert list(iter_jsonl(path)) == [{'url': 'old'}]
+
+    writer.commit()
+    assert list(iter_jsonl(path)) == [{'url': 'a', 'title': '제목'}, {'url': 'b'}]
+    assert not os.path.exists(writer.part_path)
+
+def test_resume_truncates_partial_line(tmp_path):
+    """Test resuming a partial file whose last record was cut off mid-write."""
+    path = str(tmp_path / 'articles.jsonl')
+    part_path = f'{path}.20240101.part'
+    with open(part_path, 'w', encoding='utf-8') as f:
+        f.write('{"url": "a"}\n{"url": "b"}\n{"url": "c", "cont')
+
+    with JsonlWriter(path, run_key='20240101') as writer:
+        assert writer.open() == {'a', 'b'}
+        writer.write({'url': 'c'})
+
+    assert [record['url'] for record in iter_jsonl(path)] == ['a', 'b', 'c']
+    assert writer.written == 3
+
+def test_failure_keeps_partial_file(tmp_path):
+    """Test that an exception leaves the partial file for the next run instead of publishing it."""
+    path = str(tmp_path / 'articles.jsonl')
+    with pytest.raises(RuntimeError):
+        with JsonlWriter(path, run_key='20240101') as writer:
+            writer.open()
+            writer.write({'url': 'a'})
+            raise RuntimeError("crawl failed")
+
+    assert not os.path.exists(path)
+    assert open(writer.part_path, encoding='utf-8').read() == '{"url": "a"}\n'
+
+def test_stale_partial_file_is_discarded(tmp_path):
+    """Test that a partial file from another run key is not resumed."""
+    path = str(tmp_path / 'articles.jsonl')
+    stale_path = f'{path}.20231231.part'
+    with open(stale_path, 'w', encoding='utf-8') as f:
+        f.write('{"url": "old"}\n')
+
+    writer = JsonlWriter(path, run_key='20240101')
+    assert writer.open() == set()
+    writer.close()
+    assert not os.path.exists(stale_path)
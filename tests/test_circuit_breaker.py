@@ -0,0 +1,71 @@
+import os
+import sys
+import site
+import pytest
+
+from unittest.mock import patch
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import circuit_breaker
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+HOST = "zdnet.co.kr"
+
+# --- Test Cases ---
+
+def test_opens_after_threshold():
+    """Test that the breaker opens after consecutive failures and rejects requests."""
+    breaker = CircuitBreaker(HOST, failure_threshold=3, reset_timeout=60)
+    for _ in range(3):
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+    assert breaker.state == circuit_breaker.STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.stats()['opened'] == 1
+
+def test_success_resets_failures():
+    """Test that a success in between resets the consecutive failure count."""
+    breaker = CircuitBreaker(HOST, failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == circuit_breaker.STATE_CLOSED
+    assert breaker.consecutive_failures == 1
+
+def test_half_open_allows_single_trial():
+    """Test the half-open trial after the reset timeout."""
+    breaker = CircuitBreaker(HOST, failure_threshold=1, reset_timeout=10)
+    with patch('src.services.circuit_breaker.time.monotonic', return_value=100.0):
+        breaker.record_failure()
+    with patch('src.services.circuit_breaker.time.monotonic', return_value=111.0):
+        assert breaker.allow_request()
+        assert breaker.state == circuit_breaker.STATE_HALF_OPEN
+        assert not breaker.allow_request()
+        breaker.record_failure()
+
+    assert breaker.state == circuit_breaker.STATE_OPEN
+    with patch('src.services.circuit_breaker.time.monotonic', return_value=122.0):
+        assert breaker.allow_request()
+        breaker.record_success()
+    assert breaker.state == circuit_breaker.STATE_CLOSED
+
+def test_release_trial_allows_next_trial():
+    """Test that a trial ending without an outcome (e.g. cancelled) lets the next request be the trial."""
+    breaker = CircuitBreaker(HOST, failure_threshold=1, reset_timeout=10)
+    with patch('src.services.circuit_breaker.time.monotonic', return_value=100.0):
+        breaker.record_failure()
+    with patch('src.services.circuit_breaker.time.monotonic', return_value=111.0):
+        assert breaker.allow_request()
+        breaker.release_trial()
+
+        assert breaker.state == circuit_breaker.STATE_HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
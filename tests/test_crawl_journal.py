@@ -0,0 +1,139 @@
+import os
+import sys
+import site
+import pytest
+
+from unittest.mock import patch, MagicMock
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import crawl_journal
+from src.services import news_crawl
+from src.services import news_batch
+from src.services import news_sites
+from src.services.crawl_journal import CrawlJournal
+
+# --- Test Cases for CrawlJournal ---
+
+def test_marks_survive_reopen(tmp_path):
+    """Test that completed units are restored when the journal is reopened for the same day."""
+    journal = CrawlJournal("20240101", journal_dir=str(tmp_path))
+    journal.mark(crawl_journal.UNIT_LIST, 'zdnet_semiconductor', articles=[{'url': 'http://fake.url/1'}])
+    journal.mark(crawl_journal.UNIT_SECTION, 'zdnet_semiconductor', saved=1)
+
+    reopened = CrawlJournal("20240101", journal_dir=str(tmp_path))
+    assert reopened.is_done(crawl_journal.UNIT_SECTION, 'zdnet_semiconductor')
+    assert reopened.get(crawl_journal.UNIT_LIST, 'zdnet_semiconductor')['articles'] == [{'url': 'http://fake.url/1'}]
+    assert not reopened.is_done(crawl_journal.UNIT_STAGE, 'crawl')
+    assert reopened.stats() == {'list': 1, 'section': 1}
+    assert not CrawlJournal("20240102", journal_dir=str(tmp_path)).is_done(crawl_journal.UNIT_LIST, 'zdnet_semiconductor')
+
+def test_expired_journals_removed(tmp_path):
+    """Test that journals older than the retention period are deleted."""
+    CrawlJournal("20240101", journal_dir=str(tmp_path)).mark(crawl_journal.UNIT_STAGE, 'crawl')
+    CrawlJournal("20240110", journal_dir=str(tmp_path), retention_days=7)
+
+    assert not os.path.exists(tmp_path / 'crawl_journal_20240101.jsonl')
+
+# --- Test Cases for resuming crawl_all ---
+
+@patch('src.services.news_crawl.collect_section')
+@patch('src.services.news_crawl.create_section_crawler')
+@patch('src.services.news_crawl.list_section')
+def test_crawl_all_resumes_remaining_sections(mock_list_section, mock_create_crawler, mock_collect_section, tmp_path):
+    """Test that a rerun for the same day skips finished sections and listed pages."""
+    targets = [(news_sites.ETNEWS, news_sites.ETNEWS.section(name)) for name in ('전자', 'SW', 'IT')]
+    mock_list_section.side_effect = lambda adapter, section, base_ymd: (
+        MagicMock(), [{'url': f"{section.url}&n=1", 'content': 'body'}])
+    failing = {'etnews_it'}
+
+    def fake_collect(adapter, section, crawler, articles, run_key):
+        if adapter.source(section) in failing:
+            raise RuntimeError("instance recycled")
+        return len(articles)
+
+    mock_collect_section.side_effect = fake_collect
+    journal = CrawlJournal("20240101", journal_dir=str(tmp_path))
+    first = news_crawl.crawl_all("20240101", targets=targets, journal=journal)
+    assert isinstance(first['etnews_it'], RuntimeError)
+
+    failing.clear()
+    mock_list_section.reset_mock()
+    mock_collect_section.reset_mock()
+    journal = CrawlJournal("20240101", journal_dir=str(tmp_path))
+    second = news_crawl.crawl_all("20240101", targets=targets, journal=journal)
+
+    assert second == {'etnews_electronics': 1, 'etnews_software': 1, 'etnews_it': 1}
+    mock_list_section.assert_not_called()
+    mock_create_crawler.assert_called_once()
+    assert mock_collect_section.call_count == 1
+    assert mock_collect_section.call_args.args[3] == [{'url': "https://etnews.com/news/section.html?id1=03&n=1", 'content': '',
+                                                       'sections': ['etnews_it']}]
+
+# --- Test Cases for the news batch stages ---
+
+@patch('src.services.news_crawl.collect_section')
+@patch('src.services.news_crawl.create_section_crawler')
+@patch('src.services.news_crawl.list_section')
+def test_news_batch_retries_failed_sections(mock_list_section, mock_create_crawler, mock_collect_section, tmp_path):
+    """Test that failed sections are retried in the same run and later stages go ahead on the collected sections."""
+    targets = [(news_sites.ETNEWS, news_sites.ETNEWS.section(name)) for name in ('전자', 'SW', 'IT')]
+    failures = {'etnews_software': 1, 'etnews_it': 99}  # remaining failures per section
+
+    def fake_list_section(adapter, section, base_ymd):
+        source = adapter.source(section)
+        if failures.get(source, 0) > 0:
+            failures[source] -= 1
+            raise RuntimeError("list page timed out")
+        return MagicMock(), [{'url': f"{section.url}&n=1", 'content': 'body'}]
+
+    mock_list_section.side_effect = fake_list_section
+    mock_create_crawler.return_value = MagicMock()
+    mock_collect_section.side_effect = lambda adapter, section, crawler, articles, run_key: len(articles)
+    upload, summarize, mail = MagicMock(), MagicMock(), MagicMock()
+
+    def run(**kwargs):
+        stages = {'crawl': lambda journal: news_batch.crawl_stage("20240101", journal, targets=targets, retry_delay=0),
+                  'upload': upload, 'summarize': summarize, 'mail': mail}
+        return news_batch.run_news_batch("20240101", stages, journal_dir=str(tmp_path), **kwargs)
+
+    assert run() == ['crawl', 'upload', 'summarize', 'mail']
+    # Attempt 1 lists all three, attempt 2 only the failed two, attempt 3 only the section that keeps failing.
+    assert [c.args[1].name for c in mock_list_section.call_args_list] == ['전자', 'SW', 'IT', 'SW', 'IT', 'IT']
+    assert mock_collect_section.call_count == 2
+    assert upload.call_count == summarize.call_count == mail.call_count == 1
+
+    # A later call for the same day is a no-op unless forced.
+    assert run() == []
+    failures['etnews_it'] = 0
+    assert run(force=True) == ['crawl', 'upload', 'summarize', 'mail']
+    assert mail.call_count == 2
+
+@patch('src.services.news_crawl.collect_section')
+@patch('src.services.news_crawl.list_section')
+def test_news_batch_waits_when_every_section_fails(mock_list_section, mock_collect_section, tmp_path):
+    """Test that nothing downstream runs (or is marked done) when no section could be collected."""
+    targets = [(news_sites.ETNEWS, news_sites.ETNEWS.section(name)) for name in ('전자', 'SW')]
+    mock_list_section.side_effect = RuntimeError("network down")
+    upload = MagicMock()
+    stages = {'crawl': lambda journal: news_batch.crawl_stage("20240101", journal, targets=targets,
+                                                              attempts=2, retry_delay=0),
+              'upload': upload}
+
+    assert news_batch.run_news_batch("20240101", stages, journal_dir=str(tmp_path)) == []
+    assert mock_list_section.call_count == 4
+    upload.assert_not_called()
+    assert not CrawlJournal("20240101", journal_dir=str(tmp_path)).is_done(crawl_journal.UNIT_STAGE, 'crawl')
+
+def test_reset_clears_journal(tmp_path):
+    """Test that reset removes every checkpoint of the day."""
+    journal = CrawlJournal("20240101", journal_dir=str(tmp_path))
+    journal.mark(crawl_journal.UNIT_STAGE, 'mail')
+    journal.reset()
+
+    assert not journal.is_done(crawl_journal.UNIT_STAGE, 'mail')
+    assert not CrawlJournal("20240101", journal_dir=str(tmp_path)).is_done(crawl_journal.UNIT_STAGE, 'mail')
@@ -0,0 +1,155 @@
+import os
+import sys
+import site
+import time
+import sqlite3
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import crawl_state
+from src.services.crawl_state import SeenUrlIndex
+
+URL = "https://zdnet.co.kr/view/?no=20250628100000"
+
+# --- Fixtures ---
+
+@pytest.fixture
+def index(tmp_path):
+    """Fixture to create a SeenUrlIndex backed by a temporary SQLite file."""
+    seen_index = SeenUrlIndex(db_path=str(tmp_path / 'crawl_state.sqlite3'))
+    yield seen_index
+    seen_index.close()
+
+def make_article(url=URL, content="본문"):
+    return {'title': '제목', 'url': url, 'published_date': '2025-06-28', 'content': content}
+
+# --- Test Cases ---
+
+def test_record_and_lookup(index):
+    """Test that recorded articles are found with a pending summary."""
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    seen = index.lookup(URL)
+
+    assert seen.source == 'zdnet_semiconductor'
+    assert seen.content == "본문"
+    assert seen.content_hash == crawl_state.content_hash("본문")
+    assert seen.summary_status == crawl_state.SUMMARY_PENDING
+    assert index.lookup("https://zdnet.co.kr/unknown") is None
+
+def test_fill_known_articles(index):
+    """Test that known articles get their content from the index and new ones stay empty."""
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    articles = [make_article(content=""), make_article(url="https://zdnet.co.kr/view/?no=2", content="")]
+
+    filled = index.fill_known_articles(articles)
+
+    assert filled == 1
+    assert articles[0]['content'] == "본문"
+    assert articles[1]['content'] == ""
+
+def test_record_summary(index):
+    """Test that the summary and status are stored."""
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    index.record_summary(URL, "- 요약")
+
+    seen = index.lookup(URL)
+    assert seen.summary == "- 요약"
+    assert seen.summary_status == crawl_state.SUMMARY_DONE
+
+def test_changed_content_resets_summary(index):
+    """Test that a changed body resets the summary status to pending."""
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    index.record_summary(URL, "- 요약")
+    index.record_articles('zdnet_semiconductor', [make_article(content="수정된 본문")])
+
+    seen = index.lookup(URL)
+    assert seen.content == "수정된 본문"
+    assert seen.summary_status == crawl_state.SUMMARY_PENDING
+    assert seen.summary is None
+
+def test_compact(index):
+    """Test that entries not seen within the retention period are removed."""
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    time.sleep(0.01)
+
+    assert index.compact(retention_days=1) == 0
+    assert index.compact(retention_days=0) == 1
+    assert index.lookup(URL) is None
+
+def test_compact_vacuums_only_when_fragmented(index, mocker):
+    """Test that VACUUM runs only after a deletion leaves enough free pages."""
+    vacuum = mocker.spy(index, '_vacuum_if_fragmented')
+    index.record_articles('zdnet_semiconductor', [make_article()])
+    index.record_articles('zdnet_semiconductor', [make_article(url=f"{URL}{i}", content="본문" * 500) for i in range(50)])
+    time.sleep(0.01)
+
+    # 삭제한 항목이 없으면 빈 페이지 비율도 확인하지 않습니다.
+    assert index.compact(retention_days=1) == 0
+    vacuum.assert_not_called()
+
+    # 일부만 삭제하여 빈 페이지가 적으면 VACUUM 하지 않습니다.
+    index._conn.execute("UPDATE seen_urls SET last_seen_at = 0 WHERE url = ?", (URL,))
+    assert index.compact(retention_days=1) == 1
+    assert vacuum.spy_return is False
+
+    # 대부분 삭제되어 빈 페이지가 많으면 VACUUM 하여 빈 페이지를 반환합니다.
+    index._conn.execute("UPDATE seen_urls SET last_seen_at = 0")
+    assert index.compact(retention_days=1) == 50
+    assert vacuum.spy_return is True
+    assert index._conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+def test_content_hash_ignores_whitespace_and_unicode_form():
+    """Test that bodies differing only in whitespace or unicode form hash the same."""
+    assert crawl_state.content_hash("반도체 \n\n 본문  입니다.") == crawl_state.content_hash("반도체 본문 입니다.")
+    assert crawl_state.content_hash("ＡＩ 반도체") == crawl_state.content_hash("AI 반도체")
+    assert crawl_state.content_hash("반도체 본문") != crawl_state.content_hash("반도체 본문 수정")
+
+def test_reformatted_content_keeps_summary(index):
+    """Test that a re-fetched body with only whitespace changes keeps the stored summary."""
+    index.record_articles('zdnet_semiconductor', [make_article(content="본문 첫 문단\n둘째 문단")])
+    index.record_summary(URL, "- 요약")
+
+    counts = index.record_articles('zdnet_semiconductor', [make_article(content="본문 첫 문단\n\n  둘째 문단\n")])
+
+    assert counts == {'new': 0, 'changed': 0, 'unchanged': 1}
+    seen = index.lookup(URL)
+    assert seen.summary == "- 요약"
+    assert seen.summary_status == crawl_state.SUMMARY_DONE
+
+def test_due_for_recheck(index):
+    """Test that only articles not checked within the recheck period are due for re-fetching."""
+    other_url = "https://zdnet.co.kr/view/?no=2"
+    index.record_articles('zdnet_semiconductor', [make_article(), make_article(url=other_url)])
+    time.sleep(0.01)
+
+    assert index.due_for_recheck([URL, other_url, "https://zdnet.co.kr/unknown"]) == set()
+    assert index.due_for_recheck([URL, other_url], recheck_seconds=0) == {URL, other_url}
+
+    # Only the re-fetched article gets a new check time.
+    index.record_articles('zdnet_semiconductor', [make_article(), make_article(url=other_url)], checked_urls={URL})
+    assert index.due_for_recheck([URL, other_url], recheck_seconds=0.005) == {other_url}
+
+def test_migrates_previous_schema(tmp_path):
+    """Test that an index created before content rechecks gets the new column and normalized hashes."""
+    db_path = str(tmp_path / 'crawl_state.sqlite3')
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE seen_urls (url TEXT PRIMARY KEY, source TEXT NOT NULL, title TEXT, published_date TEXT, "
+                 "content TEXT, content_hash TEXT, first_seen_date TEXT NOT NULL, last_seen_at REAL NOT NULL, "
+                 "summary_status TEXT NOT NULL, summary TEXT)")
+    conn.execute("INSERT INTO seen_urls VALUES (?, 'zdnet_semiconductor', '제목', '2025-06-28', ?, 'legacy', "
+                 "'2025-06-28', 100.0, 'done', '- 요약')", (URL, "본문\n\n입니다"))
+    conn.commit()
+    conn.close()
+
+    seen_index = SeenUrlIndex(db_path=db_path)
+    seen = seen_index.lookup(URL)
+    seen_index.close()
+
+    assert seen.checked_at == 100.0
+    assert seen.content_hash == crawl_state.content_hash("본문 입니다")
+    assert seen.summary_status == crawl_state.SUMMARY_DONE
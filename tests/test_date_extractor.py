@@ -0,0 +1,40 @@
+import os
+import sys
+import site
+import datetime as dt
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import date_extractor
+from src.services.date_extractor import DateExtractor
+
+# --- Test Cases ---
+
+@pytest.mark.parametrize('extractor, text, expected', [
+    (date_extractor.ZDNET_LIST_DATES, "2025.05.23 PM 01:22", dt.datetime(2025, 5, 23, 13, 22)),
+    (date_extractor.ZDNET_LINK_DATES, "/view/?no=20250628100000", dt.datetime(2025, 6, 28, 10, 0, 0)),
+    (date_extractor.ETNEWS_LIST_DATES, "2025-05-23 19:22", dt.datetime(2025, 5, 23, 19, 22)),
+    (date_extractor.THELEC_LIST_DATES, "반도체홍길동 기자2025-05-29", dt.datetime(2025, 5, 29)),
+    (date_extractor.THELEC_ARTICLE_DATES, "입력 2025.06.27승인 2025.06.28  10:30", dt.datetime(2025, 6, 28, 10, 30)),
+])
+def test_site_extractors(extractor, text, expected):
+    """Test each crawler's date extractor on its site's date text."""
+    assert extractor.extract(text) == expected
+
+def test_extract_prefers_higher_priority_format():
+    """Test that a later higher-priority match wins over an earlier lower-priority one."""
+    text = "수정 2025-06-27 / 등록 2025-06-28 10:00"
+    assert date_extractor.THELEC_LIST_DATES.extract(text) == dt.datetime(2025, 6, 28, 10, 0)
+
+def test_extract_skips_invalid_dates():
+    """Test that invalid dates are skipped and missing dates return None."""
+    extractor = DateExtractor([date_extractor.DASH_DATE])
+
+    assert extractor.extract("2025-13-45, 2025-06-28") == dt.datetime(2025, 6, 28)
+    assert extractor.extract("no date") is None
+    assert extractor.extract(None) is None
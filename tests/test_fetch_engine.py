@@ -0,0 +1,214 @@
+import os
+import sys
+import site
+import time
+import asyncio
+import threading
+import pytest
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from unittest.mock import patch, MagicMock
+
+import requests
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import circuit_breaker
+from src.services.circuit_breaker import CircuitOpenError
+from src.services.fetch_engine import FetchEngine, SessionPool, get_engine
+
+# --- Fixtures ---
+
+@pytest.fixture
+def engine():
+    """Fixture to create an isolated FetchEngine instance."""
+    return FetchEngine(max_concurrency=4, per_host_concurrency=2, timeout=5, retry_base_delay=0.01)
+
+def make_response(text):
+    response = MagicMock()
+    response.text = text
+    return response
+
+# --- Test Cases ---
+
+def test_fetch_text(engine):
+    """Test a single synchronous fetch through the engine."""
+    with patch.object(engine, '_request', return_value=make_response('<html>ok</html>')) as mock_request:
+        html = engine.fetch_text("https://zdnet.co.kr/news/?lstcode=0050", headers={'User-Agent': 'ua'})
+
+    assert html == '<html>ok</html>'
+    mock_request.assert_called_once_with("https://zdnet.co.kr/news/?lstcode=0050", {'User-Agent': 'ua'}, 5)
+
+def test_fetch_text_encoding(engine):
+    """Test that the response encoding is overridden when requested."""
+    response = make_response('본문')
+    with patch.object(engine, '_request', return_value=response):
+        engine.fetch_text("https://www.thelec.kr/news/articleView.html?idxno=1", encoding='utf-8')
+
+    assert response.encoding == 'utf-8'
+
+def test_fetch_text_raises(engine):
+    """Test that request errors propagate from the synchronous API."""
+    with patch.object(engine, '_request', side_effect=requests.exceptions.Timeout()):
+        with pytest.raises(requests.exceptions.Timeout):
+            engine.fetch_text("https://etnews.com/news/section.html?id1=06")
+
+def test_fetch_text_retries_transient_errors(engine):
+    """Test that timeouts and 5xx responses are retried until the request succeeds."""
+    server_error = requests.exceptions.HTTPError(response=MagicMock(status_code=503, headers={}))
+    side_effect = [requests.exceptions.Timeout(), server_error, make_response('<html>ok</html>')]
+    with patch.object(engine, '_request', side_effect=side_effect) as mock_request:
+        html = engine.fetch_text("https://etnews.com/news/section.html?id1=06")
+
+    assert html == '<html>ok</html>'
+    assert mock_request.call_count == 3
+    assert engine.circuit_state()['etnews.com']['consecutive_failures'] == 0
+
+def test_fetch_text_does_not_retry_not_found(engine):
+    """Test that a 404 response is raised without retrying."""
+    not_found = requests.exceptions.HTTPError(response=MagicMock(status_code=404, headers={}))
+    with patch.object(engine, '_request', side_effect=not_found) as mock_request:
+        with pytest.raises(requests.exceptions.HTTPError):
+            engine.fetch_text("https://etnews.com/news/article/1")
+
+    assert mock_request.call_count == 1
+
+def test_circuit_opens_after_repeated_failures():
+    """Test that a host is short-circuited after consecutive failures."""
+    engine = FetchEngine(max_retries=0)
+    with patch.object(engine, '_request', side_effect=requests.exceptions.ConnectionError()) as mock_request:
+        for _ in range(circuit_breaker.DEFAULT_FAILURE_THRESHOLD):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                engine.fetch_text("https://www.thelec.kr/news/1")
+        with pytest.raises(CircuitOpenError):
+            engine.fetch_text("https://www.thelec.kr/news/2")
+
+    assert mock_request.call_count == circuit_breaker.DEFAULT_FAILURE_THRESHOLD
+    assert engine.circuit_state()['www.thelec.kr']['state'] == 'open'
+
+def test_cancelled_trial_request_releases_breaker():
+    """Test that cancelling the half-open trial request does not leave the host blocked forever."""
+    engine = FetchEngine(max_retries=0)
+    url = "https://www.thelec.kr/news/1"
+    breaker = engine._breaker("www.thelec.kr")
+    breaker.state = circuit_breaker.STATE_HALF_OPEN
+    started, release = threading.Event(), threading.Event()
+
+    def slow_request(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return make_response("late")
+
+    with patch.object(engine, '_request', side_effect=slow_request):
+        future = asyncio.run_coroutine_threadsafe(engine.afetch_text(url), engine._ensure_loop())
+        assert started.wait(5)
+        future.cancel()
+        deadline = time.monotonic() + 5
+        while breaker._trial_in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+
+    assert future.cancelled()
+    assert breaker.state == circuit_breaker.STATE_HALF_OPEN
+    assert not breaker._trial_in_flight
+    with patch.object(engine, '_request', return_value=make_response("ok")):
+        assert engine.fetch_text(url) == "ok"
+    assert breaker.state == circuit_breaker.STATE_CLOSED
+
+def test_fetch_text_many_keeps_order_and_errors(engine):
+    """Test that batch results keep input order and failed URLs come back as exceptions."""
+    def fake_request(url, headers, timeout):
+        if url.endswith('2'):
+            raise requests.exceptions.ConnectionError()
+        return make_response(url)
+
+    urls = ["https://a.com/1", "https://a.com/2", "https://b.com/3"]
+    with patch.object(engine, '_request', side_effect=fake_request):
+        results = engine.fetch_text_many(urls)
+
+    assert results[0] == "https://a.com/1"
+    assert isinstance(results[1], requests.exceptions.ConnectionError)
+    assert results[2] == "https://b.com/3"
+
+def test_fetch_text_many_bounds_concurrency(engine):
+    """Test that global and per-host concurrency limits are respected."""
+    lock = threading.Lock()
+    active = {'total': 0, 'max_total': 0}
+    active_by_host = {}
+    max_by_host = {}
+
+    def fake_request(url, headers, timeout):
+        host = url.split('/')[2]
+        with lock:
+            active['total'] += 1
+            active['max_total'] = max(active['max_total'], active['total'])
+            active_by_host[host] = active_by_host.get(host, 0) + 1
+            max_by_host[host] = max(max_by_host.get(host, 0), active_by_host[host])
+        time.sleep(0.05)
+        with lock:
+            active['total'] -= 1
+            active_by_host[host] -= 1
+        return make_response(url)
+
+    urls = [f"https://host{i % 3}.com/{i}" for i in range(12)]
+    with patch.object(engine, '_request', side_effect=fake_request):
+        results = engine.fetch_text_many(urls)
+
+    assert results == urls
+    assert active['max_total'] <= 4
+    assert all(count <= 2 for count in max_by_host.values())
+
+def test_get_engine_is_shared():
+    """Test that the process-wide engine is a singleton."""
+    assert get_engine() is get_engine()
+
+def test_session_pool_hit_miss():
+    """Test that sessions are shared per host and hits/misses are counted."""
+    pool = SessionPool()
+    first = pool.get_session("zdnet.co.kr")
+    second = pool.get_session("zdnet.co.kr")
+    other = pool.get_session("www.thelec.kr")
+
+    assert first is second
+    assert first is not other
+    assert pool.stats()['session_hits'] == 1
+    assert pool.stats()['session_misses'] == 2
+
+def test_session_pool_reuses_connections():
+    """Test that repeated requests to one host reuse a keep-alive connection."""
+
+    class KeepAliveHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            body = b'ok'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    try:
+        pool = SessionPool()
+        engine = FetchEngine(max_concurrency=1, per_host_concurrency=1, session_pool=pool)
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        for i in range(3):
+            assert engine.fetch_text(f"{base_url}/{i}") == 'ok'
+
+        connection_stats = pool.stats()['connections'][f"127.0.0.1:{server.server_port}"]
+        assert connection_stats['requests'] == 3
+        assert connection_stats['new_connections'] == 1
+        assert connection_stats['reused_connections'] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
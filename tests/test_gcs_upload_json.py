@@ -219,10 +219,11 @@ def test_main_uploads_matching_files(mock_main_dependencies, caplog_setup, mocke
     pjt_home_path = gcs_upload_json.pjt_home_path
     local_data_dir = os.path.join(pjt_home_path, 'data')
     mock_listdir.return_value = [
-        'zdnet_news.json',
-        'thelec_news.json',
+        'zdnet_semiconductor_articles.jsonl',
+        'thelec_semiconductor_articles.jsonl',
         'zdnet_other.txt',
-        'zdnet_archive.json'
+        'zdnet_computing_articles.jsonl',
+        'zdnet_semiconductor_articles.json'  # 이전 형식 파일은 업로드하지 않음
     ]
 
     target_site = 'zdnet'
@@ -239,14 +240,15 @@ def test_main_uploads_matching_files(mock_main_dependencies, caplog_setup, mocke
     # 테스트에서 이 값을 명시적으로 확인해야 합니다.
     expected_gcs_base = f"news_data"
     expected_calls = [
-        mocker.call(os.path.join(local_data_dir, 'zdnet_news.json'), date_str=target_ymd),
-        mocker.call(os.path.join(local_data_dir, 'zdnet_archive.json'), date_str=target_ymd)
+        mocker.call(os.path.join(local_data_dir, 'zdnet_semiconductor_articles.jsonl'), date_str=target_ymd),
+        mocker.call(os.path.join(local_data_dir, 'zdnet_computing_articles.jsonl'), date_str=target_ymd)
     ]
     mock_upload.assert_has_calls(expected_calls, any_order=True)
     assert mock_upload.call_count == 2
 
     # 건너뛴 파일에 대한 로그가 올바르게 남았는지 확인합니다.
-    assert "skip target file...: 'thelec_news.json'" in caplog_setup.text
+    assert "skip target file...: 'thelec_semiconductor_articles.jsonl'" in caplog_setup.text
+    assert "skip target file...: 'zdnet_semiconductor_articles.json'" in caplog_setup.text
     assert "skip target file...: 'zdnet_other.txt'" in caplog_setup.text
 
 def test_main_handles_exception(mock_main_dependencies, caplog_setup):
@@ -0,0 +1,47 @@
+import os
+import sys
+import site
+import pytest
+
+from unittest.mock import patch
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import header_profiles
+from src.services.header_profiles import HeaderProfilePool
+
+# --- Test Cases ---
+
+def test_profiles_rotate_and_are_copies():
+    """Test round-robin rotation and that callers cannot modify the shared profiles."""
+    pool = HeaderProfilePool(user_agents=['ua-1', 'ua-2'])
+    first = pool.next()
+    first['User-Agent'] = 'changed'
+
+    assert pool.next()['User-Agent'] == 'ua-2'
+    assert pool.next()['User-Agent'] == 'ua-1'
+    assert pool.next()['Accept-Language'] == header_profiles.BASE_HEADERS['Accept-Language']
+
+def test_user_agents_loaded_lazily_once():
+    """Test that user agents are loaded on first use only."""
+    with patch('src.services.header_profiles._load_user_agents', return_value=['ua-1']) as mock_load:
+        pool = HeaderProfilePool(size=4)
+        mock_load.assert_not_called()
+        for _ in range(5):
+            pool.next()
+
+    mock_load.assert_called_once_with(4)
+    assert len(pool) == 1
+
+def test_fallback_when_fake_useragent_fails():
+    """Test the fallback user agents when fake_useragent cannot be loaded."""
+    with patch('fake_useragent.UserAgent', side_effect=RuntimeError("no data")):
+        assert header_profiles._load_user_agents(8) == header_profiles.FALLBACK_USER_AGENTS
+
+def test_get_header_pool_is_shared():
+    """Test that the header pool is a process-wide singleton."""
+    assert header_profiles.get_header_pool() is header_profiles.get_header_pool()
@@ -0,0 +1,58 @@
+import os
+import sys
+import site
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import html_parser
+
+ZDNET_ARTICLE_HTML = """
+<html><head><script>var tracking = 1;</script></head><body>
+    <div class="gnb"><a href="/">home</a></div>
+    <div id="articleBody"><p>Main article content.</p></div>
+    <div class="footer">footer</div>
+</body></html>
+"""
+
+# --- Test Cases ---
+
+def test_parse_html_full_page():
+    """Test that the full tree is built without a parse scope."""
+    soup = html_parser.parse_html(ZDNET_ARTICLE_HTML)
+
+    assert soup.find('div', class_='gnb') is not None
+    assert soup.select_one('#articleBody').get_text(strip=True) == "Main article content."
+
+def test_parse_html_scoped():
+    """Test that only the scoped elements and their subtrees are built."""
+    soup = html_parser.parse_html(ZDNET_ARTICLE_HTML, parse_only=html_parser.ZDNET_ARTICLE)
+
+    assert soup.find('div', class_='gnb') is None
+    assert soup.find('script') is None
+    assert soup.select_one('#articleBody').get_text(strip=True) == "Main article content."
+
+def test_parse_html_fallback_to_full():
+    """Test that a page without scoped elements is parsed in full when fallback is requested."""
+    html = '<html><body><div class="sub_view_cont"><p>Fallback content.</p></div></body></html>'
+
+    scoped = html_parser.parse_html(html, parse_only=html_parser.ZDNET_ARTICLE)
+    fallback = html_parser.parse_html(html, parse_only=html_parser.ZDNET_ARTICLE, fallback_to_full=True)
+
+    assert scoped.find('div', class_='sub_view_cont') is None
+    assert fallback.find('div', class_='sub_view_cont').get_text(strip=True) == "Fallback content."
+
+@pytest.mark.parametrize('strainer, html, selector', [
+    (html_parser.ETNEWS_LIST, '<div><ul class="news_list"><li><a href="/1">a</a></li></ul></div>', 'ul.news_list li'),
+    (html_parser.THELEC_LIST, '<section><div class="table-row"><a href="/news/1">a</a></div></section>', 'div.table-row a'),
+    (html_parser.ZDNET_LIST, '<div class="wrap"><div class="newsPost"><a href="/view/1">a</a></div></div>', 'div.newsPost a'),
+])
+def test_site_strainers_keep_list_items(strainer, html, selector):
+    """Test that each site's list scope keeps the elements the crawler reads."""
+    soup = html_parser.parse_html(html, parse_only=strainer)
+
+    assert soup.select_one(selector) is not None
@@ -0,0 +1,115 @@
+import os
+import sys
+import site
+import time
+import pytest
+
+from unittest.mock import patch, MagicMock
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.http_cache import HttpResponseCache
+from src.services.fetch_engine import FetchEngine
+
+URL = "https://zdnet.co.kr/view/?no=20250628100000"
+
+# --- Fixtures ---
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture to create a cache backed by a temporary SQLite file."""
+    response_cache = HttpResponseCache(db_path=str(tmp_path / 'http_cache.sqlite3'))
+    yield response_cache
+    response_cache.close()
+
+@pytest.fixture
+def engine(cache):
+    """Fixture to create a FetchEngine that uses the temporary cache."""
+    return FetchEngine(max_concurrency=2, per_host_concurrency=1, cache=cache)
+
+def make_response(status_code=200, content=b'', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers = headers or {}
+    return response
+
+# --- Test Cases for HttpResponseCache ---
+
+def test_store_and_lookup(cache):
+    """Test that stored responses are returned with their validators."""
+    cache.store(URL, '본문'.encode('utf-8'), encoding='utf-8', etag='"abc"', last_modified='Sat, 28 Jun 2025 01:00:00 GMT')
+    cached = cache.lookup(URL)
+
+    assert cached.text() == '본문'
+    assert cached.conditional_headers() == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Sat, 28 Jun 2025 01:00:00 GMT',
+    }
+    assert cache.lookup("https://zdnet.co.kr/unknown") is None
+
+def test_is_fresh(cache):
+    """Test TTL-based freshness."""
+    cache.store(URL, b'body')
+    cached = cache.lookup(URL)
+
+    assert cached.is_fresh(60) is True
+    assert cached.is_fresh(0) is False
+
+def test_evict_by_size(tmp_path):
+    """Test that least recently used entries are evicted above max_bytes."""
+    response_cache = HttpResponseCache(db_path=str(tmp_path / 'cache.sqlite3'), max_bytes=10)
+    response_cache.store("https://a.com/1", b'12345')
+    time.sleep(0.01)
+    response_cache.store("https://a.com/2", b'12345')
+    time.sleep(0.01)
+    response_cache.store("https://a.com/3", b'12345')
+
+    assert response_cache.lookup("https://a.com/1") is None
+    assert response_cache.lookup("https://a.com/3") is not None
+    assert response_cache.stats()['total_bytes'] == 10
+    response_cache.close()
+
+def test_evict_expired(tmp_path):
+    """Test that entries older than max_age are evicted."""
+    response_cache = HttpResponseCache(db_path=str(tmp_path / 'cache.sqlite3'), max_age=0.01)
+    response_cache.store(URL, b'body')
+    time.sleep(0.02)
+
+    assert response_cache.lookup(URL) is None
+    assert response_cache.evict_expired() == 1
+    response_cache.close()
+
+# --- Test Cases for FetchEngine cache integration ---
+
+def test_engine_miss_then_revalidated(engine, cache):
+    """Test that a second fetch sends validators and serves the cached body on 304."""
+    responses = [
+        make_response(200, b'<html>article</html>', {'ETag': '"v1"'}),
+        make_response(304),
+    ]
+    with patch.object(engine, '_request', side_effect=responses) as mock_request:
+        first = engine.fetch_text(URL, headers={'User-Agent': 'ua'})
+        second = engine.fetch_text(URL, headers={'User-Agent': 'ua'})
+
+    assert first == second == '<html>article</html>'
+    second_headers = mock_request.call_args_list[1][0][1]
+    assert second_headers['If-None-Match'] == '"v1"'
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['revalidated'] == 1
+
+def test_engine_fresh_hit_skips_network(engine, cache):
+    """Test that a fresh entry is served without a network request."""
+    cache.store(URL, b'<html>cached</html>', encoding='utf-8')
+    with patch.object(engine, '_request') as mock_request:
+        html = engine.fetch_text(URL, cache_ttl=60)
+
+    mock_request.assert_not_called()
+    assert html == '<html>cached</html>'
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,101 @@
+import os
+import sys
+import site
+import time
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.llm_cache import LlmResultCache, cache_key
+
+MODEL_NAME = 'gemini-2.0-flash-lite'
+
+# --- Fixtures ---
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture to create an LLM result cache in a temporary directory."""
+    cache = LlmResultCache(db_path=str(tmp_path / 'llm_cache.sqlite3'))
+    yield cache
+    cache.close()
+
+# --- Test Cases ---
+
+def test_cache_key_changes_with_each_part():
+    """Test that the key depends on model, template version, input and generation config."""
+    key = cache_key(MODEL_NAME, 1, '요약할 기사')
+
+    assert key == cache_key(MODEL_NAME, 1, '요약할 기사')
+    assert key != cache_key('gemini-2.0-flash', 1, '요약할 기사')
+    assert key != cache_key(MODEL_NAME, 2, '요약할 기사')
+    assert key != cache_key(MODEL_NAME, 1, '다른 기사')
+    assert key != cache_key(MODEL_NAME, 1, '요약할 기사', {'response_mime_type': 'application/json'})
+
+def test_get_or_generate_reuses_result(cache):
+    """Test that the same key is generated once and then served from the cache."""
+    calls = []
+
+    def generate():
+        calls.append(1)
+        return '* 요약'
+
+    key = cache_key(MODEL_NAME, 1, '요약할 기사')
+    assert cache.get_or_generate(key, generate) == '* 요약'
+    assert cache.get_or_generate(key, generate) == '* 요약'
+
+    assert len(calls) == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'entries': 1}
+
+def test_failed_generation_is_not_cached(cache):
+    """Test that an exception from the API call is raised and nothing is stored."""
+    key = cache_key(MODEL_NAME, 1, '요약할 기사')
+
+    def fail():
+        raise RuntimeError('quota exceeded')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_generate(key, fail)
+    assert cache.get(key) is None
+    assert cache.stats()['entries'] == 0
+
+def test_persists_across_instances(cache):
+    """Test that stored results are available to the next run."""
+    key = cache_key(MODEL_NAME, 1, '요약할 기사')
+    cache.put(key, '* 요약')
+    cache.close()
+
+    reopened = LlmResultCache(db_path=cache.db_path)
+    assert reopened.get(key) == '* 요약'
+    reopened.close()
+
+def test_evicts_least_recently_used(tmp_path):
+    """Test that the least recently used entries are removed beyond max_entries."""
+    cache = LlmResultCache(db_path=str(tmp_path / 'llm_cache.sqlite3'), max_entries=2)
+    cache.put('a', 'A')
+    time.sleep(0.01)
+    cache.put('b', 'B')
+    time.sleep(0.01)
+    cache.get('a')  # 'a' is now more recently used than 'b'
+    time.sleep(0.01)
+    cache.put('c', 'C')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A'
+    assert cache.get('c') == 'C'
+    assert cache.stats()['entries'] == 2
+    cache.close()
+
+def test_expired_entries(tmp_path):
+    """Test that entries older than max_age are ignored and evicted."""
+    cache = LlmResultCache(db_path=str(tmp_path / 'llm_cache.sqlite3'), max_age=0.05)
+    cache.put('a', 'A')
+    time.sleep(0.1)
+
+    assert cache.get('a') is None
+    assert cache.evict_expired() == 1
+    assert cache.stats()['entries'] == 0
+    cache.close()
@@ -0,0 +1,185 @@
+import os
+import sys
+import site
+import time
+import threading
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.llm_executor import LlmExecutor, RequestBudget, estimate_tokens, retry_hint_seconds, status_code_of
+from src.services.llm_executor import DEFAULT_MAX_IN_FLIGHT
+
+# --- Test Cases ---
+
+def test_map_keeps_input_order():
+    """Test that results are returned in input order even when later items finish first."""
+    executor = LlmExecutor(max_in_flight=4, budget=RequestBudget(requests_per_minute=6000, burst=4))
+
+    def slow_echo(value, delay):
+        time.sleep(delay)
+        return value
+
+    assert executor.map(slow_echo, ['a', 'b', 'c'], [0.05, 0.01, 0.0]) == ['a', 'b', 'c']
+    assert executor.map(slow_echo, [], []) == []
+
+def test_call_limits_in_flight_requests():
+    """Test that no more than max_in_flight API calls run at the same time."""
+    executor = LlmExecutor(max_in_flight=2, budget=RequestBudget(requests_per_minute=60000, burst=10))
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def fake_api_call():
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(0.02)
+        with lock:
+            state['running'] -= 1
+        return 'ok'
+
+    # Tasks may issue several API calls each (like tweet translation + title + summary).
+    results = LlmExecutor(max_in_flight=6).map(lambda _: [executor.call(fake_api_call) for _ in range(2)], range(6))
+
+    assert results == [['ok', 'ok']] * 6
+    assert state['peak'] <= 2
+    assert executor.stats()['calls'] == 12
+
+def test_map_overlaps_calls_under_default_budget():
+    """Test that the default budget lets a batch larger than max_in_flight run concurrently without minute-long waits."""
+    executor = LlmExecutor()
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def fake_api_call(value):
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(0.05)
+        with lock:
+            state['running'] -= 1
+        return value
+
+    items = list(range(DEFAULT_MAX_IN_FLIGHT * 3))
+    started = time.monotonic()
+    results = executor.map(lambda value: executor.call(fake_api_call, value), items)
+    elapsed = time.monotonic() - started
+
+    assert results == items
+    assert state['peak'] == DEFAULT_MAX_IN_FLIGHT
+    # At 30 requests per minute every call after the burst would wait 2 seconds.
+    assert elapsed < 2.0
+
+def test_budget_paces_requests():
+    """Test that the requests-per-minute budget spaces out requests beyond the burst."""
+    budget = RequestBudget(requests_per_minute=600, burst=1)  # 10 requests/sec
+
+    started = time.monotonic()
+    for _ in range(3):
+        budget.acquire()
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.18
+    assert budget.waited_seconds > 0
+
+class FakeApiError(Exception):
+    """Stand-in for google.api_core exceptions, which carry the HTTP status in `code`."""
+
+    def __init__(self, code, message='', details=None):
+        super().__init__(message)
+        self.code = code
+        self.details = details or []
+
+class FakeRetryDelay:
+    seconds = 3
+    nanos = 500000000
+
+class FakeRetryInfo:
+    retry_delay = FakeRetryDelay()
+
+def fast_executor(**kwargs):
+    budget = RequestBudget(requests_per_minute=60000, burst=10)
+    return LlmExecutor(max_in_flight=2, budget=budget, retry_base_delay=0.01, retry_max_delay=1.0, **kwargs)
+
+def test_retry_hint_seconds():
+    """Test that the retry delay is read from RetryInfo details, Retry-After or the error message."""
+    assert retry_hint_seconds(FakeApiError(429, details=[FakeRetryInfo()])) == 3.5
+    assert retry_hint_seconds(FakeApiError(429, '429 Quota exceeded. retry_delay {\n  seconds: 14\n}')) == 14
+    assert retry_hint_seconds(FakeApiError(429, 'Resource exhausted. Please retry in 7.25s.')) == 7.25
+    assert retry_hint_seconds(FakeApiError(429, 'Resource exhausted.')) is None
+
+def test_status_code_of():
+    assert status_code_of(FakeApiError(429)) == 429
+    assert status_code_of(ValueError('rate limit')) is None
+
+def test_call_retries_rate_limited_requests():
+    """Test that 429 responses are retried with backoff and then succeed."""
+    executor = fast_executor()
+    attempts = []
+
+    def flaky_api_call(prompt):
+        attempts.append(prompt)
+        if len(attempts) < 3:
+            raise FakeApiError(429, 'Resource exhausted. Please retry in 0.05s.')
+        return 'ok'
+
+    started = time.monotonic()
+    assert executor.call(flaky_api_call, 'prompt') == 'ok'
+
+    # The retry hint pauses the shared budget before each retry.
+    assert time.monotonic() - started >= 0.1
+    assert executor.stats()['calls'] == 3
+    assert executor.stats()['retries'] == 2
+    assert executor.stats()['rate_limited'] == 2
+
+def test_call_does_not_retry_client_errors():
+    """Test that non-retryable errors are raised immediately."""
+    executor = fast_executor()
+
+    def bad_request(prompt):
+        raise FakeApiError(400, 'API key not valid')
+
+    with pytest.raises(FakeApiError):
+        executor.call(bad_request, 'prompt')
+    assert executor.stats()['calls'] == 1
+    assert executor.stats()['retries'] == 0
+
+def test_call_retries_are_bounded():
+    """Test that retries stop at max_retries, at the shared retry budget and at hints beyond the max delay."""
+    def always_unavailable(prompt):
+        raise FakeApiError(503, 'The model is overloaded.')
+
+    executor = fast_executor(max_retries=2)
+    with pytest.raises(FakeApiError):
+        executor.call(always_unavailable, 'prompt')
+    assert executor.stats()['calls'] == 3
+
+    executor = fast_executor(max_retries=5, retry_budget=1)
+    with pytest.raises(FakeApiError):
+        executor.call(always_unavailable, 'prompt')
+    assert executor.stats()['calls'] == 2
+    assert executor.stats()['retry_budget_left'] == 0
+
+    def daily_quota_exceeded(prompt):
+        raise FakeApiError(429, 'Quota exceeded. Please retry in 3600s.')
+
+    executor = fast_executor()
+    with pytest.raises(FakeApiError):
+        executor.call(daily_quota_exceeded, 'prompt')
+    assert executor.stats()['calls'] == 1
+
+def test_budget_paces_tokens():
+    """Test that the tokens-per-minute budget holds back requests with large prompts."""
+    budget = RequestBudget(requests_per_minute=60000, burst=10, tokens_per_minute=6000)  # 100 tokens/sec
+
+    started = time.monotonic()
+    budget.acquire(tokens=6000)
+    budget.acquire(tokens=20)
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.15
+    assert estimate_tokens('가' * 100, {'response_mime_type': 'application/json'}) == 51
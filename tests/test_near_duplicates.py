@@ -0,0 +1,84 @@
+import os
+import sys
+import site
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import near_duplicates
+
+WIRE_BODY = ("삼성전자가 차세대 고대역폭메모리(HBM4) 양산을 시작했다고 28일 밝혔다. "
+             "회사는 이번 제품이 이전 세대보다 대역폭을 두 배 이상 높였으며 전력 효율도 크게 개선했다고 설명했다. "
+             "SK하이닉스도 다음 달 HBM4 12단 제품 공급을 앞두고 있어 양사의 주도권 경쟁이 치열해질 전망이다. "
+             "업계에서는 AI 가속기 수요 증가로 HBM 시장이 내년에도 두 자릿수 성장을 이어갈 것으로 보고 있다.")
+
+def make_article(url, title, content, sections):
+    return {'title': title, 'url': url, 'published_date': '2025-06-28', 'content': content, 'sections': sections}
+
+# --- Test Cases ---
+
+def test_similar_text_has_high_jaccard():
+    """Test that reformatted copies of a story are near-identical and unrelated text is not."""
+    original = near_duplicates.shingles(WIRE_BODY)
+    reformatted = near_duplicates.shingles(WIRE_BODY.replace(' ', '  ').replace('. ', '.\n'))
+    unrelated = near_duplicates.shingles("현대차가 전기차 전용 공장을 울산에 준공하고 연간 20만 대 생산 체제를 갖췄다.")
+
+    assert near_duplicates.jaccard(original, reformatted) == 1.0
+    assert near_duplicates.jaccard(original, unrelated) < 0.1
+
+def test_cluster_articles_groups_wire_stories():
+    """Test that the same wire story on several sites forms one cluster represented by the longest body."""
+    articles = [
+        make_article('https://zdnet.co.kr/view/?no=1', '삼성전자, HBM4 양산 시작', WIRE_BODY, ['zdnet_semiconductor']),
+        make_article('https://etnews.com/1', '현대차 울산 전기차 공장 준공',
+                     "현대차가 전기차 전용 공장을 울산에 준공하고 연간 20만 대 생산 체제를 갖췄다.", ['etnews_it']),
+        make_article('https://www.thelec.kr/news/articleView.html?idxno=1', '삼성전자 HBM4 양산 개시',
+                     WIRE_BODY + " 삼성전자는 하반기 고객사 인증을 마칠 계획이다.", ['thelec_semiconductor']),
+        make_article('https://etnews.com/2', '삼성, HBM4 양산', WIRE_BODY.replace("28일", "이날"), ['etnews_electronics']),
+    ]
+
+    clusters = near_duplicates.cluster_articles(articles)
+
+    assert [[article['url'] for article in cluster] for cluster in clusters] == [
+        ['https://www.thelec.kr/news/articleView.html?idxno=1', 'https://zdnet.co.kr/view/?no=1', 'https://etnews.com/2'],
+        ['https://etnews.com/1'],
+    ]
+
+def test_cluster_articles_keeps_distinct_articles():
+    """Test that articles without near-duplicates stay in their own clusters, in input order."""
+    articles = [make_article(f'https://etnews.com/{i}', f'기사 {i}', f'서로 다른 주제의 기사 본문 {i} ' + '가나다라마바사'[i] * 50,
+                             ['etnews_it']) for i in range(3)]
+
+    clusters = near_duplicates.cluster_articles(articles)
+
+    assert clusters == [[article] for article in articles]
+
+def test_minhash_is_deterministic():
+    """Test that signatures are stable (fixed hash coefficients) and empty text has no signature."""
+    shingle_set = near_duplicates.shingles(WIRE_BODY)
+
+    assert near_duplicates.minhash(shingle_set) == near_duplicates.minhash(set(shingle_set))
+    assert len(near_duplicates.minhash(shingle_set)) == near_duplicates.NUM_PERMUTATIONS
+    assert near_duplicates.minhash(near_duplicates.shingles("")) == ()
+
+def test_other_site_alternates_skips_same_site_reposts():
+    """Test that a same-site repost is clustered but not listed as another outlet."""
+    articles = [
+        make_article('https://zdnet.co.kr/view/?no=1', '삼성전자, HBM4 양산 시작',
+                     WIRE_BODY + " 삼성전자는 하반기 고객사 인증을 마칠 계획이다.", ['zdnet_semiconductor']),
+        make_article('https://zdnet.co.kr/view/?no=2', '삼성전자, HBM4 양산 시작', WIRE_BODY, ['zdnet_computing']),
+        make_article('https://etnews.com/2', '삼성, HBM4 양산', WIRE_BODY.replace("28일", "이날"), ['etnews_electronics']),
+    ]
+
+    clusters = near_duplicates.cluster_articles(articles)
+
+    assert len(clusters) == 1
+    assert clusters[0][0]['url'] == 'https://zdnet.co.kr/view/?no=1'
+    assert near_duplicates.other_site_alternates(clusters[0]) == [
+        {'title': '삼성, HBM4 양산', 'url': 'https://etnews.com/2', 'site': 'etnews'},
+    ]
+    assert near_duplicates.other_site_alternates(clusters[0][:2]) == []
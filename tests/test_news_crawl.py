@@ -0,0 +1,145 @@
+import os
+import sys
+import site
+import json
+import pytest
+import datetime as dt
+
+from unittest.mock import patch, MagicMock, call
+
+import pytz
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import fetch_engine
+from src.services import news_crawl
+from src.services import news_sites
+
+KST = pytz.timezone('Asia/Seoul')
+
+# --- Test Cases for the site registry ---
+
+def test_batch_targets():
+    """Test that the batch covers every registered section except the ones opted out."""
+    sources = [adapter.source(section) for adapter, section in news_sites.batch_targets()]
+
+    assert len(sources) == 10
+    assert 'zdnet_ai' not in sources
+    assert 'thelec_battery' in sources
+    assert news_sites.ETNEWS.section('SW').url == "https://etnews.com/news/section.html?id1=04"
+    with pytest.raises(KeyError):
+        news_sites.ZDNET.section('전자')
+
+def test_target_date_range():
+    """Test the per-site collection window."""
+    start_date, end_date = news_crawl.target_date_range(news_sites.ETNEWS, "20240103")
+
+    assert end_date == KST.localize(dt.datetime(2024, 1, 4))
+    assert start_date == KST.localize(dt.datetime(2024, 1, 2))
+
+# --- Test Cases for the orchestrator ---
+
+@patch('src.services.news_crawl.collect_section')
+@patch('src.services.news_crawl.list_section')
+def test_crawl_all_isolates_failures(mock_list_section, mock_collect_section):
+    """Test that a failing section does not stop the other sections."""
+    def fake_list_section(adapter, section, base_ymd):
+        if adapter.name == 'thelec':
+            raise RuntimeError("list page changed")
+        return MagicMock(), [{'url': f"{section.url}/1"}]
+
+    mock_list_section.side_effect = fake_list_section
+    mock_collect_section.side_effect = lambda adapter, section, crawler, articles, run_key: len(articles)
+    summary = news_crawl.crawl_all("20240101")
+
+    assert mock_list_section.call_count == 10
+    assert mock_collect_section.call_count == 7
+    assert summary['zdnet_semiconductor'] == 1
+    assert summary['etnews_it'] == 1
+    assert isinstance(summary['thelec_automotive'], RuntimeError)
+
+@patch('src.services.news_crawl.collect_section')
+@patch('src.services.news_crawl.list_section')
+def test_crawl_all_fetches_shared_articles_once(mock_list_section, mock_collect_section):
+    """Test that an article listed in several sections is collected by the first section only."""
+    shared_url = "https://zdnet.co.kr/view/?no=20240101120000"
+    mock_list_section.side_effect = lambda adapter, section, base_ymd: (
+        MagicMock(), [{'url': shared_url, 'content': ''}, {'url': f"{section.url}/own", 'content': ''}])
+    mock_collect_section.side_effect = lambda adapter, section, crawler, articles, run_key: len(articles)
+    targets = [(news_sites.ZDNET, news_sites.ZDNET.section(name)) for name in ('반도체', '컴퓨팅')]
+
+    summary = news_crawl.crawl_all("20240101", targets=targets)
+
+    assert summary == {'zdnet_semiconductor': 2, 'zdnet_computing': 1}
+    shared_article = mock_collect_section.call_args_list[0].args[3][0]
+    assert shared_article['sections'] == ['zdnet_semiconductor', 'zdnet_computing']
+
+@patch('src.services.news_crawler_etnews.NewsCrawlerEtnews')
+def test_crawl_section_uses_site_crawler(MockCrawler, tmp_path, monkeypatch):
+    """Test that a section is crawled with the crawler module named in the registry."""
+    monkeypatch.setattr('src.services.news_sites.pjt_home_path', str(tmp_path))
+    (tmp_path / 'data').mkdir()
+    mock_crawler = MagicMock()
+    mock_crawler.fetch_articles.return_value = [
+        {'title': 'T', 'url': 'http://fake.url/1', 'published_date': '2024-01-01', 'content': 'Known content.'}
+    ]
+    MockCrawler.return_value = mock_crawler
+
+    saved = news_crawl.crawl_section(news_sites.ETNEWS, news_sites.ETNEWS.section('IT'), "20240101")
+
+    assert saved == 1
+    assert MockCrawler.call_args.args[0] == "https://etnews.com/news/section.html?id1=03"
+    mock_crawler.fetch_article_contents.assert_not_called()
+    mock_crawler.seen_index.record_articles.assert_called_once()
+    assert (tmp_path / 'data' / 'etnews_it_articles.jsonl').exists()
+
+def test_collect_section_resumes_partial_file(tmp_path, monkeypatch):
+    """Test that a rerun after a failure skips the articles already written."""
+    monkeypatch.setattr('src.services.news_sites.pjt_home_path', str(tmp_path))
+    (tmp_path / 'data').mkdir()
+    monkeypatch.setattr(news_crawl, 'CONTENT_BATCH_SIZE', 1)
+    adapter, section = news_sites.ZDNET, news_sites.ZDNET.section('반도체')
+
+    def make_articles():
+        return [{'title': f'T{i}', 'url': f'http://fake.url/{i}', 'published_date': '2024-01-01', 'content': ''}
+                for i in range(3)]
+
+    crawler = MagicMock(seen_index=None)
+    crawler.fetch_article_contents.side_effect = [["Body 0"], RuntimeError("network down")]
+    with pytest.raises(RuntimeError):
+        news_crawl.collect_section(adapter, section, crawler, make_articles(), run_key="20240101")
+    assert not os.path.exists(adapter.output_path(section))
+
+    crawler.fetch_article_contents.side_effect = lambda urls: [f"Body {url[-1]}" for url in urls]
+    saved = news_crawl.collect_section(adapter, section, crawler, make_articles(), run_key="20240101")
+
+    assert saved == 3
+    assert crawler.fetch_article_contents.call_args_list[-2:] == [call(['http://fake.url/1']), call(['http://fake.url/2'])]
+    lines = open(adapter.output_path(section), encoding='utf-8').read().splitlines()
+    assert [json.loads(line)['content'] for line in lines] == ["Body 0", "Body 1", "Body 2"]
+
+def test_collect_section_rechecks_known_articles(tmp_path, monkeypatch):
+    """Test that known articles due for a recheck are re-fetched and keep their body when the re-fetch fails."""
+    monkeypatch.setattr('src.services.news_sites.pjt_home_path', str(tmp_path))
+    (tmp_path / 'data').mkdir()
+    adapter, section = news_sites.ZDNET, news_sites.ZDNET.section('반도체')
+    articles = [{'title': f'T{i}', 'url': f'http://fake.url/{i}', 'published_date': '2024-01-01', 'content': c}
+                for i, c in enumerate(["Stored 0", "Stored 1", "Stored 2", ""])]
+
+    crawler = MagicMock()
+    crawler.seen_index.due_for_recheck.return_value = {'http://fake.url/1', 'http://fake.url/2'}
+    crawler.fetch_article_contents.return_value = [
+        "Updated 1", fetch_engine.FetchFailure('http://fake.url/2', fetch_engine.FAILURE_TIMEOUT, 'timeout'), "Body 3"]
+
+    saved = news_crawl.collect_section(adapter, section, crawler, articles, run_key="20240101")
+
+    assert saved == 4
+    crawler.seen_index.due_for_recheck.assert_called_once_with(['http://fake.url/0', 'http://fake.url/1', 'http://fake.url/2'])
+    crawler.fetch_article_contents.assert_called_once_with(['http://fake.url/1', 'http://fake.url/2', 'http://fake.url/3'])
+    assert crawler.seen_index.record_articles.call_args.kwargs['checked_urls'] == {'http://fake.url/1', 'http://fake.url/3'}
+    lines = open(adapter.output_path(section), encoding='utf-8').read().splitlines()
+    assert [json.loads(line)['content'] for line in lines] == ["Stored 0", "Updated 1", "Stored 2", "Body 3"]
@@ -6,7 +6,7 @@ import re
 import pytest
 import datetime as dt
 
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open, ANY
 
 import pytz
 from bs4 import BeautifulSoup
@@ -18,6 +18,9 @@ pjt_home_path = os.path.abspath(pjt_home_path)
 site.addsitedir(pjt_home_path)
 
 from src.services.news_crawler_thelec import ThelecNewsCrawler, main as thelec_main
+from src.services.header_profiles import HeaderProfilePool
+from src.services.fetch_engine import FetchEngine
+from src.services.parse_pipeline import ParsePipeline
 
 # Constants
 BASE_URL = "https://www.thelec.kr/news/articleList.html?sc_section_code=S1N2"
@@ -28,10 +31,9 @@ KST = pytz.timezone('Asia/Seoul')
 
 @pytest.fixture
 def mock_user_agent(mocker):
-    """Fixture to mock UserAgent."""
-    mock = mocker.patch('src.services.news_crawler_thelec.UserAgent')
-    mock.return_value.random = 'test-user-agent'
-    return mock
+    """Fixture to use a fixed header profile pool."""
+    pool = HeaderProfilePool(user_agents=['test-user-agent'])
+    return mocker.patch('src.services.header_profiles.get_header_pool', return_value=pool)
 
 @pytest.fixture
 def crawler(mock_user_agent):
@@ -54,24 +56,24 @@ def test_parse_date(crawler):
     assert crawler._parse_date("invalid-date") == dt.datetime.min
 
 def test_is_target_section(crawler):
-    """Test the logic for identifying if an article belongs to the target section."""
-    # Case 1: Section tag matches
-    html_with_section = '<div class="list-item"><small class="list-section">반도체</small><h3>Title</h3></div>'
-    element_with_section = BeautifulSoup(html_with_section, 'html.parser').div
-    assert crawler._is_target_section(element_with_section) is True
-
-    # Case 2: Section tag does not match
-    html_no_section_match = '<div class="list-item"><small class="list-section">디스플레이</small><h3>Title</h3></div>'
-    element_no_section_match = BeautifulSoup(html_no_section_match, 'html.parser').div
-    assert crawler._is_target_section(element_no_section_match) is False
-
-    # Case 3: Section tag is missing
-    html_no_section_tag = '<div class="list-item"><h3>Title</h3></div>'
-    element_no_section_tag = BeautifulSoup(html_no_section_tag, 'html.parser').div
-    assert crawler._is_target_section(element_no_section_tag) is False
-
-@patch('src.services.news_crawler_thelec.requests.get')
-def test_get_published_date_from_article_page(mock_get, crawler):
+    """Test the logic for identifying if a list item belongs to the target section."""
+    html = """
+    <div class="list-item"><a href="/news/articleView.html?idxno=1">Semiconductor article</a>
+        <small class="list-section">반도체</small></div>
+    <div class="list-item"><a href="/news/articleView.html?idxno=2">Display article</a>
+        <small class="list-section">디스플레이</small></div>
+    <div class="list-item"><a href="/news/articleView.html?idxno=3">Article without section</a></div>
+    """
+    sections = [item.section for item in crawler._iter_list_items(BeautifulSoup(html, 'html.parser'))]
+
+    # Case 1: Section tag matches / Case 2: Section tag does not match / Case 3: Section tag is missing
+    assert sections == ["반도체", "디스플레이", None]
+    assert crawler._is_target_section_text(sections[0]) is True
+    assert crawler._is_target_section_text(sections[1]) is False
+    assert crawler._is_target_section_text(" 산업 > 반도체 ") is True
+
+@patch.object(FetchEngine, 'fetch_text')
+def test_get_published_date_from_article_page(mock_fetch_text, crawler):
     """Test extracting the published date from a single article page."""
     mock_html = """
     <html><body>
@@ -80,34 +82,48 @@ def test_get_published_date_from_article_page(mock_get, crawler):
         </div>
     </body></html>
     """
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_fetch_text.return_value = mock_html
 
     expected_date = dt.datetime(2025, 6, 28, 10, 30)
     result_date = crawler._get_published_date_from_article_page("http://fake.url/article")
     
     assert result_date == expected_date
 
-@patch('src.services.news_crawler_thelec.requests.get')
-def test_get_section_from_article_page(mock_get, crawler):
+@patch.object(FetchEngine, 'fetch_text')
+def test_get_section_from_article_page(mock_fetch_text, crawler):
     """Test extracting the section from a single article page's meta tag."""
     mock_html = """
     <html><head>
         <meta property="article:section" content="반도체"/>
     </head></html>
     """
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_fetch_text.return_value = mock_html
 
     section = crawler._get_section_from_article_page("http://fake.url/article")
     assert section == "반도체"
 
-@patch('src.services.news_crawler_thelec.requests.get')
-def test_fetch_articles_integration(mock_get, crawler):
+def test_iter_list_items_dedups_nested_candidates(crawler):
+    """Test that nested candidate elements pointing to the same article are extracted once."""
+    html = """
+    <div class="table-row">
+        <div class="list-item">
+            <a href="/news/articleView.html?idxno=1">Nested semiconductor article</a>
+            <small class="list-section">반도체</small>
+            <span class="by-time">2025-06-28 10:00</span>
+        </div>
+    </div>
+    <li class="news-item"><a href="/news/articleView.html?idxno=2">Article without date</a></li>
+    """
+    items = list(crawler._iter_list_items(BeautifulSoup(html, 'html.parser')))
+
+    assert items == [
+        ("Nested semiconductor article", "https://www.thelec.kr/news/articleView.html?idxno=1",
+         dt.datetime(2025, 6, 28, 10, 0), "반도체"),
+        ("Article without date", "https://www.thelec.kr/news/articleView.html?idxno=2", None, None),
+    ]
+
+@patch.object(FetchEngine, 'fetch_text')
+def test_fetch_articles_integration(mock_fetch_text, crawler):
     """
     Test the fetch_articles method, integrating the section and date filtering logic.
     This test mocks the network calls made by helper methods.
@@ -132,26 +148,89 @@ def test_fetch_articles_integration(mock_get, crawler):
         </div>
     </body></html>
     """
-    mock_list_response = MagicMock()
-    mock_list_response.text = list_page_html
-    mock_list_response.raise_for_status.return_value = None
-    
-    # The first call to get() is for the list page.
-    mock_get.return_value = mock_list_response
+    # Article pages opened for the meta section check have no section meta tag.
+    mock_fetch_text.return_value = list_page_html
 
     # Set a date range that includes only the first article
     start_date = KST.localize(dt.datetime(2025, 6, 27))
     end_date = KST.localize(dt.datetime(2025, 6, 29))
     crawler.set_target_date_range(start_date, end_date)
 
-    articles = crawler.fetch_articles(pages=1)
+    articles = crawler.fetch_articles()
 
     assert len(articles) == 1
     assert articles[0]['title'] == "Article 1 (Semiconductor, In Date)"
     assert articles[0]['url'] == "https://www.thelec.kr/news/articleView.html?idxno=1"
-
-@patch('src.services.news_crawler_thelec.requests.get')
-def test_fetch_article_content(mock_get, crawler):
+    # The first page already reaches before start_date, so page 2 is never requested.
+    requested_urls = [c[0][0] for c in mock_fetch_text.call_args_list]
+    assert not any('page=2' in url for url in requested_urls)
+
+@patch.object(FetchEngine, 'fetch_text')
+def test_fetch_articles_stops_when_date_window_covered(mock_fetch_text, crawler):
+    """Test that list pages are requested until a page reaches before start_date."""
+    def list_page(idxno, date_text):
+        return f"""
+        <html><body>
+            <div class="list-item">
+                <a href="/news/articleView.html?idxno={idxno}">Semiconductor article {idxno}</a>
+                <small class="list-section">반도체</small>
+                <span class="by-time">{date_text}</span>
+            </div>
+        </body></html>
+        """
+    pages = {
+        1: list_page(3, "2025-06-28 10:00"),
+        2: list_page(2, "2025-06-27 10:00"),
+        3: list_page(1, "2025-06-20 10:00"),
+    }
+    mock_fetch_text.side_effect = lambda url, **kwargs: pages[int(url.rsplit('page=', 1)[1])]
+
+    crawler.set_target_date_range(KST.localize(dt.datetime(2025, 6, 27)), KST.localize(dt.datetime(2025, 6, 29)))
+    articles = crawler.fetch_articles(max_pages=5)
+
+    assert [article['title'] for article in articles] == ["Semiconductor article 3", "Semiconductor article 2"]
+    assert mock_fetch_text.call_count == 3
+
+@patch.object(FetchEngine, 'fetch_text')
+def test_fetch_articles_keeps_only_filtered_article_pages(mock_fetch_text, crawler):
+    """Test that article pages opened during filtering are cached only for the articles that passed."""
+    list_page_html = """
+    <html><body>
+        <div class="list-item">
+            <a href="/news/articleView.html?idxno=1">Semiconductor by meta tag</a>
+            <span class="by-time">2025-06-28 10:00</span>
+        </div>
+        <div class="list-item">
+            <a href="/news/articleView.html?idxno=2">Display by meta tag</a>
+            <span class="by-time">2025-06-28 11:00</span>
+        </div>
+        <div class="list-item">
+            <a href="/news/articleView.html?idxno=3">Old article without list date</a>
+            <small class="list-section">반도체</small>
+        </div>
+    </body></html>
+    """
+    article_pages = {
+        '1': '<html><head><meta property="article:section" content="반도체"/></head><body></body></html>',
+        '2': '<html><head><meta property="article:section" content="디스플레이"/></head><body></body></html>',
+        '3': '<html><body><div class="info-text">2023-01-01 12:00</div></body></html>',
+    }
+
+    def fetch_text(url, **kwargs):
+        if 'idxno=' in url:
+            return article_pages[url.rsplit('idxno=', 1)[1]]
+        return list_page_html
+    mock_fetch_text.side_effect = fetch_text
+
+    crawler.set_target_date_range(KST.localize(dt.datetime(2025, 6, 27)), KST.localize(dt.datetime(2025, 6, 29)))
+    articles = crawler.fetch_articles(max_pages=1)
+
+    url_1 = "https://www.thelec.kr/news/articleView.html?idxno=1"
+    assert [article['url'] for article in articles] == [url_1]
+    assert set(crawler._article_page_cache) == {url_1}
+
+@patch.object(FetchEngine, 'afetch_text', new_callable=AsyncMock)
+def test_fetch_article_content(mock_afetch_text, crawler):
     """Test fetching and cleaning individual article content."""
     mock_html = """
     <html><body>
@@ -164,10 +243,7 @@ def test_fetch_article_content(mock_get, crawler):
         </div>
     </body></html>
     """
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_afetch_text.return_value = mock_html
 
     content = crawler.fetch_article_content("http://fake.url/article")
 
@@ -176,35 +252,57 @@ def test_fetch_article_content(mock_get, crawler):
     assert "Advertisement" not in content
     assert "관련기사" not in content
 
+@patch.object(ParsePipeline, 'fetch_and_parse_many')
+@patch.object(FetchEngine, 'fetch_text')
+def test_article_page_fetched_once(mock_fetch_text, mock_fetch_and_parse_many, crawler):
+    """Test that date, section meta and body extraction share one article page download."""
+    mock_html = """
+    <html><head>
+        <meta property="article:section" content="반도체"/>
+    </head><body>
+        <div class="article-view-info"><span>승인 2025.06.28 10:30</span></div>
+        <div class="article-content"><p>Main content from cached page.</p></div>
+    </body></html>
+    """
+    mock_fetch_text.return_value = mock_html
+    article_url = "https://www.thelec.kr/news/articleView.html?idxno=1"
+
+    assert crawler._get_published_date_from_article_page(article_url) == dt.datetime(2025, 6, 28, 10, 30)
+    assert crawler._get_section_from_article_page(article_url) == "반도체"
+    contents = crawler.fetch_article_contents([article_url])
+
+    mock_fetch_text.assert_called_once()
+    mock_fetch_and_parse_many.assert_not_called()
+    assert "Main content from cached page." in contents[0]
+
 # --- Test Cases for main Function ---
 
 @patch('src.services.news_crawler_thelec.ThelecNewsCrawler')
-@patch('src.services.news_crawler_thelec.open', new_callable=mock_open)
-@patch('src.services.news_crawler_thelec.json.dump')
-def test_main_success(mock_json_dump, mock_file_open, MockCrawler, mock_user_agent):
+def test_main_success(MockCrawler, mock_user_agent, tmp_path, monkeypatch):
     """Test the main function's success path."""
+    monkeypatch.setattr('src.services.news_sites.pjt_home_path', str(tmp_path))
+    (tmp_path / 'data').mkdir()
     mock_crawler_instance = MagicMock()
     mock_crawler_instance.fetch_articles.return_value = [
         {'title': 'Test Article', 'url': 'http://fake.url', 'published_date': '2024-01-01', 'content': ''}
     ]
-    mock_crawler_instance.fetch_article_content.return_value = "Full article content."
+    mock_crawler_instance.fetch_article_contents.return_value = ["Full article content."]
     MockCrawler.return_value = mock_crawler_instance
 
     thelec_main(target_section="반도체", base_ymd="20240101")
 
     MockCrawler.assert_called_once_with(
         "https://www.thelec.kr/news/articleList.html?sc_section_code=S1N2&view_type=sm",
-        target_section="반도체"
+        target_section="반도체",
+        seen_index=ANY
     )
     mock_crawler_instance.set_target_date_range.assert_called_once()
-    mock_crawler_instance.fetch_articles.assert_called_once_with(pages=2)
-    mock_crawler_instance.fetch_article_content.assert_called_once_with('http://fake.url')
+    mock_crawler_instance.fetch_articles.assert_called_once_with()
+    mock_crawler_instance.fetch_article_contents.assert_called_once_with(['http://fake.url'])
 
-    expected_filepath = os.path.join(pjt_home_path, 'data/thelec_semiconductor_articles.json')
-    mock_file_open.assert_called_once_with(expected_filepath, 'w', encoding='utf-8')
-    
+    output_path = tmp_path / 'data' / 'thelec_semiconductor_articles.jsonl'
     expected_data = [{'title': 'Test Article', 'url': 'http://fake.url', 'published_date': '2024-01-01', 'content': 'Full article content.'}]
-    mock_json_dump.assert_called_once_with(expected_data, mock_file_open(), ensure_ascii=False, indent=2)
+    assert [json.loads(line) for line in output_path.read_text(encoding='utf-8').splitlines()] == expected_data
 
 @patch('src.services.news_crawler_thelec.ThelecNewsCrawler')
 @patch('sys.exit')
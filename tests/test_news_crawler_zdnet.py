@@ -5,9 +5,10 @@ import json
 import pytest
 import datetime as dt
 
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open, ANY
 
 import pytz
+import requests
 from bs4 import BeautifulSoup
 
 # Add project root to the Python path
@@ -17,6 +18,8 @@ pjt_home_path = os.path.abspath(pjt_home_path)
 site.addsitedir(pjt_home_path)
 
 from src.services.news_crawler_zdnet import NewsCrawler_ZDNet, main as zdnet_main
+from src.services.header_profiles import HeaderProfilePool
+from src.services.fetch_engine import FetchEngine, FetchFailure, ARTICLE_CACHE_TTL
 
 # Constants
 BASE_URL = "https://zdnet.co.kr/news/?lstcode=0050"
@@ -26,10 +29,9 @@ KST = pytz.timezone('Asia/Seoul')
 
 @pytest.fixture
 def mock_user_agent(mocker):
-    """Fixture to mock UserAgent."""
-    mock = mocker.patch('src.services.news_crawler_zdnet.UserAgent')
-    mock.return_value.random = 'test-user-agent'
-    return mock
+    """Fixture to use a fixed header profile pool."""
+    pool = HeaderProfilePool(user_agents=['test-user-agent'])
+    return mocker.patch('src.services.header_profiles.get_header_pool', return_value=pool)
 
 @pytest.fixture
 def crawler(mock_user_agent):
@@ -72,8 +74,8 @@ def test_parse_date_from_link(crawler):
     invalid_link = "/news/article.html?id=123"
     assert crawler._parse_date_from_link(invalid_link) == dt.datetime.min
 
-@patch('src.services.news_crawler_zdnet.requests.get')
-def test_fetch_articles(mock_get, crawler):
+@patch.object(FetchEngine, 'fetch_text')
+def test_fetch_articles(mock_fetch_text, crawler):
     """Test fetching and filtering articles from a list page."""
     # Mock HTML for the article list page
     mock_html = """
@@ -96,10 +98,7 @@ def test_fetch_articles(mock_get, crawler):
         </div>
     </body></html>
     """
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_fetch_text.return_value = mock_html
 
     # Set a date range that includes the test articles
     start_date = KST.localize(dt.datetime(2025, 6, 27))
@@ -108,7 +107,7 @@ def test_fetch_articles(mock_get, crawler):
 
     articles = crawler.fetch_articles()
 
-    mock_get.assert_called_once_with(BASE_URL, headers=crawler.headers, timeout=10)
+    mock_fetch_text.assert_called_once_with(BASE_URL, headers=crawler.headers, timeout=10)
     assert len(articles) == 3
     assert articles[0]['title'] == "Article In Range"
     assert articles[0]['published_date'] == "2025-06-28"
@@ -116,8 +115,8 @@ def test_fetch_articles(mock_get, crawler):
     assert articles[2]['title'] == "Top News In Range"
     assert all('https://zdnet.co.kr' in a['url'] for a in articles)
 
-@patch('src.services.news_crawler_zdnet.requests.get')
-def test_fetch_article_content(mock_get, crawler):
+@patch.object(FetchEngine, 'afetch_text', new_callable=AsyncMock)
+def test_fetch_article_content(mock_afetch_text, crawler):
     """Test fetching and cleaning individual article content."""
     mock_html = """
     <html><body>
@@ -131,63 +130,69 @@ def test_fetch_article_content(mock_get, crawler):
         </div>
     </body></html>
     """
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_afetch_text.return_value = mock_html
 
     content = crawler.fetch_article_content("http://fake.url/article")
 
-    mock_get.assert_called_once_with("http://fake.url/article", headers=crawler.headers, timeout=10)
+    mock_afetch_text.assert_called_once_with("http://fake.url/article", headers=crawler.headers, timeout=10,
+                                             encoding=None, cache_ttl=ARTICLE_CACHE_TTL)
     assert "Main Title" in content
     assert "This is the first paragraph." in content
     assert "This is the second paragraph." in content
     assert "removed" not in content
     assert "관련기사" not in content
 
-@patch('src.services.news_crawler_zdnet.requests.get')
-def test_fetch_article_content_not_found(mock_get, crawler):
+@patch.object(FetchEngine, 'afetch_text', new_callable=AsyncMock)
+def test_fetch_article_content_not_found(mock_afetch_text, crawler):
     """Test handling for when article content container is not found."""
     mock_html = "<html><body><p>No article body here.</p></body></html>"
-    mock_response = MagicMock()
-    mock_response.text = mock_html
-    mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_afetch_text.return_value = mock_html
 
     content = crawler.fetch_article_content("http://fake.url/article")
-    assert content == "기사 내용을 찾을 수 없습니다."
+    assert isinstance(content, FetchFailure)
+    assert content.reason == "content_not_found"
+
+@patch.object(FetchEngine, 'afetch_text', new_callable=AsyncMock)
+def test_fetch_article_contents_timeout(mock_afetch_text, crawler):
+    """Test that a timed-out article does not abort the other articles in the batch."""
+    mock_html = '<html><body><div id="articleBody"><p>Body text.</p></div></body></html>'
+    mock_afetch_text.side_effect = [requests.exceptions.Timeout(), mock_html]
+
+    contents = crawler.fetch_article_contents(["http://fake.url/1", "http://fake.url/2"])
+
+    assert isinstance(contents[0], FetchFailure)
+    assert contents[0].reason == "timeout"
+    assert contents[1] == "Body text."
 
 # --- Test Cases for main Function ---
 
 @patch('src.services.news_crawler_zdnet.NewsCrawler_ZDNet')
-@patch('src.services.news_crawler_zdnet.open', new_callable=mock_open)
-@patch('src.services.news_crawler_zdnet.json.dump')
-def test_main_success(mock_json_dump, mock_file_open, MockCrawler, mock_user_agent):
+def test_main_success(MockCrawler, mock_user_agent, tmp_path, monkeypatch):
     """Test the main function's success path."""
+    monkeypatch.setattr('src.services.news_sites.pjt_home_path', str(tmp_path))
+    (tmp_path / 'data').mkdir()
     # Mock crawler instance and its methods
     mock_crawler_instance = MagicMock()
     mock_crawler_instance.fetch_articles.return_value = [
         {'title': 'Test Article', 'url': 'http://fake.url', 'published_date': '2024-01-01', 'content': ''}
     ]
-    mock_crawler_instance.fetch_article_content.return_value = "Full article content."
+    mock_crawler_instance.fetch_article_contents.return_value = ["Full article content."]
     MockCrawler.return_value = mock_crawler_instance
 
     # Run the main function
     zdnet_main(target_section="반도체", base_ymd="20240101")
 
     # Assertions
-    MockCrawler.assert_called_once_with("https://zdnet.co.kr/news/?lstcode=0050")
+    MockCrawler.assert_called_once_with("https://zdnet.co.kr/news/?lstcode=0050", seen_index=ANY)
     mock_crawler_instance.set_target_date_range.assert_called_once()
     mock_crawler_instance.fetch_articles.assert_called_once()
-    mock_crawler_instance.fetch_article_content.assert_called_once_with('http://fake.url')
+    mock_crawler_instance.fetch_article_contents.assert_called_once_with(['http://fake.url'])
 
-    # Check file writing
-    expected_filepath = os.path.join(pjt_home_path, 'data/zdnet_semiconductor_articles.json')
-    mock_file_open.assert_called_once_with(expected_filepath, 'w', encoding='utf-8')
-    
-    # Check that json.dump was called with the updated content
+    # Check the saved JSON Lines file (partial file renamed on completion)
+    output_path = tmp_path / 'data' / 'zdnet_semiconductor_articles.jsonl'
     expected_data = [{'title': 'Test Article', 'url': 'http://fake.url', 'published_date': '2024-01-01', 'content': 'Full article content.'}]
-    mock_json_dump.assert_called_once_with(expected_data, mock_file_open(), ensure_ascii=False, indent=2)
+    assert [json.loads(line) for line in output_path.read_text(encoding='utf-8').splitlines()] == expected_data
+    assert os.listdir(tmp_path / 'data') == ['zdnet_semiconductor_articles.jsonl']
 
 @patch('src.services.news_crawler_zdnet.NewsCrawler_ZDNet')
 @patch('sys.exit')
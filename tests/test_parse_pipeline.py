@@ -0,0 +1,102 @@
+import os
+import sys
+import site
+import time
+import pytest
+
+from unittest.mock import patch, AsyncMock
+
+import requests
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import news_crawler_etnews
+from src.services.fetch_engine import FetchEngine
+from src.services.parse_pipeline import ParsePipeline
+
+ARTICLE_HTML = '<html><body><div class="article_body"><p>{}</p></div></body></html>'
+
+# --- Fixtures ---
+
+@pytest.fixture
+def engine():
+    """Fixture to create a FetchEngine without cache."""
+    return FetchEngine(max_concurrency=4, per_host_concurrency=4)
+
+def upper_parser(html, url):
+    return html.upper()
+
+# --- Test Cases ---
+
+def test_results_keep_order_and_errors(engine):
+    """Test that results follow the input order and failures are returned as exceptions."""
+    pipeline = ParsePipeline(engine, max_workers=0)
+    responses = {"http://a.com/1": "one", "http://a.com/2": requests.exceptions.Timeout(), "http://a.com/3": "three"}
+
+    async def fake_afetch_text(url, **kwargs):
+        if isinstance(responses[url], Exception):
+            raise responses[url]
+        return responses[url]
+
+    with patch.object(engine, 'afetch_text', side_effect=fake_afetch_text):
+        results = pipeline.fetch_and_parse_many(list(responses), upper_parser)
+
+    assert results[0] == "ONE"
+    assert isinstance(results[1], requests.exceptions.Timeout)
+    assert results[2] == "THREE"
+    stats = pipeline.stats()
+    assert stats['download']['count'] == 3
+    assert stats['download']['errors'] == 1
+    assert stats['parse']['count'] == 2
+
+def test_parse_error_is_returned(engine):
+    """Test that a parser exception is returned for that URL only."""
+    pipeline = ParsePipeline(engine, max_workers=0)
+
+    def failing_parser(html, url):
+        if html == "bad":
+            raise ValueError("broken page")
+        return html
+
+    with patch.object(engine, 'afetch_text', new_callable=AsyncMock, side_effect=["ok", "bad"]):
+        results = pipeline.fetch_and_parse_many(["http://a.com/1", "http://a.com/2"], failing_parser)
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+    assert pipeline.stats()['parse']['errors'] == 1
+
+def test_queue_applies_backpressure(engine):
+    """Test that downloads wait while the bounded queue is full."""
+    pipeline = ParsePipeline(engine, max_workers=0, queue_size=1)
+
+    def slow_parser(html, url):
+        time.sleep(0.02)
+        return html
+
+    urls = [f"http://a.com/{i}" for i in range(6)]
+    with patch.object(engine, 'afetch_text', new_callable=AsyncMock, side_effect=urls):
+        results = pipeline.fetch_and_parse_many(urls, slow_parser)
+
+    assert results == urls
+    stats = pipeline.stats()
+    assert stats['queue']['high_water'] <= 1
+    assert stats['queue']['full_wait_seconds'] > 0
+
+def test_process_pool_parsing(engine):
+    """Test parsing crawler pages in the process pool."""
+    pipeline = ParsePipeline(engine, max_workers=2)
+    urls = [f"http://etnews.com/{i}" for i in range(4)]
+    pages = [ARTICLE_HTML.format(f"Body {i}") for i in range(4)]
+
+    try:
+        with patch.object(engine, 'afetch_text', new_callable=AsyncMock, side_effect=pages):
+            results = pipeline.fetch_and_parse_many(urls, news_crawler_etnews.parse_article_content)
+    finally:
+        pipeline.close()
+
+    assert results == [f"Body {i}" for i in range(4)]
+    assert pipeline.stats()['parse']['pages_per_sec'] > 0
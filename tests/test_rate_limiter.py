@@ -0,0 +1,112 @@
+import os
+import sys
+import site
+import time
+import asyncio
+import pytest
+
+from unittest.mock import patch, MagicMock
+
+import requests
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import rate_limiter
+from src.services.rate_limiter import HostRateLimiter, parse_retry_after
+from src.services.fetch_engine import FetchEngine
+
+HOST = "etnews.com"
+
+# --- Test Cases for HostRateLimiter ---
+
+def test_success_increases_concurrency_and_rate():
+    """Test the additive increase on successful responses, capped at max_concurrency."""
+    async def scenario():
+        limiter = HostRateLimiter(HOST, max_concurrency=3, initial_concurrency=1, rate=10.0, burst=10)
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(200, 0.1)
+        return limiter
+
+    limiter = asyncio.run(scenario())
+    assert limiter.state()['concurrency'] == 3
+    assert limiter.rate > 10.0
+
+def test_throttle_halves_and_backs_off():
+    """Test the multiplicative decrease and Retry-After backoff on 429."""
+    async def scenario():
+        limiter = HostRateLimiter(HOST, max_concurrency=4, initial_concurrency=4, rate=4.0)
+        await limiter.acquire()
+        await limiter.release(429, 0.1, retry_after="30")
+        return limiter
+
+    state = asyncio.run(scenario()).state()
+    assert state['concurrency'] == 2
+    assert state['rate_per_sec'] == 2.0
+    assert state['throttled'] == 1
+    assert 29 < state['backoff_remaining_sec'] <= 30
+
+@pytest.mark.parametrize('status_code, elapsed', [(500, 0.1), (None, 0.1), (200, rate_limiter.SLOW_RESPONSE_SECONDS + 1)])
+def test_congestion_signals_decrease(status_code, elapsed):
+    """Test that 5xx, timeouts and slow responses reduce concurrency without a backoff pause."""
+    async def scenario():
+        limiter = HostRateLimiter(HOST, max_concurrency=4, initial_concurrency=4)
+        await limiter.acquire()
+        await limiter.release(status_code, elapsed)
+        return limiter
+
+    state = asyncio.run(scenario()).state()
+    assert state['concurrency'] == 2
+    assert state['backoff_remaining_sec'] == 0
+
+def test_not_found_is_neutral():
+    """Test that a 404 response does not change the limits."""
+    async def scenario():
+        limiter = HostRateLimiter(HOST, max_concurrency=4, initial_concurrency=2, rate=3.0)
+        await limiter.acquire()
+        await limiter.release(404, 0.1)
+        return limiter
+
+    limiter = asyncio.run(scenario())
+    assert limiter.concurrency == 2
+    assert limiter.rate == 3.0
+
+def test_token_bucket_limits_rate():
+    """Test that requests beyond the burst wait for tokens."""
+    async def scenario():
+        limiter = HostRateLimiter(HOST, max_concurrency=10, initial_concurrency=10, rate=20.0, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        return time.monotonic() - started
+
+    # 2 requests from the burst, 2 more at 20/s => about 0.1 seconds
+    assert asyncio.run(scenario()) >= 0.09
+
+def test_parse_retry_after():
+    """Test Retry-After parsing in seconds and HTTP-date forms."""
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+# --- Test Cases for FetchEngine integration ---
+
+def test_engine_reports_throttled_host():
+    """Test that a 429 from a host is reflected in the engine's rate limit state."""
+    engine = FetchEngine(max_concurrency=2, per_host_concurrency=2, max_retries=0)
+    response = MagicMock(status_code=429, headers={'Retry-After': '1'})
+    error = requests.exceptions.HTTPError(response=response)
+
+    with patch.object(engine, '_request', side_effect=error):
+        with pytest.raises(requests.exceptions.HTTPError):
+            engine.fetch_text(f"https://{HOST}/news/section.html?id1=06")
+
+    state = engine.rate_limit_state()[HOST]
+    assert state['throttled'] == 1
+    assert state['concurrency'] == 1
+    assert state['backoff_remaining_sec'] > 0
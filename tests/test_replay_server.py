@@ -0,0 +1,91 @@
+import os
+import sys
+import site
+import pytest
+
+import requests
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services import fetch_engine
+from src.services import news_sites
+from src.services.replay_server import (ReplayCorpus, ReplayServer, ReplaySessionPool, installed_engine,
+                                        run_section, to_replay_url, from_replay_path)
+
+LIST_URL = 'https://zdnet.co.kr/news/?lstcode=0050'
+ARTICLE_URL = 'https://zdnet.co.kr/view/?no=20250628100000'
+
+LIST_HTML = ('<html><body><div class="newsPost"><a href="/view/?no=20250628100000"></a>'
+             '<div class="assetText"><h3>반도체 기사</h3></div>'
+             '<p class="byline"><span>2025.06.28 AM 10:00</span></p></div></body></html>')
+ARTICLE_HTML = '<html><body><div id="articleBody"><p>반도체 기사 본문입니다.</p></div></body></html>'
+
+# --- Fixtures ---
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Fixture to create a small recorded corpus of one zdnet list page and one article page."""
+    corpus = ReplayCorpus(str(tmp_path / 'corpus'))
+    corpus.add(LIST_URL, LIST_HTML.encode('utf-8'))
+    corpus.add(ARTICLE_URL, ARTICLE_HTML.encode('utf-8'))
+    corpus.save(base_ymd='20250628')
+    return corpus
+
+@pytest.fixture
+def server(corpus):
+    with ReplayServer(corpus) as server:
+        yield server
+
+# --- Test Cases ---
+
+def test_replay_url_round_trip():
+    """Test that the original URL is restored from the stand-in server path."""
+    replay_url = to_replay_url('http://127.0.0.1:8765', LIST_URL)
+
+    assert replay_url == 'http://127.0.0.1:8765/https/zdnet.co.kr/news/?lstcode=0050'
+    assert from_replay_path(replay_url[len('http://127.0.0.1:8765'):]) == LIST_URL
+    assert from_replay_path('/favicon.ico') is None
+
+def test_corpus_reload(corpus):
+    """Test that a saved corpus is loaded back with its pages and meta data."""
+    reloaded = ReplayCorpus(corpus.corpus_dir)
+
+    assert reloaded.meta == {'base_ymd': '20250628'}
+    assert sorted(reloaded.urls()) == sorted([LIST_URL, ARTICLE_URL])
+    assert reloaded.get(ARTICLE_URL) == (200, 'text/html; charset=utf-8', ARTICLE_HTML.encode('utf-8'))
+    assert reloaded.get('https://zdnet.co.kr/unknown') is None
+
+def test_engine_fetches_through_replay_server(server):
+    """Test that the fetch engine requests original URLs but the stand-in server answers them."""
+    engine = fetch_engine.FetchEngine(session_pool=ReplaySessionPool(server.url), retry_base_delay=0.01)
+
+    assert engine.fetch_text(LIST_URL) == LIST_HTML
+    with pytest.raises(requests.HTTPError):
+        engine.fetch_text('https://zdnet.co.kr/unknown')
+    assert server.stats() == {'requests': 2, 'served': 1, 'not_found': 1, 'injected_errors': 0}
+
+def test_error_injection(corpus):
+    """Test that the stand-in server injects error responses at the configured rate."""
+    with ReplayServer(corpus, error_rate=1.0, error_status=500) as server:
+        response = requests.get(to_replay_url(server.url, LIST_URL))
+
+    assert response.status_code == 500
+    assert server.stats()['injected_errors'] == 1
+
+def test_run_section_offline(server):
+    """Test that a crawler section runs end to end against the stand-in server."""
+    engine = fetch_engine.FetchEngine(session_pool=ReplaySessionPool(server.url), retry_base_delay=0.01)
+    saved_engine = fetch_engine._engine
+
+    with installed_engine(engine, parse_workers=0):
+        result = run_section(news_sites.ZDNET, news_sites.ZDNET.section('반도체'), '20250628')
+
+    assert result['articles'] == 1
+    assert result['contents'] == 1
+    assert result['article_urls'] == [ARTICLE_URL]
+    # The shared engine is restored after the block.
+    assert fetch_engine._engine is saved_engine
@@ -0,0 +1,146 @@
+import os
+import sys
+import site
+import json
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.tweet_prompts import (structured_post_prompt, parse_structured_post, is_short_post, split_batches,
+                                        batch_translation_prompt, parse_batch_translations, translate_batch,
+                                        API_ERROR_TEXT)
+
+ORIGINAL_TEXT = 'NVIDIA announced a new AI chip today. ' * 10
+
+# --- Test Cases ---
+
+def test_structured_prompt_contains_text_and_keys():
+    """Test that the single structured prompt carries the original text once and names every field."""
+    prompt = structured_post_prompt(ORIGINAL_TEXT)
+
+    assert prompt.count(ORIGINAL_TEXT) == 1
+    for key in ('"translated_text"', '"title"', '"summary"'):
+        assert key in prompt
+
+def test_parse_structured_post():
+    """Test that a valid response is converted to post fields, with the summary as a '* ' bullet list."""
+    response_text = json.dumps({
+        'translated_text': ' 엔비디아가 오늘 새로운 AI 칩을 발표했습니다. ',
+        'title': '엔비디아 신규 AI 칩 발표',
+        'summary': ['엔비디아 신규 칩 발표', '* AI 성능 향상', '출시 일정 공개'],
+    }, ensure_ascii=False)
+
+    assert parse_structured_post(response_text) == {
+        'translated_text': '엔비디아가 오늘 새로운 AI 칩을 발표했습니다.',
+        'title': '엔비디아 신규 AI 칩 발표',
+        'summary': '* 엔비디아 신규 칩 발표\n* AI 성능 향상\n* 출시 일정 공개',
+    }
+
+def test_parse_structured_post_in_code_fence():
+    """Test that a response wrapped in a markdown code fence is accepted."""
+    response_text = '```json\n{"translated_text": "번역", "title": "제목", "summary": "* 요약"}\n```'
+
+    assert parse_structured_post(response_text)['summary'] == '* 요약'
+
+@pytest.mark.parametrize('response_text', [
+    'Error during API call.',
+    '["번역", "제목", "요약"]',
+    '{"translated_text": "번역", "title": "제목"}',
+    '{"translated_text": "번역", "title": "  ", "summary": ["요약"]}',
+    '{"translated_text": "번역", "title": "제목", "summary": ["요약", 3]}',
+    None,
+])
+def test_parse_structured_post_rejects_invalid(response_text):
+    """Test that invalid responses raise ValueError so the caller falls back to per-field requests."""
+    with pytest.raises(ValueError):
+        parse_structured_post(response_text)
+
+def test_is_short_post():
+    """Test the length band of posts that are translated only."""
+    assert not is_short_post('too short')
+    assert is_short_post('x' * 15)
+    assert is_short_post('x' * 249)
+    assert not is_short_post('x' * 250)
+    assert not is_short_post(None)
+
+def test_split_batches_keeps_ids_and_order():
+    """Test that posts are packed into batches of the given size in input order."""
+    texts = {str(i): f'text {i}' for i in range(5)}
+
+    assert split_batches(texts, 2) == [{'0': 'text 0', '1': 'text 1'}, {'2': 'text 2', '3': 'text 3'}, {'4': 'text 4'}]
+
+def test_parse_batch_translations_partial():
+    """Test that only requested ids with non-empty translations are returned."""
+    response_text = json.dumps({'0': '번역 0', '1': ' ', '9': '요청하지 않은 id'}, ensure_ascii=False)
+
+    assert parse_batch_translations(response_text, ['0', '1', '2']) == {'0': '번역 0'}
+    assert parse_batch_translations('Error during API call.', ['0']) is None
+    assert parse_batch_translations('["번역 0"]', ['0']) is None
+
+class FakeTranslator:
+    """Stand-in for call_gemini_api that translates batch prompts but drops the given ids."""
+
+    def __init__(self, dropped_ids=()):
+        self.dropped_ids = set(dropped_ids)
+        self.prompts = []
+
+    def __call__(self, prompt_text, generation_config=None):
+        self.prompts.append(prompt_text)
+        if generation_config is None:
+            # single post prompt
+            return f"단건 번역: {prompt_text.split('---')[1].strip()}"
+        texts = json.loads(prompt_text[prompt_text.index('{'):])
+        return json.dumps({post_id: f'번역: {text}' for post_id, text in texts.items()
+                           if post_id not in self.dropped_ids}, ensure_ascii=False)
+
+def test_translate_batch_one_request():
+    """Test that a whole batch of short posts is translated with a single request."""
+    texts = {str(i): f'short post number {i}' for i in range(4)}
+    call_api = FakeTranslator()
+
+    translations = translate_batch(texts, call_api)
+
+    assert translations == {post_id: f'번역: {text}' for post_id, text in texts.items()}
+    assert call_api.prompts == [batch_translation_prompt(texts)]
+
+def test_translate_batch_resplits_missing_ids():
+    """Test that ids missing from a batch response are re-requested in smaller batches."""
+    texts = {str(i): f'short post number {i}' for i in range(4)}
+    call_api = FakeTranslator(dropped_ids={'1', '3'})
+
+    translations = translate_batch(texts, call_api)
+
+    assert list(translations) == ['0', '1', '2', '3']
+    assert translations['0'] == '번역: short post number 0'
+    # '1' and '3' keep failing in batches, so each ends with a single post request.
+    assert translations['1'] == '단건 번역: short post number 1'
+    assert translations['3'] == '단건 번역: short post number 3'
+    assert len(call_api.prompts) == 3
+
+def test_translate_batch_does_not_resplit_failed_requests():
+    """Test that a failed batch request is not re-split into more requests during an outage."""
+    texts = {str(i): f'short post number {i}' for i in range(8)}
+    prompts = []
+
+    def failing_call_api(prompt_text, generation_config=None):
+        prompts.append(prompt_text)
+        return API_ERROR_TEXT
+
+    assert translate_batch(texts, failing_call_api) == {post_id: API_ERROR_TEXT for post_id in texts}
+    assert len(prompts) == 1
+
+def test_translate_batch_unparsable_response_falls_back_once_per_post():
+    """Test that an unparsable batch response costs one single-post request per post, without recursion."""
+    texts = {str(i): f'short post number {i}' for i in range(4)}
+    prompts = []
+
+    def prose_call_api(prompt_text, generation_config=None):
+        prompts.append(prompt_text)
+        return '번역 결과입니다.'
+
+    assert translate_batch(texts, prose_call_api) == {post_id: '번역 결과입니다.' for post_id in texts}
+    assert len(prompts) == 1 + len(texts)
@@ -0,0 +1,48 @@
+import os
+import sys
+import site
+import pytest
+
+# Add project root to the Python path
+src_path = os.path.dirname(__file__)
+pjt_home_path = os.path.join(src_path, os.pardir)
+pjt_home_path = os.path.abspath(pjt_home_path)
+site.addsitedir(pjt_home_path)
+
+from src.services.url_registry import ArticleRegistry, canonical_url
+
+# --- Test Cases for canonical_url ---
+
+@pytest.mark.parametrize('url, expected', [
+    ("https://ZDNet.co.kr:443/view/?no=1#comments", "https://zdnet.co.kr/view/?no=1"),
+    ("https://www.thelec.kr/news/articleView.html?idxno=5&utm_source=feed", "https://www.thelec.kr/news/articleView.html?idxno=5"),
+    ("https://etnews.com/news?b=2&a=1", "https://etnews.com/news?a=1&b=2"),
+    ("http://localhost:8080", "http://localhost:8080/"),
+])
+def test_canonical_url(url, expected):
+    """Test URL normalization used for cross-section dedup."""
+    assert canonical_url(url) == expected
+
+# --- Test Cases for ArticleRegistry ---
+
+def test_register_keeps_first_section_and_tags_all():
+    """Test that the first section owns a shared article and every section is tagged."""
+    registry = ArticleRegistry()
+    first = registry.register('zdnet_semiconductor', [{'url': "https://zdnet.co.kr/view/?no=1"},
+                                                      {'url': "https://zdnet.co.kr/view/?no=2"}])
+    second = registry.register('zdnet_computing', [{'url': "https://zdnet.co.kr/view/?no=1#top"},
+                                                   {'url': "https://zdnet.co.kr/view/?no=3"}])
+
+    assert [article['url'] for article in first] == ["https://zdnet.co.kr/view/?no=1", "https://zdnet.co.kr/view/?no=2"]
+    assert [article['url'] for article in second] == ["https://zdnet.co.kr/view/?no=3"]
+    assert first[0]['sections'] == ['zdnet_semiconductor', 'zdnet_computing']
+    assert registry.sections("https://zdnet.co.kr/view/?no=3") == ['zdnet_computing']
+    assert registry.stats() == {'articles': 3, 'shared_across_sections': 1}
+
+def test_register_dedups_within_section():
+    """Test that a URL repeated in one listing is kept once."""
+    registry = ArticleRegistry()
+    owned = registry.register('etnews_it', [{'url': "https://etnews.com/1"}, {'url': "https://etnews.com/1"}])
+
+    assert len(owned) == 1
+    assert owned[0]['sections'] == ['etnews_it']